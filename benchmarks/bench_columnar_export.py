@@ -0,0 +1,81 @@
+"""Compare one-JSON-file-per-resume output with columnar Parquet/Arrow export.
+
+Usage: python benchmarks/bench_columnar_export.py [record_count]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+
+sys.path.insert(0, '.')
+
+from resume_parser.models.resume_data import ResumeData
+from resume_parser.services.columnar_sink import ColumnarResultWriter, read_results
+
+
+def make_records(count: int):
+    rng = random.Random(42)
+    vocabulary = [f"skill-{i}" for i in range(3000)]
+    return [
+        ResumeData(f"Candidate {i}", f"candidate{i}@example.com",
+                   sorted(set(rng.choices(vocabulary, k=rng.randint(5, 25)))))
+        for i in range(count)
+    ]
+
+
+def directory_size(path: str) -> int:
+    return sum(entry.stat().st_size for entry in os.scandir(path))
+
+
+def bench_json(records, directory: str) -> None:
+    started = time.perf_counter()
+    for i, record in enumerate(records):
+        with open(os.path.join(directory, f"{i}.json"), "w", encoding="utf-8") as f:
+            f.write(record.to_json())
+    write_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    loaded = 0
+    for entry in os.scandir(directory):
+        with open(entry.path, encoding="utf-8") as f:
+            ResumeData(**json.load(f))
+        loaded += 1
+    read_time = time.perf_counter() - started
+    report("JSON file per resume", write_time, read_time, directory_size(directory), loaded)
+
+
+def bench_columnar(records, path: str, format: str) -> None:
+    started = time.perf_counter()
+    with ColumnarResultWriter(path, format=format) as writer:
+        writer.write_many(records)
+    write_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    loaded = sum(1 for _ in read_results(path))
+    read_time = time.perf_counter() - started
+    report(f"{format} (streamed to ResumeData)", write_time, read_time, os.path.getsize(path), loaded)
+
+
+def report(label: str, write_time: float, read_time: float, size: int, count: int) -> None:
+    print(f"{label:<34} write {write_time:7.2f}s  read {read_time:7.2f}s  "
+          f"size {size / 1024 / 1024:8.1f} MiB  rows {count}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    records = make_records(count)
+    print(f"{count} records")
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_dir = os.path.join(directory, "json")
+        os.mkdir(json_dir)
+        bench_json(records, json_dir)
+        bench_columnar(records, os.path.join(directory, "results.parquet"), "parquet")
+        bench_columnar(records, os.path.join(directory, "results.arrow"), "arrow")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Per-file cost of a fresh process per resume vs the pre-forked daemon.
+
+Usage: python benchmarks/bench_daemon.py [files]
+
+Runs offline against the fake Gemini backend with no simulated latency, so
+the numbers are startup and transport overhead plus local parsing.
+"""
+
+import os
+import sys
+import time
+import tempfile
+import subprocess
+
+sys.path.insert(0, '.')
+
+from docx import Document
+
+from resume_parser.services.prefork_daemon import DaemonClient
+
+# What a scheduler pays when it runs one interpreter per resume
+COLD = """
+import sys
+sys.path.insert(0, '.')
+from dotenv import load_dotenv
+load_dotenv()
+from resume_parser import (ResumeParserFramework, PDFParser, WordParser, NameExtractor, EmailExtractor,
+                           SkillsExtractor, SkillCanonicalizer, TextCompactor)
+framework = ResumeParserFramework(
+    {".pdf": PDFParser(), ".docx": WordParser(), ".doc": WordParser()},
+    {"name": NameExtractor(), "email": EmailExtractor(),
+     "skills": SkillsExtractor(canonicalizer=SkillCanonicalizer())},
+    normalizer=TextCompactor())
+print(framework.parse_resume(sys.argv[1]).to_json())
+"""
+
+
+def write_resume(path):
+    document = Document()
+    for line in ["Jane Smith", "Software Engineer", "jane.smith@example.com", "SKILLS",
+                 "Python, SQL, Docker, Kubernetes, AWS"]:
+        document.add_paragraph(line)
+    document.save(path)
+
+
+def per_file_ms(run, files):
+    started = time.perf_counter()
+    for _ in range(files):
+        run()
+    return (time.perf_counter() - started) / files * 1000
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    env = dict(os.environ, GEMINI_BACKEND="fake", FAKE_GEMINI_TIME_SCALE="0", LOG_LEVEL="WARNING")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        resume = os.path.join(tmp, "resume.docx")
+        socket_path = os.path.join(tmp, "daemon.sock")
+        write_resume(resume)
+
+        def cold():
+            subprocess.run([sys.executable, "-c", COLD, resume], env=env, check=True, capture_output=True)
+
+        def thin_client():
+            subprocess.run([sys.executable, "resume_client.py", "--socket", socket_path, resume],
+                           env=env, check=True, capture_output=True)
+
+        print(f"fresh process per file:  {per_file_ms(cold, files):8.2f} ms")
+
+        daemon = subprocess.Popen([sys.executable, "run_daemon.py"], env=dict(env, DAEMON_SOCKET=socket_path),
+                                  stdout=subprocess.DEVNULL)
+        try:
+            started = time.perf_counter()
+            while not os.path.exists(socket_path):
+                time.sleep(0.01)
+            print(f"daemon ready after:      {(time.perf_counter() - started) * 1000:8.2f} ms (once)")
+            with DaemonClient(socket_path) as client:
+                client.parse(resume)
+                print(f"resume_client.py:        {per_file_ms(thin_client, files):8.2f} ms")
+                print(f"persistent connection:   {per_file_ms(lambda: client.parse(resume), files * 10):8.2f} ms")
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Measure caller-thread logging cost, changing one thing at a time.
+
+Each run differs from the baseline (synchronous FileHandler, %-style
+arguments, every record kept) in exactly one respect: eager f-strings,
+the async queue, or the async queue with 1/100 DEBUG sampling.
+
+Usage: python benchmarks/bench_logging.py [resume_count] [pages_per_resume]
+"""
+
+import os
+import sys
+import time
+import logging
+import tempfile
+
+sys.path.insert(0, '.')
+
+from resume_parser.services.async_logging import DEFAULT_FORMAT, configure_async_logging, stop_async_logging
+
+
+def simulate(log, resumes, pages, eager):
+    # Per resume: one debug record per page, a character count, an info record
+    page_text = "Experienced Python developer with AWS and Docker. " * 40
+    for r in range(resumes):
+        text_content = []
+        for p in range(pages):
+            text_content.append(page_text)
+            if eager:
+                log.debug(f"Extracted {len(page_text)} characters from page {p + 1}")
+            else:
+                log.debug("Extracted %d characters from page %d", len(page_text), p + 1)
+        if eager:
+            log.info(f"Extracted {len(chr(10).join(text_content))} characters from resume_{r}.pdf")
+        else:
+            text = "\n".join(text_content)
+            log.info("Extracted %d characters from resume_%d.pdf", len(text), r)
+
+
+def reset_root():
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+
+def run_sync(log, directory, name, resumes, pages, eager):
+    reset_root()
+    handler = logging.FileHandler(os.path.join(directory, name))
+    handler.setFormatter(logging.Formatter(DEFAULT_FORMAT))
+    logging.getLogger().addHandler(handler)
+    logging.getLogger().setLevel(logging.DEBUG)
+    started = time.perf_counter()
+    simulate(log, resumes, pages, eager=eager)
+    elapsed = time.perf_counter() - started
+    reset_root()
+    return elapsed, elapsed
+
+
+def run_async(log, directory, name, resumes, pages, sample_every):
+    reset_root()
+    configure_async_logging([logging.FileHandler(os.path.join(directory, name))],
+                            level="DEBUG", debug_sample_every=sample_every)
+    started = time.perf_counter()
+    simulate(log, resumes, pages, eager=False)
+    elapsed = time.perf_counter() - started
+    stop_async_logging()
+    drained = time.perf_counter() - started
+    reset_root()
+    return elapsed, drained
+
+
+def main():
+    resumes = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    pages = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    log = logging.getLogger("resume_parser.bench")
+    runs = [
+        ("baseline: sync, %-style args", "baseline.log",
+         lambda d, n: run_sync(log, d, n, resumes, pages, eager=False)),
+        ("f-strings: sync, eager f-strings", "fstrings.log",
+         lambda d, n: run_sync(log, d, n, resumes, pages, eager=True)),
+        ("queue: async, %-style args", "queue.log",
+         lambda d, n: run_async(log, d, n, resumes, pages, sample_every=None)),
+        ("sampling: async, 1/100 debug", "sampled.log",
+         lambda d, n: run_async(log, d, n, resumes, pages, sample_every=100)),
+    ]
+
+    records = resumes * (pages + 1)
+    print(f"{records} log calls ({resumes} resumes x {pages} pages)")
+    with tempfile.TemporaryDirectory() as directory:
+        baseline = None
+        for label, name, run in runs:
+            elapsed, drained = run(directory, name)
+            baseline = baseline or elapsed
+            size = os.path.getsize(os.path.join(directory, name))
+            print(f"{label:34} {elapsed:.3f}s on caller ({elapsed / records * 1e6:.1f}us/call, "
+                  f"{elapsed / baseline:.2f}x baseline), {drained:.3f}s until written, {size / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
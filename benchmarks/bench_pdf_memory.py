@@ -0,0 +1,76 @@
+"""Peak memory of parsing a long PDF with and without per-page cache release.
+
+Usage: python benchmarks/bench_pdf_memory.py [page_count]
+
+tracemalloc slows pdfplumber down a lot, so keep page_count modest.
+"""
+
+import os
+import sys
+import time
+import tempfile
+import tracemalloc
+
+import pdfplumber
+
+sys.path.insert(0, '.')
+
+from resume_parser.parsers.pdf_parser import PDFParser
+
+
+def write_pdf(path: str, page_count: int, lines_per_page: int = 60) -> None:
+    lines = " ".join(f"BT /F1 9 Tf 40 {760 - 12 * i} Td (Line {i} of a long portfolio page with words) Tj ET"
+                     for i in range(lines_per_page))
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+               f"<< /Length {len(lines)} >>\nstream\n{lines}\nendstream"]
+    page_ids = []
+    for _ in range(page_count):
+        objects.append("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       "/Resources << /Font << /F1 3 0 R >> >> /Contents 4 0 R >>")
+        page_ids.append(len(objects))
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {page_count} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+def retain_pages(path: str) -> str:
+    """The pre-change loop: every page keeps its layout cache until the file closes."""
+    with pdfplumber.open(path) as pdf:
+        return "\n\n".join(page.extract_text() or "" for page in pdf.pages)
+
+
+def measure(label: str, fn) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<28} {elapsed:6.2f}s  peak {peak / 1024 / 1024:8.1f} MiB")
+
+
+def main():
+    page_count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "portfolio.pdf")
+        write_pdf(path, page_count)
+        print(f"{page_count} pages, {os.path.getsize(path) / 1024:.0f} KiB")
+
+        measure("pages retained", lambda: retain_pages(path))
+        measure("pages released", lambda: PDFParser().parse(path))
+        measure("released, max_pages=10", lambda: PDFParser(max_pages=10).parse(path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Measure ResultStore insert throughput from concurrent writer threads.
+
+Usage: python benchmarks/bench_result_store.py [record_count] [threads]
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+
+sys.path.insert(0, '.')
+
+from resume_parser.models.resume_data import ResumeData
+from resume_parser.services.result_store import ResultStore
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    per_thread = count // threads
+    result = ResumeData("Candidate", "candidate@example.com", ["python", "aws", "docker", "kubernetes"])
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = ResultStore(os.path.join(directory, "results.db"))
+
+        def worker(n):
+            for i in range(per_thread):
+                store.put(result, f"{n}/{i}.pdf", content_hash=f"{n}-{i}")
+
+        started = time.perf_counter()
+        workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        store.flush()
+        write_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        read = sum(1 for _ in store.iter_results())
+        read_time = time.perf_counter() - started
+        store.close()
+
+    written = per_thread * threads
+    print(f"{threads} writer threads: {written} upserts in {write_time:.2f}s "
+          f"({written / write_time:,.0f}/s); streamed {read} rows in {read_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Measure bytes per in-memory resume record.
+
+Usage: python benchmarks/bench_resume_memory.py [record_count]
+"""
+
+import sys
+import random
+import tracemalloc
+from dataclasses import dataclass
+from typing import List
+
+sys.path.insert(0, '.')
+
+from resume_parser.models.resume_data import ResumeData
+from resume_parser.models.compact_resume_data import CompactResumeData
+from resume_parser.models.skill_pool import SkillPool
+
+
+@dataclass
+class PlainResumeData:
+    """The original ResumeData layout (no __slots__), kept for comparison."""
+    name: str
+    email: str
+    skills: List[str]
+
+
+def make_records(count: int):
+    rng = random.Random(42)
+    vocabulary = [f"skill-{i}" for i in range(3000)]
+    for i in range(count):
+        # Fresh string objects per resume, as the JSON parsing in the extractor produces
+        skills = ["".join(rng.choice(vocabulary)) for _ in range(rng.randint(5, 25))]
+        yield f"Candidate {i}", f"candidate{i}@example.com", skills
+
+
+def measure(label: str, build, count: int) -> None:
+    tracemalloc.start()
+    records = [build(name, email, skills) for name, email, skills in make_records(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {current / len(records):8.1f} bytes/record")
+    del records
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{count} records, ~15 skills each from a 3000-skill vocabulary")
+
+    measure("dataclass (original)", PlainResumeData, count)
+    measure("ResumeData (__slots__)", ResumeData, count)
+    pool = SkillPool()
+    measure("ResumeData + pooled strings", lambda n, e, s: ResumeData(n, e, [pool.canonical(x) for x in s]), count)
+    pool = SkillPool()
+    measure("CompactResumeData", lambda n, e, s: CompactResumeData(n, e, s, pool), count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare a per-resume Python scoring loop with sparse-matrix top-k matching.
+
+Usage: python benchmarks/bench_skill_matcher.py [resume_count]
+"""
+
+import sys
+import time
+import heapq
+import random
+
+sys.path.insert(0, '.')
+
+from resume_parser.services.skill_matcher import SkillMatcher
+
+
+def make_profiles(count: int):
+    rng = random.Random(42)
+    vocabulary = [f"skill-{i}" for i in range(5000)]
+    profiles = [rng.sample(vocabulary, rng.randint(5, 30)) for _ in range(count)]
+    jobs = [rng.sample(vocabulary[:500], 8) for _ in range(50)]
+    return profiles, jobs
+
+
+def python_loop(profiles, job, k: int):
+    job = set(job)
+    scored = ((len(job.intersection(skills)), i) for i, skills in enumerate(profiles))
+    return heapq.nlargest(k, (item for item in scored if item[0] > 0))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    profiles, jobs = make_profiles(count)
+    print(f"{count} resumes, {len(jobs)} jobs, k=20")
+
+    started = time.perf_counter()
+    python_loop(profiles, jobs[0], 20)
+    print(f"python loop              {time.perf_counter() - started:8.3f}s per job")
+
+    started = time.perf_counter()
+    matcher = SkillMatcher()
+    for skills in profiles:
+        matcher.add(skills)
+    matcher.build()
+    print(f"build sparse matrix      {time.perf_counter() - started:8.3f}s")
+
+    for method in SkillMatcher.METHODS:
+        started = time.perf_counter()
+        matcher.top_k(jobs[0], k=20, method=method)
+        single = time.perf_counter() - started
+        started = time.perf_counter()
+        matcher.top_k_batch(jobs, k=20, method=method)
+        batch = (time.perf_counter() - started) / len(jobs)
+        print(f"{method:<8} single {single:8.3f}s per job   batched {batch:8.3f}s per job")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Soak the extraction path against the fake Gemini backend, fully offline.
+
+Usage: python benchmarks/soak_fake_gemini.py [seconds] [threads]
+
+The backend is configured from FAKE_GEMINI_* (see .env.example), e.g.
+FAKE_GEMINI_429_RATE=0.05 FAKE_GEMINI_MALFORMED_RATE=0.02 FAKE_GEMINI_TIME_SCALE=0.1
+"""
+
+import sys
+import time
+import threading
+
+sys.path.insert(0, '.')
+
+from resume_parser import EmailExtractor, HeuristicNameExtractor, KeywordSkillsExtractor, ResumeParserFramework
+from resume_parser.extractors.circuit_breaker import CircuitBreaker
+from resume_parser.extractors.fake_gemini import FakeGeminiBackend
+from resume_parser.extractors.hedging import HedgePolicy
+from resume_parser.extractors.name_extractor import NameExtractor
+from resume_parser.extractors.skills_extractor import SkillsExtractor
+
+FIRST = ["Jane", "Omar", "Li", "Priya", "Carlos", "Anna"]
+LAST = ["Smith", "Haddad", "Wei", "Patel", "Rivera", "Novak"]
+SKILLS = ["Python", "SQL", "Docker", "Kubernetes", "React", "AWS", "Java", "Terraform"]
+
+
+def resume(i):
+    name = f"{FIRST[i % len(FIRST)]} {LAST[i // len(FIRST) % len(LAST)]}"
+    skills = ", ".join(SKILLS[j % len(SKILLS)] for j in range(i % 5 + 2))
+    return f"{name}\nSoftware Engineer\n{name.lower().replace(' ', '.')}@example.com\n\nSKILLS\n{skills}\n"
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 30
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+
+    backend = FakeGeminiBackend.from_env()
+    hedging = HedgePolicy(percentile=95)
+    breaker = CircuitBreaker(failure_threshold=20, reset_timeout=2)
+    framework = ResumeParserFramework({}, {
+        "name": NameExtractor(hedge_policy=hedging, circuit_breaker=breaker,
+                              fallback=HeuristicNameExtractor(), backend=backend),
+        "email": EmailExtractor(),
+        "skills": SkillsExtractor(hedge_policy=hedging, circuit_breaker=breaker,
+                                  fallback=KeywordSkillsExtractor(), backend=backend),
+    }, deadline_seconds=10)
+
+    latencies, unknown = [], [0]
+    lock = threading.Lock()
+    stop_at = time.monotonic() + seconds
+
+    def worker(n):
+        i = n
+        while time.monotonic() < stop_at:
+            started = time.perf_counter()
+            result = framework.extract_data(resume(i))
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                unknown[0] += result.name == "Unknown"
+            i += threads
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    print(f"{len(latencies)} resumes in {elapsed:.1f}s with {threads} threads ({len(latencies) / elapsed:.1f}/s)")
+    print(f"latency p50 {percentile(latencies, 50) * 1000:.0f}ms, p95 {percentile(latencies, 95) * 1000:.0f}ms, "
+          f"p99 {percentile(latencies, 99) * 1000:.0f}ms; names unresolved: {unknown[0]}")
+    print(f"backend: {backend.stats()}")
+    print(f"hedging: {hedging.stats()}")
+    print(f"circuit breaker: {breaker.stats()}")
+
+
+if __name__ == "__main__":
+    main()
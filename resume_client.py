@@ -0,0 +1,80 @@
+"""Parse resumes through a running run_daemon.py and print one JSON line per file.
+
+    python resume_client.py resume.pdf other.docx [--fields name,email] [--socket PATH]
+
+Uses only the standard library so that per-file cost is a socket round trip,
+not an interpreter full of parser and LLM imports.
+"""
+
+import os
+import sys
+import json
+import socket
+import argparse
+
+
+class Connection:
+    """One connection to the daemon, reopened once if a worker drops it mid-request."""
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.conn = None
+        self.reader = None
+
+    def request(self, payload: dict) -> dict:
+        data = json.dumps(payload).encode("utf-8") + b"\n"
+        for _ in range(2):
+            if self.conn is None:
+                self.conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.conn.connect(self.socket_path)
+                self.reader = self.conn.makefile("rb")
+            try:
+                self.conn.sendall(data)
+                line = self.reader.readline()
+            except ConnectionError:
+                line = b""
+            if line:
+                return json.loads(line)
+            self.close()  # the worker was recycled or died
+        raise ConnectionError("daemon closed the connection without replying")
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.reader.close()
+            self.conn.close()
+            self.conn = self.reader = None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--socket", default=os.getenv("DAEMON_SOCKET", "/tmp/resume-parser.sock"))
+    parser.add_argument("--fields", help="comma-separated fields to extract (default: all)")
+    parser.add_argument("--deadline", type=float, help="per-file deadline in seconds")
+    args = parser.parse_args()
+
+    connection = Connection(args.socket)
+    failed = 0
+    try:
+        for file_path in args.files:
+            request = {"path": os.path.abspath(file_path)}
+            if args.fields:
+                request["fields"] = args.fields.split(",")
+            if args.deadline is not None:
+                request["deadline"] = args.deadline
+            reply = connection.request(request)
+            if reply["ok"]:
+                print(json.dumps({"path": file_path, **reply["result"]}))
+            else:
+                failed += 1
+                print(f"{file_path}: {reply['type']}: {reply['error']}", file=sys.stderr)
+    except OSError as e:
+        print(f"Daemon at {args.socket}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        connection.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,19 +3,31 @@
 __version__ = "1.0.0"
 
 from .services.framework import ResumeParserFramework
+from .services.http_service import ResumeParserService, ServiceOverloaded, BatchTooLarge
 from .parsers.pdf_parser import PDFParser
 from .parsers.word_parser import WordParser
 from .extractors.name_extractor import NameExtractor
 from .extractors.email_extractor import EmailExtractor
 from .extractors.skills_extractor import SkillsExtractor
+from .extractors.heuristic_name_extractor import HeuristicNameExtractor
+from .extractors.keyword_skills_extractor import KeywordSkillsExtractor
+from .extractors.skill_canonicalizer import SkillCanonicalizer
 from .models.resume_data import ResumeData
+from .preprocessing.text_compactor import TextCompactor
 
 __all__ = [
     "ResumeParserFramework",
+    "ResumeParserService",
+    "ServiceOverloaded",
+    "BatchTooLarge",
     "PDFParser",
     "WordParser",
     "NameExtractor",
     "EmailExtractor",
     "SkillsExtractor",
+    "HeuristicNameExtractor",
+    "KeywordSkillsExtractor",
+    "SkillCanonicalizer",
     "ResumeData",
+    "TextCompactor",
 ]
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""Circuit breaker for the LLM call path."""
+
+import time
+import threading
+import logging
+from typing import Callable, Dict, Optional, Tuple, Type, TypeVar
+
+from ..services.deadline import DeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling the backend while the circuit is open."""
+
+
+class CircuitBreaker:
+    """Stop calling a failing backend and probe it periodically for recovery.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    every call fails immediately with ``CircuitOpen``. Once ``reset_timeout``
+    seconds have passed, up to ``half_open_max_calls`` probe calls are let
+    through: a success closes the circuit, a failure re-opens it.
+
+    Exceptions in ``ignored`` count as neither failure nor success. By
+    default that is DeadlineExceeded for deadlines that had passed before
+    the request was sent, which say nothing about the backend. A deadline
+    that runs out while a request is in flight (``in_flight=True``) means
+    the backend did not answer in time and counts as a failure, so a hung
+    backend still opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, half_open_max_calls: int = 1,
+                 ignored: Tuple[Type[BaseException], ...] = (DeadlineExceeded,)):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.ignored = ignored
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        # Bumped on every transition to half-open, so probes from an earlier round release nothing
+        self._probe_round = 0
+        self._stats = {
+            "calls": 0,
+            "failures": 0,
+            "short_circuited": 0,
+            "opened": 0,
+        }
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {**self._stats, "state": self._current_state()}
+
+    def call(self, fn: Callable[[], T]) -> T:
+        with self._lock:
+            state = self._current_state()
+            if state == self.OPEN or (state == self.HALF_OPEN and
+                                      self._probes_in_flight >= self.half_open_max_calls):
+                self._stats["short_circuited"] += 1
+                raise CircuitOpen("LLM circuit is open")
+            probe = None
+            if state == self.HALF_OPEN:
+                self._probes_in_flight += 1
+                probe = self._probe_round
+            self._stats["calls"] += 1
+
+        try:
+            result = fn()
+        except self.ignored as e:
+            if getattr(e, "in_flight", False):
+                self._on_failure(state, probe)
+            else:
+                self._on_ignored(probe)
+            raise
+        except Exception:
+            self._on_failure(state, probe)
+            raise
+        self._on_success(state, probe)
+        return result
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_round += 1
+            logger.info("LLM circuit half-open, probing backend")
+        return self._state
+
+    def _release_probe(self, probe: Optional[int]) -> None:
+        # Only a call that took a slot in the current half-open round gives one back
+        if probe is not None and probe == self._probe_round and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def _on_success(self, state: str, probe: Optional[int]) -> None:
+        with self._lock:
+            self._release_probe(probe)
+            # A call that started before the circuit opened says nothing about recovery
+            if state == self.HALF_OPEN and self._state == self.HALF_OPEN:
+                logger.info("LLM circuit closed after successful probe")
+                self._state = self.CLOSED
+            if self._state == self.CLOSED:
+                self._consecutive_failures = 0
+
+    def _on_ignored(self, probe: Optional[int]) -> None:
+        with self._lock:
+            self._release_probe(probe)
+
+    def _on_failure(self, state: str, probe: Optional[int]) -> None:
+        with self._lock:
+            self._stats["failures"] += 1
+            self._consecutive_failures += 1
+            self._release_probe(probe)
+            if state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._stats["opened"] += 1
+                    logger.warning(f"LLM circuit opened after {self._consecutive_failures} consecutive failure(s)")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
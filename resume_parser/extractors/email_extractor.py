@@ -2,6 +2,11 @@
 
 import re
 
+from ..models.document import Document
+
+# Email pattern that supports Unicode characters
+EMAIL_PATTERN = re.compile(r'\b[\w._%+-]+@[\w.-]+\.[A-Za-z]{2,}\b', re.UNICODE)
+
 
 class EmailExtractor:
     """Extract email addresses using regex patterns."""
@@ -10,8 +15,7 @@ class EmailExtractor:
         if not text:
             return ""
         
-        # Email pattern that supports Unicode characters
-        email_pattern = r'\b[\w._%+-]+@[\w.-]+\.[A-Za-z]{2,}\b'
-        matches = re.findall(email_pattern, text, re.UNICODE)
+        # Documents cache the scan for any other extractor that needs it
+        matches = text.findall(EMAIL_PATTERN) if isinstance(text, Document) else EMAIL_PATTERN.findall(text)
         
-        return matches[0] if matches else ""
\ No newline at end of file
+        return matches[0] if matches else ""
@@ -0,0 +1,266 @@
+"""Offline stand-in for the Gemini API, with response recording and replay."""
+
+import os
+import json
+import time
+import random
+import hashlib
+import threading
+import logging
+from typing import Callable, Dict, Optional
+import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+
+from .heuristic_name_extractor import HeuristicNameExtractor
+from .keyword_skills_extractor import KeywordSkillsExtractor
+
+logger = logging.getLogger(__name__)
+
+_RESUME_MARKER = "Resume text:\n"
+
+
+class FakeUsage:
+    """Mirror of the usage metadata on real responses."""
+
+    def __init__(self, prompt_token_count: int, candidates_token_count: int):
+        self.prompt_token_count = prompt_token_count
+        self.candidates_token_count = candidates_token_count
+
+
+class FakeResponse:
+    """Response object with the attributes the extractors read."""
+
+    def __init__(self, text: str, prompt: str):
+        self.text = text
+        self.usage_metadata = FakeUsage(len(prompt) // 4, len(text) // 4)
+
+
+class FakeGeminiBackend:
+    """Serve generate_content calls locally with realistic failure modes.
+
+    Latency is log-normal around ``latency_median`` seconds, multiplied by
+    ``time_scale`` (0 disables sleeping). ``error_429_rate`` and
+    ``error_500_rate`` raise the same google.api_core exceptions the real
+    client does; ``rate_limit`` (requests per second across all models)
+    turns excess calls into 429s. Bodies are synthesized from the resume in
+    the prompt with local extractors, or taken from a recording made by
+    RecordingBackend when ``replay_path`` is given. ``fenced_rate`` wraps
+    bodies in a ```json fence and ``malformed_rate`` truncates them.
+    """
+
+    offline = True
+
+    def __init__(self, latency_median: float = 0.8, latency_sigma: float = 0.5, time_scale: float = 1.0,
+                 error_429_rate: float = 0.0, error_500_rate: float = 0.0, rate_limit: Optional[float] = None,
+                 fenced_rate: float = 0.0, malformed_rate: float = 0.0, replay_path: Optional[str] = None,
+                 responder: Optional[Callable[[str], str]] = None, seed: Optional[int] = None):
+        for name, rate in (("error_429_rate", error_429_rate), ("error_500_rate", error_500_rate),
+                           ("fenced_rate", fenced_rate), ("malformed_rate", malformed_rate)):
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+
+        self.latency_median = latency_median
+        self.latency_sigma = latency_sigma
+        self.time_scale = time_scale
+        self.error_429_rate = error_429_rate
+        self.error_500_rate = error_500_rate
+        self.rate_limit = rate_limit
+        self.fenced_rate = fenced_rate
+        self.malformed_rate = malformed_rate
+        self.responder = responder or synthesize_response
+        self._replay = load_recording(replay_path) if replay_path else None
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = rate_limit or 0.0
+        self._refilled_at = time.monotonic()
+        self._stats = {
+            "requests": 0,
+            "errors_429": 0,
+            "errors_500": 0,
+            "rate_limited": 0,
+            "fenced": 0,
+            "malformed": 0,
+            "replayed": 0,
+            "replay_misses": 0,
+        }
+
+    @classmethod
+    def from_env(cls) -> "FakeGeminiBackend":
+        """Configure from the FAKE_GEMINI_* variables and GEMINI_REPLAY_FILE."""
+        rate_limit = os.getenv("FAKE_GEMINI_RATE_LIMIT")
+        seed = os.getenv("FAKE_GEMINI_SEED")
+        return cls(
+            latency_median=float(os.getenv("FAKE_GEMINI_LATENCY_MEDIAN", "0.8")),
+            latency_sigma=float(os.getenv("FAKE_GEMINI_LATENCY_SIGMA", "0.5")),
+            time_scale=float(os.getenv("FAKE_GEMINI_TIME_SCALE", "1.0")),
+            error_429_rate=float(os.getenv("FAKE_GEMINI_429_RATE", "0")),
+            error_500_rate=float(os.getenv("FAKE_GEMINI_500_RATE", "0")),
+            rate_limit=float(rate_limit) if rate_limit else None,
+            fenced_rate=float(os.getenv("FAKE_GEMINI_FENCED_RATE", "0")),
+            malformed_rate=float(os.getenv("FAKE_GEMINI_MALFORMED_RATE", "0")),
+            replay_path=os.getenv("GEMINI_REPLAY_FILE") or None,
+            seed=int(seed) if seed else None,
+        )
+
+    def model(self, model_name: str) -> "FakeGenerativeModel":
+        return FakeGenerativeModel(self, model_name)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def generate(self, model_name: str, prompt: str) -> FakeResponse:
+        with self._lock:
+            self._stats["requests"] += 1
+            limited = not self._take_token()
+            roll = self._random.random()
+            delay = self._random.lognormvariate(0.0, self.latency_sigma) * self.latency_median * self.time_scale
+            fenced = self._random.random() < self.fenced_rate
+            malformed = self._random.random() < self.malformed_rate
+            if limited:
+                self._stats["rate_limited"] += 1
+            elif roll < self.error_429_rate:
+                self._stats["errors_429"] += 1
+            elif roll < self.error_429_rate + self.error_500_rate:
+                self._stats["errors_500"] += 1
+
+        if limited:
+            raise google_exceptions.ResourceExhausted(f"Rate limit of {self.rate_limit} requests/s exceeded")
+        if delay > 0:
+            time.sleep(delay)
+        if roll < self.error_429_rate:
+            raise google_exceptions.ResourceExhausted("Resource has been exhausted (e.g. check quota).")
+        if roll < self.error_429_rate + self.error_500_rate:
+            raise google_exceptions.InternalServerError("An internal error has occurred.")
+
+        text = self._body(prompt)
+        if malformed:
+            text = text[:max(1, len(text) // 2)]
+        if fenced:
+            text = f"```json\n{text}\n```"
+        with self._lock:
+            self._stats["malformed"] += malformed
+            self._stats["fenced"] += fenced
+        return FakeResponse(text, prompt)
+
+    def _body(self, prompt: str) -> str:
+        if self._replay is not None:
+            recorded = self._replay.get(prompt_key(prompt))
+            with self._lock:
+                self._stats["replayed" if recorded is not None else "replay_misses"] += 1
+            if recorded is not None:
+                return recorded
+        return self.responder(prompt)
+
+    def _take_token(self) -> bool:
+        # Token bucket holding at most one second of requests
+        if self.rate_limit is None:
+            return True
+        now = time.monotonic()
+        self._tokens = min(self.rate_limit, self._tokens + (now - self._refilled_at) * self.rate_limit)
+        self._refilled_at = now
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+
+class FakeGenerativeModel:
+    """Drop-in for genai.GenerativeModel backed by a FakeGeminiBackend."""
+
+    def __init__(self, backend: FakeGeminiBackend, model_name: str):
+        self.backend = backend
+        self.model_name = model_name
+
+    def generate_content(self, prompt: str) -> FakeResponse:
+        return self.backend.generate(self.model_name, prompt)
+
+
+class RecordingBackend:
+    """Pass requests to a real (or any other) backend and append each response to a JSONL file.
+
+    The file can be replayed with ``FakeGeminiBackend(replay_path=...)``.
+    """
+
+    def __init__(self, path: str, inner: Optional[object] = None):
+        self.path = path
+        self.inner = inner
+        self.offline = getattr(inner, "offline", False)
+        self._lock = threading.Lock()
+
+    def model(self, model_name: str) -> "_RecordingModel":
+        inner = self.inner.model(model_name) if self.inner is not None else genai.GenerativeModel(model_name)
+        return _RecordingModel(self, inner, model_name)
+
+    def record(self, model_name: str, prompt: str, text: str) -> None:
+        line = json.dumps({"model": model_name, "prompt": prompt_key(prompt), "text": text})
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class _RecordingModel:
+    def __init__(self, recorder: RecordingBackend, inner, model_name: str):
+        self.recorder = recorder
+        self.inner = inner
+        self.model_name = model_name
+
+    def generate_content(self, prompt: str):
+        response = self.inner.generate_content(prompt)
+        if response is not None and response.text:
+            self.recorder.record(self.model_name, prompt, response.text)
+        return response
+
+
+def prompt_key(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def load_recording(path: str) -> Dict[str, str]:
+    """Map prompt hash to response text; later entries win."""
+    responses = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                responses[entry["prompt"]] = entry["text"]
+    logger.info(f"Loaded {len(responses)} recorded Gemini responses from {path}")
+    return responses
+
+
+_name_extractor = HeuristicNameExtractor()
+_skills_extractor = KeywordSkillsExtractor()
+
+
+def synthesize_response(prompt: str) -> str:
+    """Answer a name or skills prompt from the resume text it contains."""
+    text = prompt.split(_RESUME_MARKER, 1)[-1]
+    if '"skills"' in prompt:
+        return json.dumps({"skills": _skills_extractor.extract(text)})
+    return json.dumps({"name": _name_extractor.extract(text)})
+
+
+_env_backends: Dict[tuple, FakeGeminiBackend] = {}
+_env_lock = threading.Lock()
+
+
+def backend_from_env() -> Optional[object]:
+    """Backend selected by GEMINI_BACKEND: ``gemini`` (None, the real API), ``fake`` or ``record``.
+
+    Extractors configured from the same environment share one fake backend,
+    so its rate limit and stats are global, like the real quota.
+    """
+    kind = os.getenv("GEMINI_BACKEND", "gemini").lower()
+    if kind == "gemini":
+        return None
+    if kind == "record":
+        return RecordingBackend(os.getenv("GEMINI_RECORD_FILE", "gemini_recordings.jsonl"))
+    if kind == "fake":
+        key = tuple(sorted((name, value) for name, value in os.environ.items()
+                           if name.startswith("FAKE_GEMINI_") or name == "GEMINI_REPLAY_FILE"))
+        with _env_lock:
+            if key not in _env_backends:
+                _env_backends[key] = FakeGeminiBackend.from_env()
+                logger.info("Using fake Gemini backend")
+            return _env_backends[key]
+    raise ValueError(f"Unsupported GEMINI_BACKEND: {kind}. Supported: ['gemini', 'fake', 'record']")
@@ -0,0 +1,162 @@
+"""Shared Gemini plumbing for LLM-based extractors."""
+
+import os
+import json
+import time
+import logging
+import itertools
+from typing import Callable, Optional, Tuple, TypeVar
+import google.generativeai as genai
+
+from .circuit_breaker import CircuitBreaker, CircuitOpen
+from .fake_gemini import backend_from_env
+from .hedging import HedgePolicy
+from .model_router import ModelRouter, ModelTier
+from ..preprocessing.text_compactor import estimate_tokens, truncate_to_tokens
+from ..services.deadline import DeadlineExceeded, current_deadline
+from ..services.tracing import span
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class GeminiExtractor:
+    """Base class holding the Gemini model and the request path to it.
+
+    ``fallback`` is any local extractor (e.g. HeuristicNameExtractor) used
+    while ``circuit_breaker`` is open or when the Gemini call itself fails.
+    With a ``router``, each request goes to the model tier it picks instead
+    of GEMINI_MODEL_NAME. ``backend`` replaces the Gemini client (see
+    fake_gemini); by default it is chosen by GEMINI_BACKEND.
+    ``PROMPT_MAX_TOKENS`` bounds the resume text placed in each prompt.
+    """
+
+    FIELD_NAME = "field"
+    PROMPT_MAX_TOKENS = 1500
+
+    def __init__(self, hedge_policy: Optional[HedgePolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None, fallback: Optional[object] = None,
+                 router: Optional[ModelRouter] = None, backend: Optional[object] = None):
+        self.backend = backend if backend is not None else backend_from_env()
+        if not getattr(self.backend, "offline", False):
+            api_key = os.getenv("GEMINI_API_KEY")
+            if not api_key:
+                logger.error("GEMINI_API_KEY not found in environment")
+                raise ValueError("GEMINI_API_KEY not found in environment")
+
+            logger.debug("Configuring Gemini API for %s extraction", self.FIELD_NAME)
+            genai.configure(api_key=api_key)
+        self.model = self._create_model(os.getenv("GEMINI_MODEL_NAME", "gemini-pro"))
+        self.hedge_policy = hedge_policy
+        # Deadline enforcement only, per extractor so calls hung on one field cannot take the other's workers
+        self._deadline_policy = HedgePolicy(percentile=None)
+        self.circuit_breaker = circuit_breaker
+        self.fallback = fallback
+        self.router = router
+
+    def _prompt_text(self, text: str, max_tokens: Optional[int] = None) -> str:
+        """Resume text cut to the prompt token budget on a line boundary."""
+        return truncate_to_tokens(text, max_tokens or self.PROMPT_MAX_TOKENS)
+
+    def _create_model(self, model_name: str):
+        if self.backend is None:
+            return genai.GenerativeModel(model_name)
+        return self.backend.model(model_name)
+
+    def _generate(self, prompt: str, tier: Optional[ModelTier] = None):
+        """Send a prompt to Gemini, honouring the current resume deadline."""
+        logger.debug("Sending %s extraction request to Gemini API", self.FIELD_NAME)
+        policy = self.hedge_policy or self._deadline_policy
+        deadline = current_deadline()
+        attempts = itertools.count(1)
+        model = self.model if tier is None else self.router.model(tier, self._create_model)
+        attributes = {"field": self.FIELD_NAME, "prompt_chars": len(prompt)}
+        if tier is not None:
+            attributes["tier"] = tier.name
+
+        with span("gemini.generate_content", **attributes) as request:
+            def attempt():
+                # Hedged attempts run on pool threads, so the parent is passed explicitly
+                number = next(attempts)
+                if request is not None:
+                    request.set_attribute("attempts", number)
+                with span("gemini.attempt", parent=request, attempt=number):
+                    return model.generate_content(prompt)
+
+            def send():
+                return policy.call(attempt, deadline)
+
+            if self.circuit_breaker is None:
+                return send()
+            return self.circuit_breaker.call(send)
+
+    def _generate_and_parse(self, text: str, prompt: str, parse: Callable[[str], T], empty: T) -> T:
+        """Send ``prompt`` and run ``parse`` on the response text.
+
+        Without a router this is a single request. With one, a response that
+        is malformed JSON or parses to ``empty`` is retried on the next tier
+        up; the largest tier's answer (or its JSONDecodeError) is final.
+        Request errors are not escalated. Only malformed responses and
+        request errors count against a tier's health: an empty answer may be
+        correct (a resume without skills), and deadlines and an open circuit
+        say nothing about the tier.
+        """
+        if self.router is None:
+            response = self._generate(prompt)
+            return parse(response.text if response else "")
+
+        tier = self.router.route(text)
+        while True:
+            larger = self.router.next_tier(tier)
+            started = time.monotonic()
+            try:
+                response = self._generate(prompt, tier)
+                response_text = response.text if response else ""
+                value = parse(response_text)
+            except json.JSONDecodeError:
+                self.router.record(tier, time.monotonic() - started, ok=False, escalated=larger is not None)
+                if larger is None:
+                    raise
+            except (DeadlineExceeded, CircuitOpen):
+                raise
+            except Exception:
+                self.router.record(tier, time.monotonic() - started, ok=False)
+                raise
+            else:
+                escalate = value == empty and larger is not None
+                prompt_tokens, output_tokens = _token_counts(response, prompt, response_text)
+                self.router.record(tier, time.monotonic() - started, ok=True, prompt_tokens=prompt_tokens,
+                                   output_tokens=output_tokens, escalated=escalate)
+                if not escalate:
+                    return value
+            tier = larger
+
+    def _degrade(self, text: str, default):
+        """Return the local fallback extractor's answer, or ``default`` without one."""
+        if self.fallback is None:
+            return default
+        logger.info("Using %s for %s extraction", self.fallback.__class__.__name__, self.FIELD_NAME)
+        try:
+            return self.fallback.extract(text)
+        except Exception as e:
+            logger.error("Fallback %s extraction failed: %s", self.FIELD_NAME, e)
+            return default
+
+    @staticmethod
+    def _clean_response(response_text: str) -> str:
+        """Strip whitespace and Markdown code fences around a JSON payload."""
+        response_text = response_text.strip()
+        if response_text.startswith("```"):
+            response_text = response_text.replace("```json", "").replace("```", "").strip()
+        return response_text
+
+
+def _token_counts(response, prompt: str, response_text: str) -> Tuple[int, int]:
+    # Prefer the usage the API reports; estimate from text length otherwise
+    usage = getattr(response, "usage_metadata", None)
+    prompt_tokens = getattr(usage, "prompt_token_count", None)
+    output_tokens = getattr(usage, "candidates_token_count", None)
+    if isinstance(prompt_tokens, int) and isinstance(output_tokens, int):
+        return prompt_tokens, output_tokens
+    return estimate_tokens(prompt), estimate_tokens(response_text or "")
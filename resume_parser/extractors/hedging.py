@@ -0,0 +1,167 @@
+"""Hedged LLM requests bounded by per-resume deadlines."""
+
+import time
+import threading
+import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Optional, TypeVar
+
+from ..services.deadline import Deadline, DeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HedgePoolSaturated(RuntimeError):
+    """Raised instead of queueing when every hedge worker is busy with an earlier attempt."""
+
+
+class HedgePolicy:
+    """Fire a duplicate request when the first one is slower than usual.
+
+    The hedge delay is the ``percentile`` of the last ``window`` successful
+    latencies; until ``min_samples`` have been seen no hedges are sent. With
+    ``percentile=None`` the policy only enforces deadlines. Calls without a
+    deadline and without a hedge delay run inline on the caller's thread.
+
+    Attempts abandoned at a deadline keep their pool thread until the LLM
+    call returns, so a hung backend can fill all ``max_workers``. A request
+    arriving then fails at once with ``HedgePoolSaturated`` (counted by a
+    circuit breaker like any backend failure) rather than queueing behind
+    the hung calls, and no hedges are fired.
+    """
+
+    def __init__(self, percentile: Optional[float] = 95.0, window: int = 200, min_samples: int = 20,
+                 min_delay: float = 0.05, max_hedges: int = 1, max_workers: int = 32):
+        if percentile is not None and not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_hedges = max_hedges
+        self.max_workers = max_workers
+        self._running = 0
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-hedge")
+        self._stats = {
+            "requests": 0,
+            "hedges_fired": 0,
+            "hedges_won": 0,
+            "deadline_exceeded": 0,
+            "saturated": 0,
+        }
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while hedging is disabled."""
+        if self.percentile is None or self.max_hedges < 1:
+            return None
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def call(self, fn: Callable[[], T], deadline: Optional[Deadline] = None) -> T:
+        """Run ``fn``, hedging slow attempts and giving up when ``deadline`` expires."""
+        with self._lock:
+            self._stats["requests"] += 1
+
+        delay = self.hedge_delay()
+        if deadline is None and delay is None:
+            started = time.monotonic()
+            result = fn()
+            self._record(time.monotonic() - started)
+            return result
+
+        if deadline is not None and deadline.expired:
+            self._deadline_exceeded(in_flight=False)
+
+        attempts: Dict[Future, float] = {}
+
+        def launch() -> None:
+            future = self._executor.submit(fn)
+            future.add_done_callback(self._release)
+            attempts[future] = time.monotonic()
+
+        if not self._reserve():
+            with self._lock:
+                self._stats["saturated"] += 1
+            raise HedgePoolSaturated(f"All {self.max_workers} LLM request workers are busy")
+        launch()
+        primary = next(iter(attempts))
+        hedges = 0
+        errors = []
+
+        while attempts:
+            timeout = deadline.remaining() if deadline is not None else None
+            can_hedge = delay is not None and hedges < self.max_hedges
+            if can_hedge:
+                next_hedge = max(0.0, delay - (time.monotonic() - max(attempts.values())))
+                timeout = next_hedge if timeout is None else min(timeout, next_hedge)
+
+            done, _ = wait(list(attempts), timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                started = attempts.pop(future)
+                if future.exception() is not None:
+                    errors.append(future.exception())
+                    continue
+
+                self._record(time.monotonic() - started)
+                if future is not primary:
+                    with self._lock:
+                        self._stats["hedges_won"] += 1
+                for loser in attempts:
+                    loser.cancel()
+                return future.result()
+
+            if deadline is not None and deadline.expired:
+                for loser in attempts:
+                    loser.cancel()
+                self._deadline_exceeded(in_flight=True)
+
+            if not done and can_hedge:
+                if not self._reserve():
+                    # No free worker for a hedge; keep waiting on the attempts already running
+                    hedges = self.max_hedges
+                    continue
+                hedges += 1
+                with self._lock:
+                    self._stats["hedges_fired"] += 1
+                logger.debug("LLM request exceeded %.3fs, firing hedge %d", delay, hedges)
+                launch()
+
+        # Every attempt failed; surface the first error like an unhedged call would
+        raise errors[0]
+
+    def _reserve(self) -> bool:
+        """Claim a pool worker for one attempt, or return False when all are taken."""
+        with self._lock:
+            if self._running >= self.max_workers:
+                return False
+            self._running += 1
+            return True
+
+    def _release(self, future: Future) -> None:
+        # Runs once the attempt finishes or is cancelled before starting
+        with self._lock:
+            self._running -= 1
+
+    def _record(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    def _deadline_exceeded(self, in_flight: bool) -> None:
+        with self._lock:
+            self._stats["deadline_exceeded"] += 1
+        if in_flight:
+            raise DeadlineExceeded("Resume deadline exceeded waiting for LLM response", in_flight=True)
+        raise DeadlineExceeded("Resume deadline passed before the LLM request was sent")
@@ -0,0 +1,41 @@
+"""Name extraction using local heuristics (no LLM)."""
+
+import re
+
+_TITLES = re.compile(r"^(mr|mrs|ms|miss|dr|prof)\.?\s+", re.IGNORECASE)
+_NAME_WORD = re.compile(r"^[^\W\d_]+(?:[-'.][^\W\d_]+)*\.?$", re.UNICODE)
+_HEADINGS = {"resume", "résumé", "curriculum vitae", "cv", "profile", "summary", "contact"}
+
+
+class HeuristicNameExtractor:
+    """Guess the candidate name from the first lines of the resume.
+
+    Intended as a degraded-mode fallback for the LLM extractor: it looks for
+    the first short line made only of name-like words.
+    """
+
+    def __init__(self, max_lines: int = 10):
+        self.max_lines = max_lines
+
+    def extract(self, text: str) -> str:
+        if not text:
+            return "Unknown"
+
+        checked = 0
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            checked += 1
+            if checked > self.max_lines:
+                break
+
+            candidate = _TITLES.sub("", line).strip()
+            if candidate.lower() in _HEADINGS:
+                continue
+
+            words = candidate.split()
+            if 2 <= len(words) <= 4 and all(_NAME_WORD.match(word) for word in words):
+                return " ".join(word.title() if word.isupper() else word for word in words)
+
+        return "Unknown"
@@ -0,0 +1,39 @@
+"""Skills extraction by matching a known vocabulary (no LLM)."""
+
+import re
+from typing import Iterable, List, Optional
+
+DEFAULT_SKILLS = (
+    "python", "java", "javascript", "typescript", "c++", "c#", "golang", "rust", "ruby",
+    "php", "swift", "kotlin", "scala", "matlab", "perl", "bash", "powershell", "sql", "nosql",
+    "html", "css", "sass", "react", "angular", "vue", "node.js", "express", "django", "flask",
+    "fastapi", "spring", "spring boot", ".net", "asp.net", "rails", "laravel", "graphql", "rest api",
+    "postgresql", "mysql", "sqlite", "oracle", "mongodb", "redis", "elasticsearch", "cassandra",
+    "kafka", "rabbitmq", "spark", "hadoop", "airflow", "dbt", "snowflake", "bigquery", "tableau",
+    "power bi", "excel", "pandas", "numpy", "scikit-learn", "tensorflow", "pytorch", "keras",
+    "machine learning", "deep learning", "nlp", "computer vision", "data analysis", "statistics",
+    "aws", "azure", "gcp", "google cloud", "docker", "kubernetes", "terraform", "ansible", "jenkins",
+    "git", "github", "gitlab", "ci/cd", "linux", "unix", "microservices", "agile", "scrum", "jira",
+    "project management", "leadership", "communication", "teamwork", "problem solving",
+    "customer service", "sales", "marketing", "accounting", "figma", "photoshop",
+)
+
+
+class KeywordSkillsExtractor:
+    """Find known skills in the text with a single compiled regex.
+
+    Intended as a degraded-mode fallback for the LLM extractor; it only finds
+    skills present in ``vocabulary``.
+    """
+
+    def __init__(self, vocabulary: Optional[Iterable[str]] = None):
+        terms = sorted({term.strip().lower() for term in (vocabulary or DEFAULT_SKILLS) if term.strip()},
+                       key=len, reverse=True)
+        # Longest terms first so "spring boot" wins over "spring"
+        alternation = "|".join(re.escape(term) for term in terms)
+        self._pattern = re.compile(rf"(?<!\w)(?:{alternation})(?![\w+#])", re.IGNORECASE)
+
+    def extract(self, text: str) -> List[str]:
+        if not text:
+            return []
+        return sorted({match.lower() for match in self._pattern.findall(text)})
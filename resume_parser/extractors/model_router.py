@@ -0,0 +1,163 @@
+"""Per-request model tier selection for LLM extractors."""
+
+import os
+import time
+import threading
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+import google.generativeai as genai
+
+from ..models.document import Document
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelTier:
+    """A model and the largest resume it should be used for.
+
+    ``max_chars`` and ``max_sections`` of None mean no limit; the last tier
+    should normally have neither.
+    """
+    name: str
+    model_name: str
+    max_chars: Optional[int] = None
+    max_sections: Optional[int] = None
+
+    def accepts(self, chars: int, sections: int) -> bool:
+        return ((self.max_chars is None or chars <= self.max_chars) and
+                (self.max_sections is None or sections <= self.max_sections))
+
+
+class ModelRouter:
+    """Pick the smallest model tier that suits a resume, and escalate on bad output.
+
+    Tiers are ordered from cheapest to largest. A resume goes to the first
+    tier whose limits cover its length and number of section headings;
+    tiers whose recent failure rate exceeds ``max_failure_rate`` are
+    skipped. Outcomes older than ``outcome_ttl`` seconds no longer count, so
+    a skipped tier (which records nothing new) gets traffic again once its
+    failures age out. Extractors move to the next tier when a response is
+    empty or does not parse. Latency, token and escalation counts are kept
+    per tier.
+    """
+
+    def __init__(self, tiers: Sequence[ModelTier], failure_window: int = 50, min_samples: int = 10,
+                 max_failure_rate: float = 0.2, outcome_ttl: float = 300.0):
+        if not tiers:
+            raise ValueError("At least one model tier is required")
+        if len({tier.name for tier in tiers}) != len(tiers):
+            raise ValueError("Model tier names must be unique")
+
+        self.tiers: List[ModelTier] = list(tiers)
+        self.min_samples = min_samples
+        self.max_failure_rate = max_failure_rate
+        self.outcome_ttl = outcome_ttl
+        self._lock = threading.Lock()
+        self._models: Dict[str, object] = {}
+        self._outcomes = {tier.name: deque(maxlen=failure_window) for tier in self.tiers}
+        self._stats = {tier.name: {
+            "requests": 0,
+            "failures": 0,
+            "escalations": 0,
+            "latency_total": 0.0,
+            "prompt_tokens": 0,
+            "output_tokens": 0,
+        } for tier in self.tiers}
+
+    @classmethod
+    def from_env(cls) -> Optional["ModelRouter"]:
+        """Build from GEMINI_MODEL_TIERS, e.g. ``gemini-1.5-flash:6000:8,gemini-1.5-pro``.
+
+        Each entry is ``model[:max_chars[:max_sections]]``. Returns None when
+        the variable is unset, so extractors keep using GEMINI_MODEL_NAME.
+        """
+        spec = os.getenv("GEMINI_MODEL_TIERS", "").strip()
+        if not spec:
+            return None
+
+        tiers = []
+        for entry in spec.split(","):
+            parts = entry.strip().split(":")
+            tiers.append(ModelTier(
+                name=parts[0],
+                model_name=parts[0],
+                max_chars=int(parts[1]) if len(parts) > 1 and parts[1] else None,
+                max_sections=int(parts[2]) if len(parts) > 2 and parts[2] else None,
+            ))
+        return cls(tiers)
+
+    @staticmethod
+    def features(text: str) -> Dict[str, int]:
+        document = text if isinstance(text, Document) else Document(text)
+        return {"chars": len(document), "sections": len(document.headings)}
+
+    def route(self, text: str) -> ModelTier:
+        """Return the tier to try first for ``text``."""
+        features = self.features(text)
+        for tier in self.tiers[:-1]:
+            if tier.accepts(features["chars"], features["sections"]) and not self._unhealthy(tier):
+                return tier
+        return self.tiers[-1]
+
+    def next_tier(self, tier: ModelTier) -> Optional[ModelTier]:
+        position = self.tiers.index(tier)
+        return self.tiers[position + 1] if position + 1 < len(self.tiers) else None
+
+    def model(self, tier: ModelTier, factory: Optional[Callable[[str], object]] = None):
+        """The tier's model, created once with ``factory`` (default genai.GenerativeModel)."""
+        with self._lock:
+            model = self._models.get(tier.name)
+            if model is None:
+                model = self._models[tier.name] = (factory or genai.GenerativeModel)(tier.model_name)
+            return model
+
+    def record(self, tier: ModelTier, latency: float, ok: bool, prompt_tokens: int = 0,
+               output_tokens: int = 0, escalated: bool = False) -> None:
+        with self._lock:
+            stats = self._stats[tier.name]
+            stats["requests"] += 1
+            stats["latency_total"] += latency
+            stats["prompt_tokens"] += prompt_tokens
+            stats["output_tokens"] += output_tokens
+            if not ok:
+                stats["failures"] += 1
+            if escalated:
+                stats["escalations"] += 1
+            self._outcomes[tier.name].append((time.monotonic(), ok))
+        if escalated:
+            logger.debug("Escalating from model tier %s", tier.name)
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        with self._lock:
+            result = {}
+            for name, stats in self._stats.items():
+                requests = stats["requests"]
+                result[name] = {
+                    "requests": requests,
+                    "failures": stats["failures"],
+                    "escalations": stats["escalations"],
+                    "avg_latency_ms": round(stats["latency_total"] / requests * 1000, 2) if requests else 0.0,
+                    "prompt_tokens": stats["prompt_tokens"],
+                    "output_tokens": stats["output_tokens"],
+                    "failure_rate": round(self._failure_rate(name), 3),
+                }
+            return result
+
+    def _unhealthy(self, tier: ModelTier) -> bool:
+        with self._lock:
+            return (len(self._recent(tier.name)) >= self.min_samples and
+                    self._failure_rate(tier.name) > self.max_failure_rate)
+
+    def _recent(self, name: str) -> Deque[Tuple[float, bool]]:
+        outcomes = self._outcomes[name]
+        cutoff = time.monotonic() - self.outcome_ttl
+        while outcomes and outcomes[0][0] < cutoff:
+            outcomes.popleft()
+        return outcomes
+
+    def _failure_rate(self, name: str) -> float:
+        outcomes = self._recent(name)
+        return sum(1 for _, ok in outcomes if not ok) / len(outcomes) if outcomes else 0.0
@@ -1,14 +1,16 @@
 """Name extraction using LLM."""
 
-import os
 import json
 import logging
-import google.generativeai as genai
+
+from .circuit_breaker import CircuitOpen
+from .gemini_extractor import GeminiExtractor
+from ..services.deadline import DeadlineExceeded
 
 logger = logging.getLogger(__name__)
 
 
-class NameExtractor:
+class NameExtractor(GeminiExtractor):
     """Extract candidate name using Gemini LLM."""
     
     EXTRACTION_PROMPT = """
@@ -27,15 +29,9 @@ Resume text:
 {text}
 """
     
-    def __init__(self):
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            logger.error("GEMINI_API_KEY not found in environment")
-            raise ValueError("GEMINI_API_KEY not found in environment")
-        
-        logger.debug("Configuring Gemini API for name extraction")
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(os.getenv("GEMINI_MODEL_NAME", "gemini-pro"))
+    FIELD_NAME = "name"
+    # The name sits near the top; a short excerpt is enough
+    PROMPT_MAX_TOKENS = 500
     
     def extract(self, text: str) -> str:
         if not text:
@@ -43,33 +39,37 @@ Resume text:
             return "Unknown"
             
         try:
-            prompt = self.EXTRACTION_PROMPT.format(text=text[:2000])
-            logger.debug("Sending name extraction request to Gemini API")
-            response = self.model.generate_content(prompt)
-            
-            if not response or not response.text:
-                logger.warning("Empty response from Gemini API for name extraction")
-                return "Unknown"
-            
-            # Clean response
-            response_text = response.text.strip()
-            if response_text.startswith("```"):
-                response_text = response_text.replace("```json", "").replace("```", "").strip()
-            
-            # Parse JSON
-            json_data = json.loads(response_text)
-            extracted_name = json_data.get("name", "Unknown") if isinstance(json_data, dict) else "Unknown"
-            
-            if extracted_name != "Unknown":
-                logger.info(f"Successfully extracted name: {extracted_name}")
-            else:
-                logger.warning("Could not extract valid name from response")
-            
-            return extracted_name
+            prompt = self.EXTRACTION_PROMPT.format(text=self._prompt_text(text))
+            return self._generate_and_parse(text, prompt, self._parse_response, "Unknown")
             
+        except CircuitOpen:
+            logger.warning("Gemini circuit open, skipping name extraction request")
+            return self._degrade(text, "Unknown")
+        except DeadlineExceeded:
+            logger.warning("Resume deadline exceeded during name extraction")
+            return self._degrade(text, "Unknown")
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response from Gemini API: {e}")
+            logger.error("Failed to parse JSON response from Gemini API: %s", e)
             return "Unknown"
         except Exception as e:
-            logger.error(f"Name extraction failed: {e}")
-            return "Unknown"
\ No newline at end of file
+            logger.error("Name extraction failed: %s", e)
+            return self._degrade(text, "Unknown")
+    
+    def _parse_response(self, response_text: str) -> str:
+        if not response_text:
+            logger.warning("Empty response from Gemini API for name extraction")
+            return "Unknown"
+        
+        # Clean response
+        response_text = self._clean_response(response_text)
+        
+        # Parse JSON
+        json_data = json.loads(response_text)
+        extracted_name = json_data.get("name", "Unknown") if isinstance(json_data, dict) else "Unknown"
+        
+        if extracted_name != "Unknown":
+            logger.info("Successfully extracted name: %s", extracted_name)
+        else:
+            logger.warning("Could not extract valid name from response")
+        
+        return extracted_name
\ No newline at end of file
@@ -0,0 +1,213 @@
+"""Map raw skill strings to canonical skills."""
+
+import re
+import logging
+from array import array
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+from .keyword_skills_extractor import DEFAULT_SKILLS
+from ..models.resume_data import ResumeData
+from ..models.skill_pool import SkillPool, default_skill_pool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ALIASES: Dict[str, Sequence[str]] = {
+    "javascript": ("js", "java script", "ecmascript", "es6"),
+    "typescript": ("ts",),
+    "golang": ("go", "go lang"),
+    "c++": ("cpp",),
+    "c#": ("csharp", "c sharp"),
+    ".net": ("dotnet", "dot net"),
+    "node.js": ("node", "nodejs"),
+    "react": ("reactjs", "react.js"),
+    "vue": ("vuejs", "vue.js"),
+    "angular": ("angularjs", "angular.js"),
+    "postgresql": ("postgres", "psql"),
+    "mongodb": ("mongo",),
+    "kubernetes": ("k8s",),
+    "aws": ("amazon web services",),
+    "gcp": ("google cloud", "google cloud platform"),
+    "azure": ("microsoft azure",),
+    "scikit-learn": ("sklearn",),
+    "machine learning": ("ml",),
+    "deep learning": ("dl",),
+    "nlp": ("natural language processing",),
+    "ci/cd": ("continuous integration", "continuous delivery"),
+    "rest api": ("rest", "restful", "rest apis", "restful api"),
+    "power bi": ("powerbi",),
+    "excel": ("microsoft excel", "ms excel"),
+}
+
+_NON_FORM_CHARS = re.compile(r"[^a-z0-9+#]")
+_VERSION_SUFFIX = re.compile(r"[0-9]+")
+
+
+def normal_form(skill: str) -> str:
+    """Lowercase and drop spacing/punctuation: "Java Script" and "javascript" share a form."""
+    return _NON_FORM_CHARS.sub("", skill.lower())
+
+
+def _trigrams(form: str) -> set:
+    padded = f"  {form} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SkillCanonicalizer:
+    """Resolve each raw skill to one canonical name and pooled id.
+
+    Lookup order:
+
+    1. the alias table, keyed by normal form (one dict lookup);
+    2. a trie over the normal forms for a known skill followed only by a
+       version number ("python3", "Angular 2");
+    3. a character-trigram index for misspellings ("kubernets"), accepted
+       when the Dice similarity reaches ``fuzzy_threshold``.
+
+    Anything left unresolved is passed through lowercased with its spacing
+    collapsed. Results are memoized, so a repeated raw string costs a
+    single dict lookup.
+    """
+
+    def __init__(self, vocabulary: Optional[Iterable[str]] = None,
+                 aliases: Optional[Mapping[str, Sequence[str]]] = None,
+                 fuzzy_threshold: float = 0.75, min_fuzzy_length: int = 5,
+                 pool: SkillPool = default_skill_pool, cache_size: int = 100_000):
+        self.fuzzy_threshold = fuzzy_threshold
+        self.min_fuzzy_length = min_fuzzy_length
+        self.pool = pool
+        self.cache_size = cache_size
+        self._forms: Dict[str, str] = {}
+        self._trie: dict = {}
+        self._trigram_index: Dict[str, List[str]] = {}
+        self._trigram_counts: Dict[str, int] = {}
+        self._cache: Dict[str, str] = {}
+        self.stats = {"exact": 0, "version": 0, "fuzzy": 0, "unknown": 0}
+
+        aliases = DEFAULT_ALIASES if aliases is None else aliases
+        for skill in (DEFAULT_SKILLS if vocabulary is None else vocabulary):
+            self.add_skill(skill)
+        for canonical, names in aliases.items():
+            self.add_skill(canonical)
+            for alias in names:
+                self.add_alias(alias, canonical)
+
+    def add_skill(self, skill: str) -> None:
+        canonical = " ".join(skill.lower().split())
+        if canonical:
+            self._register(normal_form(canonical), canonical)
+
+    def add_alias(self, alias: str, canonical: str) -> None:
+        """Resolve ``alias`` (and anything with the same normal form) to ``canonical``."""
+        canonical = " ".join(canonical.lower().split())
+        self._register(normal_form(alias), canonical)
+
+    def canonicalize(self, skill: str) -> str:
+        """Canonical name for ``skill``; empty string for blank input."""
+        cached = self._cache.get(skill)
+        if cached is not None:
+            return cached
+
+        result = self._resolve(skill)
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[skill] = result
+        return result
+
+    def canonical_id(self, skill: str) -> Optional[int]:
+        canonical = self.canonicalize(skill)
+        return self.pool.intern(canonical) if canonical else None
+
+    def canonicalize_all(self, skills: Iterable[str]) -> List[str]:
+        """Canonicalize a list, dropping blanks and duplicates but keeping first-seen order."""
+        seen = set()
+        result = []
+        for skill in skills:
+            if not isinstance(skill, str):
+                continue
+            canonical = self.canonicalize(skill)
+            if canonical and canonical not in seen:
+                seen.add(canonical)
+                result.append(canonical)
+        return result
+
+    def encode(self, skills: Iterable[str]) -> array:
+        """Canonical, deduplicated skill ids for use with CompactResumeData and the pool."""
+        return self.pool.encode(self.canonicalize_all(skills))
+
+    def canonicalize_results(self, results: Iterable[ResumeData]) -> Iterator[ResumeData]:
+        """Bulk pass over stored results; yields new ResumeData with canonical skills."""
+        for result in results:
+            yield ResumeData(name=result.name, email=result.email,
+                             skills=sorted(self.canonicalize_all(result.skills or [])))
+
+    def _register(self, form: str, canonical: str) -> None:
+        if not form:
+            return
+        is_new = form not in self._forms
+        self._forms[form] = canonical
+        self._cache.clear()
+        if not is_new:
+            return
+
+        node = self._trie
+        for char in form:
+            node = node.setdefault(char, {})
+        node[""] = form
+
+        grams = _trigrams(form)
+        self._trigram_counts[form] = len(grams)
+        for gram in grams:
+            self._trigram_index.setdefault(gram, []).append(form)
+
+    def _resolve(self, skill: str) -> str:
+        form = normal_form(skill)
+        if not form:
+            return ""
+
+        canonical = self._forms.get(form)
+        if canonical is not None:
+            self.stats["exact"] += 1
+            return canonical
+
+        canonical = self._versioned(form)
+        if canonical is not None:
+            self.stats["version"] += 1
+            return canonical
+
+        if len(form) >= self.min_fuzzy_length:
+            canonical = self._fuzzy(form)
+            if canonical is not None:
+                self.stats["fuzzy"] += 1
+                logger.debug("Fuzzy-matched skill %r to %r", skill, canonical)
+                return canonical
+
+        self.stats["unknown"] += 1
+        return " ".join(skill.lower().split())
+
+    def _versioned(self, form: str) -> Optional[str]:
+        # Longest known prefix whose remainder is only a version number
+        node = self._trie
+        match = None
+        for position, char in enumerate(form):
+            node = node.get(char)
+            if node is None:
+                break
+            if "" in node and position + 1 < len(form) and _VERSION_SUFFIX.fullmatch(form, position + 1):
+                match = node[""]
+        return self._forms[match] if match is not None else None
+
+    def _fuzzy(self, form: str) -> Optional[str]:
+        grams = _trigrams(form)
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for candidate in self._trigram_index.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+
+        best, best_score = None, 0.0
+        for candidate, count in shared.items():
+            score = 2.0 * count / (len(grams) + self._trigram_counts[candidate])
+            if score > best_score or (score == best_score and best is not None and candidate < best):
+                best, best_score = candidate, score
+        if best is None or best_score < self.fuzzy_threshold:
+            return None
+        return self._forms[best]
@@ -1,15 +1,22 @@
 """Skills extraction using LLM with adaptive section detection."""
 
-import os
 import json
 import logging
-from typing import List
-import google.generativeai as genai
+from typing import List, Optional
+
+from .circuit_breaker import CircuitBreaker, CircuitOpen
+from .gemini_extractor import GeminiExtractor
+from .hedging import HedgePolicy
+from .model_router import ModelRouter
+from .skill_canonicalizer import SkillCanonicalizer
+from ..models.document import Document
+from ..preprocessing.text_compactor import estimate_tokens
+from ..services.deadline import DeadlineExceeded
 
 logger = logging.getLogger(__name__)
 
 
-class SkillsExtractor:
+class SkillsExtractor(GeminiExtractor):
     """Extract skills using LLM from entire resume document."""
     
     EXTRACTION_PROMPT = """
@@ -57,15 +64,14 @@ Resume text:
 {text}
 """
     
-    def __init__(self):
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            logger.error("GEMINI_API_KEY not found in environment")
-            raise ValueError("GEMINI_API_KEY not found in environment")
-        
-        logger.debug("Configuring Gemini API for skills extraction")
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(os.getenv("GEMINI_MODEL_NAME", "gemini-pro"))
+    FIELD_NAME = "skills"
+    
+    def __init__(self, hedge_policy: Optional[HedgePolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None, fallback: Optional[object] = None,
+                 canonicalizer: Optional[SkillCanonicalizer] = None, router: Optional[ModelRouter] = None,
+                 backend: Optional[object] = None):
+        super().__init__(hedge_policy, circuit_breaker, fallback, router, backend)
+        self.canonicalizer = canonicalizer
     
     def extract(self, text: str) -> List[str]:
         if not text:
@@ -73,47 +79,63 @@ Resume text:
             return []
             
         try:
-            prompt = self.EXTRACTION_PROMPT.format(text=text[:6000])
-            logger.debug("Sending skills extraction request to Gemini API")
-            response = self.model.generate_content(prompt)
-            
-            if not response or not response.text:
-                logger.warning("Empty response from Gemini API for skills extraction")
-                return []
-            
-            # Clean response
-            response_text = response.text.strip()
-            if response_text.startswith("```"):
-                response_text = response_text.replace("```json", "").replace("```", "").strip()
-            
-            # Parse JSON
-            json_data = json.loads(response_text)
-            
-            if isinstance(json_data, dict) and "skills" in json_data:
-                skills_list = json_data["skills"]
-                if isinstance(skills_list, list):
-                    # Clean and validate skills
-                    cleaned_skills = []
-                    for skill in skills_list:
-                        if isinstance(skill, str) and skill.strip():
-                            cleaned_skill = skill.strip().lower()
-                            if (cleaned_skill not in cleaned_skills and 
-                                len(cleaned_skill) > 1 and 
-                                len(cleaned_skill) < 50):
-                                cleaned_skills.append(cleaned_skill)
-                    
-                    logger.info(f"Successfully extracted {len(cleaned_skills)} skills")
-                    return sorted(cleaned_skills)
-                else:
-                    logger.warning("Skills data is not a list in API response")
-            else:
-                logger.warning("Missing 'skills' key in API response")
-            
-            return []
+            prompt = self.EXTRACTION_PROMPT.format(text=self._excerpt(text))
+            return self._generate_and_parse(text, prompt, self._parse_response, [])
             
+        except CircuitOpen:
+            logger.warning("Gemini circuit open, skipping skills extraction request")
+            return self._degrade(text, [])
+        except DeadlineExceeded:
+            logger.warning("Resume deadline exceeded during skills extraction")
+            return self._degrade(text, [])
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response from Gemini API: {e}")
+            logger.error("Failed to parse JSON response from Gemini API: %s", e)
             return []
         except Exception as e:
-            logger.error(f"Skills extraction failed: {e}")
-            return []
\ No newline at end of file
+            logger.error("Skills extraction failed: %s", e)
+            return self._degrade(text, [])
+    
+    def _excerpt(self, text: str) -> str:
+        """Text within the prompt token budget, keeping a skills section that starts past the cut-off."""
+        head = self._prompt_text(text)
+        if not isinstance(text, Document) or len(head) == len(text):
+            return head
+        span = text.sections.get("skills")
+        if span is None or span[0] < len(head):
+            return head
+        skills = self._prompt_text(text.section("skills"), self.PROMPT_MAX_TOKENS // 3)
+        return self._prompt_text(text, self.PROMPT_MAX_TOKENS - estimate_tokens(skills) - 1) + "\n\n" + skills
+    
+    def _parse_response(self, response_text: str) -> List[str]:
+        if not response_text:
+            logger.warning("Empty response from Gemini API for skills extraction")
+            return []
+        
+        # Clean response
+        response_text = self._clean_response(response_text)
+        
+        # Parse JSON
+        json_data = json.loads(response_text)
+        
+        if isinstance(json_data, dict) and "skills" in json_data:
+            skills_list = json_data["skills"]
+            if isinstance(skills_list, list):
+                # Clean and validate skills
+                cleaned_skills = set()
+                for skill in skills_list:
+                    if isinstance(skill, str) and skill.strip():
+                        if self.canonicalizer is not None:
+                            cleaned_skill = self.canonicalizer.canonicalize(skill)
+                        else:
+                            cleaned_skill = skill.strip().lower()
+                        if 1 < len(cleaned_skill) < 50:
+                            cleaned_skills.add(cleaned_skill)
+                
+                logger.info("Successfully extracted %d skills", len(cleaned_skills))
+                return sorted(cleaned_skills)
+            else:
+                logger.warning("Skills data is not a list in API response")
+        else:
+            logger.warning("Missing 'skills' key in API response")
+        
+        return []
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""Memory-compact resume record for large in-memory batches."""
+
+import json
+from array import array
+from typing import List, Optional
+
+from .resume_data import ResumeData
+from .skill_pool import SkillPool, default_skill_pool
+
+
+class CompactResumeData:
+    """ResumeData variant that stores skills as pooled ids.
+
+    Behaves like ResumeData for reading and serialization; ``skills`` is
+    decoded from the shared SkillPool on access.
+    """
+
+    __slots__ = ("name", "email", "_skill_ids", "_pool")
+
+    def __init__(self, name: str, email: str, skills: Optional[List[str]],
+                 pool: SkillPool = default_skill_pool):
+        self.name = name
+        self.email = email
+        self._pool = pool
+        self._skill_ids = pool.encode(skills) if skills is not None else None
+
+    @classmethod
+    def from_resume_data(cls, data: ResumeData, pool: SkillPool = default_skill_pool) -> "CompactResumeData":
+        return cls(data.name, data.email, data.skills, pool)
+
+    @property
+    def skills(self) -> Optional[List[str]]:
+        if self._skill_ids is None:
+            return None
+        return self._pool.decode(self._skill_ids)
+
+    @property
+    def skill_ids(self) -> Optional[array]:
+        return self._skill_ids
+
+    def to_resume_data(self) -> ResumeData:
+        return ResumeData(name=self.name, email=self.email, skills=self.skills)
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "email": self.email, "skills": self.skills}
+
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (CompactResumeData, ResumeData)):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CompactResumeData(name={self.name!r}, email={self.email!r}, skills={self.skills!r})"
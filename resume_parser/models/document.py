@@ -0,0 +1,117 @@
+"""Parsed resume text with lazily computed structure shared by all extractors."""
+
+import re
+from bisect import bisect_right
+from functools import cached_property
+from typing import Dict, List, Optional, Pattern, Tuple, Union
+
+from ..preprocessing.text_compactor import estimate_tokens
+
+# Short lines shaped like headings: "EXPERIENCE", "Publications:"
+HEADING_PATTERN = re.compile(r"^(?:[A-Z][A-Z &/]{2,39}|[A-Z][A-Za-z &/]{2,39}:)$")
+
+SECTION_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "summary": ("summary", "professional summary", "profile", "objective", "about me"),
+    "skills": ("skills", "technical skills", "core competencies", "competencies", "key skills", "tools"),
+    "experience": ("experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history"),
+    "education": ("education", "academic background", "qualifications"),
+    "projects": ("projects", "personal projects"),
+    "certifications": ("certifications", "certificates", "licenses"),
+    "publications": ("publications",),
+}
+
+_SECTION_BY_HEADING = {alias: name for name, aliases in SECTION_ALIASES.items() for alias in aliases}
+# "Skills: Python, SQL" - a known heading with its body on the same line
+_INLINE_HEADING = re.compile(r"\s*([A-Za-z][A-Za-z &/]{1,39}):[ \t]*(?=\S)")
+_NEWLINE = re.compile("\n")
+
+
+class Document(str):
+    """Resume text plus line offsets, sections, token counts and regex matches.
+
+    A ``str`` subclass, so extractors written against plain text keep
+    working; slicing or transforming it returns a plain ``str``. Every
+    derived value is computed on first use and cached on the instance, so
+    extractors share one pass over the text instead of each doing its own.
+    """
+
+    def __new__(cls, text: str, source_path: Optional[str] = None) -> "Document":
+        document = super().__new__(cls, text)
+        document.source_path = source_path
+        return document
+
+    @cached_property
+    def line_offsets(self) -> List[int]:
+        """Start offset of every line."""
+        return [0] + [match.end() for match in _NEWLINE.finditer(self)]
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_offsets)
+
+    def line(self, index: int) -> str:
+        offsets = self.line_offsets
+        end = offsets[index + 1] - 1 if index + 1 < len(offsets) else len(self)
+        return str.__getitem__(self, slice(offsets[index], end))
+
+    def line_number(self, offset: int) -> int:
+        """Index of the line containing ``offset``."""
+        return bisect_right(self.line_offsets, offset) - 1
+
+    @cached_property
+    def headings(self) -> List[Tuple[int, str, int]]:
+        """``(line index, heading, body offset)`` for every line that looks like a section heading."""
+        found = []
+        offsets = self.line_offsets
+        for index in range(self.line_count):
+            raw = self.line(index)
+            line = raw.strip()
+            if not line:
+                continue
+            if len(line) <= 40 and (HEADING_PATTERN.match(line) or line.rstrip(":").lower() in _SECTION_BY_HEADING):
+                found.append((index, line, offsets[index + 1] if index + 1 < len(offsets) else len(self)))
+                continue
+            inline = _INLINE_HEADING.match(raw)
+            if inline and inline.group(1).lower() in _SECTION_BY_HEADING:
+                found.append((index, inline.group(1), offsets[index] + inline.end()))
+        return found
+
+    @cached_property
+    def sections(self) -> Dict[str, Tuple[int, int]]:
+        """Character span of each known section's body, keyed by canonical name.
+
+        A body runs from just after its heading to the next heading. The
+        first occurrence of a section wins.
+        """
+        spans = {}
+        headings = self.headings
+        for position, (index, heading, start) in enumerate(headings):
+            name = _SECTION_BY_HEADING.get(heading.rstrip(":").lower())
+            if name is None or name in spans:
+                continue
+            end = self.line_offsets[headings[position + 1][0]] if position + 1 < len(headings) else len(self)
+            spans[name] = (start, end)
+        return spans
+
+    def section(self, name: str) -> str:
+        """Body of section ``name`` ("skills", "experience", ...), or "" when absent."""
+        span = self.sections.get(name)
+        return str.__getitem__(self, slice(*span)).strip() if span else ""
+
+    @cached_property
+    def token_count(self) -> int:
+        """Approximate LLM token count (about four characters per token)."""
+        return estimate_tokens(self)
+
+    def findall(self, pattern: Union[str, Pattern]) -> Tuple:
+        """``re.findall`` over the whole text, cached per pattern."""
+        cache = self.__dict__.setdefault("_matches", {})
+        matches = cache.get(pattern)
+        if matches is None:
+            compiled = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, re.UNICODE)
+            matches = cache[pattern] = tuple(compiled.findall(self))
+        return matches
+
+    def __reduce__(self):
+        return Document, (str(self), self.source_path)
@@ -0,0 +1,80 @@
+"""Resume record whose fields are extracted on first access."""
+
+import json
+import threading
+from typing import Callable, Dict, List, Optional
+
+from .resume_data import ResumeData
+
+FIELDS = ("name", "email", "skills")
+
+
+class LazyResumeData:
+    """ResumeData variant that runs each extractor only when its field is read.
+
+    Keeps the parsed text until every field has been computed, then drops
+    it. Each value is memoized; concurrent readers of the same field wait
+    for one extraction instead of paying for a second LLM call.
+    """
+
+    __slots__ = ("_text", "_extract", "_values", "_lock")
+
+    def __init__(self, text: str, extract: Callable[[str, str], object]):
+        self._text = text
+        self._extract = extract
+        self._values: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self._get("name")
+
+    @property
+    def email(self) -> str:
+        return self._get("email")
+
+    @property
+    def skills(self) -> Optional[List[str]]:
+        return self._get("skills")
+
+    @property
+    def computed(self) -> List[str]:
+        """Fields extracted so far."""
+        return [field for field in FIELDS if field in self._values]
+
+    @property
+    def text(self) -> Optional[str]:
+        """The retained parsed text; None once every field is computed."""
+        return self._text
+
+    def _get(self, field: str) -> object:
+        try:
+            return self._values[field]
+        except KeyError:
+            pass
+        with self._lock:
+            if field not in self._values:
+                self._values[field] = self._extract(field, self._text)
+                if len(self._values) == len(FIELDS):
+                    self._text = None
+            return self._values[field]
+
+    def to_resume_data(self) -> ResumeData:
+        return ResumeData(name=self.name, email=self.email, skills=self.skills)
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "email": self.email, "skills": self.skills}
+
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (LazyResumeData, ResumeData)):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        # Never triggers extraction
+        shown = ", ".join(f"{field}={self._values[field]!r}" if field in self._values else f"{field}=<pending>"
+                          for field in FIELDS)
+        return f"LazyResumeData({shown})"
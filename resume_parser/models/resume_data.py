@@ -8,6 +8,8 @@ import json
 @dataclass
 class ResumeData:
     """Structured resume information."""
+    __slots__ = ("name", "email", "skills")
+    
     name: str
     email: str
     skills: List[str]
@@ -0,0 +1,52 @@
+"""Shared intern pool for skill strings."""
+
+import threading
+from array import array
+from typing import Dict, Iterable, List
+
+
+class SkillPool:
+    """Map each distinct skill string to a small integer id and back.
+
+    Large batches repeat the same few thousand skills millions of times;
+    storing ids (4 bytes each in an ``array``) instead of per-resume string
+    objects keeps memory proportional to the vocabulary, not the corpus.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._skills: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def intern(self, skill: str) -> int:
+        """Return the id for ``skill``, adding it to the pool if new."""
+        skill_id = self._ids.get(skill)
+        if skill_id is not None:
+            return skill_id
+        with self._lock:
+            skill_id = self._ids.get(skill)
+            if skill_id is None:
+                skill_id = len(self._skills)
+                self._skills.append(skill)
+                self._ids[skill] = skill_id
+            return skill_id
+
+    def lookup(self, skill_id: int) -> str:
+        return self._skills[skill_id]
+
+    def canonical(self, skill: str) -> str:
+        """Return the pooled string object equal to ``skill``."""
+        return self._skills[self.intern(skill)]
+
+    def encode(self, skills: Iterable[str]) -> array:
+        return array("I", (self.intern(skill) for skill in skills))
+
+    def decode(self, skill_ids: Iterable[int]) -> List[str]:
+        skills = self._skills
+        return [skills[skill_id] for skill_id in skill_ids]
+
+
+default_skill_pool = SkillPool()
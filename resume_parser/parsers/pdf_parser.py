@@ -1,48 +1,155 @@
 """PDF file parser implementation."""
 
 import pdfplumber
+import io
 import os
 import logging
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from ..services.profiling import acquire_tracemalloc, release_tracemalloc
 
 logger = logging.getLogger(__name__)
 
 
+class DocumentTooLarge(ValueError):
+    """Raised when a document exceeds the parser's size or page limits."""
+
+
+@dataclass
+class PDFParseStats:
+    """What a single parse read and how much memory it needed."""
+    file_bytes: int
+    pages_total: int
+    pages_parsed: int
+    characters: int
+    truncated: bool = False
+    peak_memory_bytes: Optional[int] = None
+
+
 class PDFParser:
-    """Parser for PDF files using pdfplumber."""
+    """Parser for PDF files using pdfplumber.
+    
+    Each page's cached layout objects are released as soon as its text has
+    been taken, so memory stays roughly one page deep regardless of page
+    count. ``max_bytes`` rejects oversized files before they are opened;
+    ``max_pages`` either truncates (``page_policy="truncate"``) or rejects
+    (``"reject"``) longer documents. With ``track_memory`` the peak Python
+    allocation during each parse is measured with tracemalloc and logged;
+    the figure is process-wide, so it is only exact with one parse at a time.
+    """
+    
+    PAGE_POLICIES = ("truncate", "reject")
+    
+    def __init__(self, max_pages: Optional[int] = None, max_bytes: Optional[int] = None,
+                 page_policy: str = "truncate", track_memory: bool = False):
+        if page_policy not in self.PAGE_POLICIES:
+            raise ValueError(f"Unsupported page policy: {page_policy}. Supported: {list(self.PAGE_POLICIES)}")
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.page_policy = page_policy
+        self.track_memory = track_memory
     
     def parse(self, file_path: str) -> str:
         """Extract text from a PDF file."""
-        logger.info(f"Starting PDF parsing for: {file_path}")
+        return self.parse_with_stats(file_path)[0]
+    
+    def parse_bytes(self, data: bytes, name: str = "<bytes>") -> str:
+        """Extract text from PDF content that was already read into memory."""
+        logger.info("Starting PDF parsing for: %s", name)
+        return self._parse_source(io.BytesIO(data), name, len(data))[0]
+    
+    def parse_with_stats(self, file_path: str) -> Tuple[str, PDFParseStats]:
+        """Extract text from a PDF file and report pages read and peak memory."""
+        logger.info("Starting PDF parsing for: %s", file_path)
         
         if not os.path.exists(file_path):
-            logger.error(f"PDF file not found: {file_path}")
+            logger.error("PDF file not found: %s", file_path)
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        return self._parse_source(file_path, file_path, os.path.getsize(file_path))
+    
+    def _parse_source(self, source, file_path: str, file_bytes: int) -> Tuple[str, PDFParseStats]:
+        if self.max_bytes is not None and file_bytes > self.max_bytes:
+            logger.error("PDF %s is %d bytes, limit is %d", file_path, file_bytes, self.max_bytes)
+            raise DocumentTooLarge(f"PDF is {file_bytes} bytes, limit is {self.max_bytes}")
+        
+        if self.track_memory:
+            # Reference-counted with profile sessions, so an active session keeps its tracing
+            acquire_tracemalloc()
+            tracemalloc.reset_peak()
+        
+        try:
+            text, stats = self._extract(source, file_path, file_bytes)
+            if self.track_memory:
+                stats.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+        finally:
+            if self.track_memory:
+                release_tracemalloc()
+        
+        peak = f", peak memory {stats.peak_memory_bytes / 1024 / 1024:.1f} MiB" if stats.peak_memory_bytes else ""
+        logger.info("Successfully extracted %d characters from %d/%d pages%s",
+                    stats.characters, stats.pages_parsed, stats.pages_total, peak)
+        return text, stats
+    
+    def _extract(self, source, file_path: str, file_bytes: int) -> Tuple[str, PDFParseStats]:
         text_content = []
         
         try:
-            with pdfplumber.open(file_path) as pdf:
-                logger.debug(f"PDF opened successfully, processing {len(pdf.pages)} pages")
+            with pdfplumber.open(source) as pdf:
+                pages_total = len(pdf.pages)
+                logger.debug("PDF opened successfully, processing %d pages", pages_total)
+                
+                pages_to_read = pages_total
+                if self.max_pages is not None and pages_total > self.max_pages:
+                    if self.page_policy == "reject":
+                        raise DocumentTooLarge(f"PDF has {pages_total} pages, limit is {self.max_pages}")
+                    logger.warning("PDF has %d pages, only the first %d will be parsed", pages_total, self.max_pages)
+                    pages_to_read = self.max_pages
                 
-                for page_num, page in enumerate(pdf.pages, 1):
-                    page_text = page.extract_text()
+                # Per-page records use lazy %-style args and are skipped outright unless DEBUG is on
+                debug = logger.isEnabledFor(logging.DEBUG)
+                for page_num, page in enumerate(pdf.pages[:pages_to_read], 1):
+                    try:
+                        page_text = page.extract_text()
+                    finally:
+                        # Drop the page's cached layout objects before moving on
+                        _release_page(page)
                     if page_text:
                         text_content.append(page_text)
-                        logger.debug(f"Extracted text from page {page_num}")
+                        if debug:
+                            logger.debug("Extracted text from page %d", page_num)
                     else:
-                        logger.warning(f"No text found on page {page_num}")
-        
+                        logger.warning("No text found on page %d", page_num)
+            
             if not text_content:
-                logger.error(f"No text content could be extracted from PDF: {file_path}")
+                logger.error("No text content could be extracted from PDF: %s", file_path)
                 raise ValueError("No text content could be extracted from PDF")
             
-            total_chars = len("\n\n".join(text_content))
-            logger.info(f"Successfully extracted {total_chars} characters from {len(text_content)} pages")
-            
-            return "\n\n".join(text_content)
-            
+            text = "\n\n".join(text_content)
+            stats = PDFParseStats(
+                file_bytes=file_bytes,
+                pages_total=pages_total,
+                pages_parsed=pages_to_read,
+                characters=len(text),
+                truncated=pages_to_read < pages_total,
+            )
+            return text, stats
+        
+        except DocumentTooLarge:
+            logger.error("Rejected PDF %s: too many pages", file_path)
+            raise
         except Exception as e:
             if "No text content could be extracted" in str(e):
                 raise  # Re-raise our custom error
-            logger.error(f"Error parsing PDF {file_path}: {e}")
-            raise
\ No newline at end of file
+            logger.error("Error parsing PDF %s: %s", file_path, e)
+            raise
+
+
+def _release_page(page) -> None:
+    # Page.close() only exists from pdfplumber 0.11; this is what it does, and works on 0.10 too
+    page.flush_cache()
+    textmap = getattr(page, "get_textmap", None)
+    if textmap is not None and hasattr(textmap, "cache_clear"):
+        textmap.cache_clear()
@@ -1,5 +1,6 @@
 """Word document parser implementation."""
 
+import io
 import os
 import logging
 from docx import Document
@@ -12,14 +13,22 @@ class WordParser:
     
     def parse(self, file_path: str) -> str:
         """Extract text from a Word document."""
-        logger.info(f"Starting Word document parsing for: {file_path}")
+        logger.info("Starting Word document parsing for: %s", file_path)
         
         if not os.path.exists(file_path):
-            logger.error(f"Word document not found: {file_path}")
+            logger.error("Word document not found: %s", file_path)
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        return self._parse_document(file_path, file_path)
+    
+    def parse_bytes(self, data: bytes, name: str = "<bytes>") -> str:
+        """Extract text from Word content that was already read into memory."""
+        logger.info("Starting Word document parsing for: %s", name)
+        return self._parse_document(io.BytesIO(data), name)
+    
+    def _parse_document(self, source, file_path: str) -> str:
         try:
-            doc = Document(file_path)
+            doc = Document(source)
             text_content = []
             
             # Extract from paragraphs
@@ -29,7 +38,7 @@ class WordParser:
                     text_content.append(paragraph.text.strip())
                     paragraph_count += 1
             
-            logger.debug(f"Extracted text from {paragraph_count} paragraphs")
+            logger.debug("Extracted text from %d paragraphs", paragraph_count)
             
             # Extract from tables
             table_count = 0
@@ -44,19 +53,19 @@ class WordParser:
                         table_count += 1
             
             if table_count > 0:
-                logger.debug(f"Extracted text from {table_count} table rows")
+                logger.debug("Extracted text from %d table rows", table_count)
             
             if not text_content:
-                logger.error(f"No text content could be extracted from Word document: {file_path}")
+                logger.error("No text content could be extracted from Word document: %s", file_path)
                 raise ValueError("No text content could be extracted from Word document")
             
             total_chars = len("\n".join(text_content))
-            logger.info(f"Successfully extracted {total_chars} characters from Word document")
+            logger.info("Successfully extracted %d characters from Word document", total_chars)
             
             return "\n".join(text_content)
             
         except Exception as e:
             if "No text content could be extracted" in str(e):
                 raise  # Re-raise our custom error
-            logger.error(f"Error parsing Word document {file_path}: {e}")
+            logger.error("Error parsing Word document %s: %s", file_path, e)
             raise
\ No newline at end of file
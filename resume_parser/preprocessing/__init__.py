@@ -0,0 +1 @@
+# Preprocessing package
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""Compact parser output before it is sent to LLM extractors."""
+
+import re
+import math
+import threading
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_INLINE_WHITESPACE = re.compile(r"[ \t\u00a0\u2000-\u200b\u3000]+")
+_TABLE_SEPARATOR = re.compile(r"\s*\|\s*")
+# "Page 2", "Page 2 of 3", "2 of 3", "2/3"; a bare number may be a year or a GPA, so it is kept
+_PAGE_MARKER = re.compile(r"^(?:page\s*\d{1,4}(?:\s*(?:of|/)\s*\d{1,4})?|\d{1,4}\s*(?:of|/)\s*\d{1,4})$",
+                          re.IGNORECASE)
+# Lines at each end of a page that are checked for header/footer boilerplate
+_EDGE_LINES = 2
+
+
+def estimate_tokens(text: str, chars_per_token: float = 4.0) -> int:
+    """Approximate LLM token count (roughly four characters per token for English)."""
+    if not text:
+        return 0
+    return math.ceil(len(text) / chars_per_token)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, chars_per_token: float = 4.0) -> str:
+    """Cut ``text`` to about ``max_tokens`` tokens, on a line boundary where possible."""
+    if not text or estimate_tokens(text, chars_per_token) <= max_tokens:
+        return text
+    kept, _ = _fit_lines(text.split("\n"), max_tokens * chars_per_token)
+    return "\n".join(kept)
+
+
+def _fit_lines(lines: List[str], budget: float) -> Tuple[List[str], bool]:
+    """Whole lines within ``budget`` characters; a first line that alone exceeds it is sliced."""
+    kept: List[str] = []
+    used = 0
+    for line in lines:
+        cost = len(line) + 1
+        if used + cost > budget:
+            if not kept:
+                kept.append(line[:int(budget)])
+            return kept, True
+        kept.append(line)
+        used += cost
+    return kept, False
+
+
+@dataclass
+class CompactionResult:
+    """Compacted text plus before/after token estimates."""
+    text: str
+    original_tokens: int
+    compacted_tokens: int
+    truncated: bool = False
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.original_tokens - self.compacted_tokens
+
+    @property
+    def savings_ratio(self) -> float:
+        return self.tokens_saved / self.original_tokens if self.original_tokens else 0.0
+
+
+class TextCompactor:
+    """Strip whitespace, table noise and page boilerplate, then cut to a token budget.
+
+    Pages are split on form feeds and page-number lines ("Page 2 of 3",
+    "2/3"), which are dropped. A line found in the top or bottom two lines of
+    more than one page is a header/footer: only its first copy is kept (often
+    the candidate's name and contact line), compared case-insensitively after
+    whitespace collapsing. Lines repeated in the body of the text, such as a
+    job title or a skill listed under two roles, are left alone. With ``max_tokens``, text is truncated on line
+    boundaries once the budget is reached; as a framework normalizer that
+    cuts what every extractor sees, including regex ones, so it is off by
+    default (the LLM extractors bound their own prompts).
+    """
+
+    def __init__(self, max_tokens: Optional[int] = None, chars_per_token: float = 4.0):
+        if max_tokens is not None and max_tokens < 1:
+            raise ValueError("max_tokens must be positive")
+
+        self.max_tokens = max_tokens
+        self.chars_per_token = chars_per_token
+        self._lock = threading.Lock()
+        self.resumes = 0
+        self.total_original_tokens = 0
+        self.total_compacted_tokens = 0
+
+    def __call__(self, text: str) -> str:
+        """Compact ``text`` and log the savings; usable as a framework normalizer."""
+        result = self.compact(text)
+        with self._lock:
+            self.resumes += 1
+            self.total_original_tokens += result.original_tokens
+            self.total_compacted_tokens += result.compacted_tokens
+
+        logger.info("Compacted resume text from ~%d to ~%d tokens (%.0f%% saved%s)",
+                    result.original_tokens, result.compacted_tokens, result.savings_ratio * 100,
+                    ", truncated" if result.truncated else "")
+        return result.text
+
+    def compact(self, text: str) -> CompactionResult:
+        if not text:
+            return CompactionResult(text=text or "", original_tokens=0, compacted_tokens=0)
+
+        original_tokens = estimate_tokens(text, self.chars_per_token)
+        lines = self._clean_lines(text)
+
+        truncated = False
+        if self.max_tokens:
+            lines, truncated = _fit_lines(lines, self.max_tokens * self.chars_per_token)
+
+        while lines and not lines[-1]:
+            lines.pop()
+        compacted = "\n".join(lines)
+        return CompactionResult(
+            text=compacted,
+            original_tokens=original_tokens,
+            compacted_tokens=estimate_tokens(compacted, self.chars_per_token),
+            truncated=truncated,
+        )
+
+    def _clean_lines(self, text: str) -> List[str]:
+        pages = self._split_pages(text)
+        boilerplate = self._boilerplate(pages) if len(pages) > 1 else set()
+
+        lines: List[str] = []
+        seen = set()
+        for page in pages:
+            if lines and page and lines[-1]:
+                lines.append("")
+            edges = _edge_indexes(page)
+            for index, line in enumerate(page):
+                key = line.casefold()
+                if index in edges and key in boilerplate:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                lines.append(line)
+
+        while lines and not lines[-1]:
+            lines.pop()
+        return lines
+
+    @staticmethod
+    def _split_pages(text: str) -> List[List[str]]:
+        """Cleaned lines per page; blank runs collapse to one line, page-number lines end a page."""
+        pages: List[List[str]] = []
+        for sheet in text.split("\f"):
+            page: List[str] = []
+            for raw_line in sheet.splitlines():
+                line = _TABLE_SEPARATOR.sub(", ", raw_line) if "|" in raw_line else raw_line
+                line = _INLINE_WHITESPACE.sub(" ", line).strip(" ,")
+
+                if _PAGE_MARKER.match(line):
+                    pages.append(page)
+                    page = []
+                elif line or (page and page[-1]):
+                    # Keep single blank lines as section breaks
+                    page.append(line)
+            pages.append(page)
+
+        for page in pages:
+            while page and not page[-1]:
+                page.pop()
+        return [page for page in pages if page]
+
+    @staticmethod
+    def _boilerplate(pages: List[List[str]]) -> Set[str]:
+        """Casefolded lines that sit at the top or bottom of two or more pages."""
+        counts: Dict[str, int] = {}
+        for page in pages:
+            for key in {page[index].casefold() for index in _edge_indexes(page)}:
+                counts[key] = counts.get(key, 0) + 1
+        return {key for key, count in counts.items() if count > 1}
+
+
+def _edge_indexes(page: List[str]) -> Set[int]:
+    """Indexes of the first and last ``_EDGE_LINES`` non-blank lines of a page."""
+    filled = [index for index, line in enumerate(page) if line]
+    return set(filled[:_EDGE_LINES] + filled[-_EDGE_LINES:])
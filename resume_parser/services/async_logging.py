@@ -0,0 +1,149 @@
+"""Non-blocking logging: queue handlers, lazy arguments and sampled debug records."""
+
+import os
+import atexit
+import queue
+import logging
+import threading
+import logging.handlers
+from typing import Callable, Iterable, Optional
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread when it is safe.
+
+    The stock handler merges ``msg % args`` on the logging thread. This one
+    defers that merge when every argument is an immutable scalar (str,
+    numbers, bool, None) or a ``Lazy``, so the common hot-path records cost
+    a queue put and nothing else. Records with any other argument (a list,
+    dict, custom object) are formatted at once, since the caller could change
+    the argument before the listener gets to it; a ``Lazy`` in such a record
+    is then evaluated on the calling thread too. Exception tracebacks are
+    always rendered before queueing.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args and not _safe_to_defer(record.args):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class SamplingFilter(logging.Filter):
+    """Pass every ``every``-th record at or below ``level``; higher levels always pass."""
+
+    def __init__(self, every: int = 100, level: int = logging.DEBUG):
+        super().__init__()
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.every = every
+        self.level = level
+        self._seen = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.level:
+            return True
+        with self._lock:
+            self._seen += 1
+            return (self._seen - 1) % self.every == 0
+
+
+class Lazy:
+    """Defer an expensive log argument until a handler actually formats it.
+
+    ``logger.debug("Layout: %s", Lazy(lambda: dump(page)))``
+    """
+
+    __slots__ = ("_fn",)
+
+    def __init__(self, fn: Callable[[], object]):
+        self._fn = fn
+
+    def __str__(self) -> str:
+        return str(self._fn())
+
+    def __repr__(self) -> str:
+        return repr(self._fn())
+
+
+_IMMUTABLE_ARGS = (str, int, float, complex, bool, bytes, type(None), Lazy)
+
+
+def _safe_to_defer(args) -> bool:
+    values = args.values() if isinstance(args, dict) else args
+    return all(type(value) in _IMMUTABLE_ARGS for value in values)
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_lock = threading.Lock()
+
+
+def configure_async_logging(handlers: Iterable[logging.Handler], level: str = "INFO",
+                            fmt: str = DEFAULT_FORMAT, max_queue: int = 0,
+                            debug_sample_every: Optional[int] = None) -> logging.handlers.QueueListener:
+    """Route the root logger through a queue to ``handlers`` on a background thread.
+
+    Replaces any handlers already on the root logger. ``max_queue`` bounds the
+    queue (0 = unbounded; when full, callers block rather than drop records).
+    ``debug_sample_every`` keeps one in N DEBUG records. The listener is
+    flushed and stopped at interpreter exit, or by ``stop_async_logging``.
+    """
+    global _listener
+    formatter = logging.Formatter(fmt)
+    handlers = list(handlers)
+    for handler in handlers:
+        if handler.formatter is None:
+            handler.setFormatter(formatter)
+
+    record_queue = queue.Queue(maxsize=max_queue)
+    queue_handler = DeferredQueueHandler(record_queue)
+    if debug_sample_every is not None:
+        queue_handler.addFilter(SamplingFilter(every=debug_sample_every))
+
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+        root = logging.getLogger()
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(queue_handler)
+        root.setLevel(level)
+        _listener = logging.handlers.QueueListener(record_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        return _listener
+
+
+def stop_async_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def _restart_after_fork() -> None:
+    # A forked child inherits the queue handler but not the listener thread,
+    # so its records would pile up unwritten; give it its own queue and listener
+    global _listener, _lock
+    _lock = threading.Lock()
+    if _listener is None:
+        return
+    record_queue = queue.Queue(maxsize=_listener.queue.maxsize)
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, DeferredQueueHandler):
+            handler.queue = record_queue
+    _listener = logging.handlers.QueueListener(record_queue, *_listener.handlers,
+                                               respect_handler_level=_listener.respect_handler_level)
+    _listener.start()
+
+
+atexit.register(stop_async_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
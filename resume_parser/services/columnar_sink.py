@@ -0,0 +1,136 @@
+"""Columnar Parquet / Arrow IPC export for batch results."""
+
+import threading
+import logging
+from typing import Iterable, Iterator, Optional
+
+from ..models.resume_data import ResumeData
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency, only needed for columnar export
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("pyarrow is required for columnar export: pip install pyarrow")
+
+
+class ColumnarResultWriter:
+    """Buffer ResumeData records and write them out in row groups.
+
+    At most ``row_group_size`` records are held in memory; each full buffer
+    becomes one Parquet row group (or one Arrow record batch). Skills are a
+    ``list<string>`` column; with ``dictionary_encoding`` (the default for
+    Parquet) the repeated skill strings are stored once per column chunk.
+    Arrow IPC files allow only one dictionary per column for the whole
+    file, which a streaming writer cannot know up front, so asking for
+    dictionary encoding with ``format="arrow"`` raises ValueError.
+    """
+
+    FORMATS = ("parquet", "arrow")
+
+    def __init__(self, path: str, format: str = "parquet", row_group_size: int = 50_000,
+                 dictionary_encoding: Optional[bool] = None, compression: Optional[str] = "zstd"):
+        _require_pyarrow()
+        if format not in self.FORMATS:
+            raise ValueError(f"Unsupported format: {format}. Supported: {list(self.FORMATS)}")
+        if dictionary_encoding is None:
+            dictionary_encoding = format == "parquet"
+        if dictionary_encoding and format == "arrow":
+            raise ValueError("dictionary_encoding is only supported for parquet: Arrow IPC files "
+                             "need a single dictionary per column across all record batches")
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be positive")
+
+        self.path = path
+        self.format = format
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        self.schema = pa.schema([
+            ("source_path", pa.string()),
+            ("name", pa.string()),
+            ("email", pa.string()),
+            ("skills", pa.list_(pa.string())),
+        ])
+        self._lock = threading.Lock()
+        self._reset_buffer()
+
+        if format == "parquet":
+            self._writer = pq.ParquetWriter(path, self.schema, compression=compression,
+                                            use_dictionary=dictionary_encoding)
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=compression)
+            self._writer = pa.ipc.new_file(path, self.schema, options=options)
+
+    def write(self, record: ResumeData, source_path: Optional[str] = None) -> None:
+        with self._lock:
+            self._buffer["source_path"].append(source_path)
+            self._buffer["name"].append(record.name)
+            self._buffer["email"].append(record.email)
+            self._buffer["skills"].append(record.skills)
+            if len(self._buffer["name"]) >= self.row_group_size:
+                self._flush_locked()
+
+    def write_many(self, records: Iterable[ResumeData]) -> None:
+        for record in records:
+            self.write(record)
+
+    def pipeline_sink(self, item) -> None:
+        """Sink for build_resume_pipeline: write successful results, skip failures."""
+        if item.error is None and item.result is not None:
+            self.write(item.result, item.path)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._writer.close()
+        logger.info(f"Wrote {self.rows_written} results to {self.path}")
+
+    def __enter__(self) -> "ColumnarResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _flush_locked(self) -> None:
+        rows = len(self._buffer["name"])
+        if not rows:
+            return
+        batch = pa.RecordBatch.from_pydict(self._buffer, schema=self.schema)
+        if self.format == "parquet":
+            self._writer.write_batch(batch, row_group_size=rows)
+        else:
+            self._writer.write_batch(batch)
+        self.rows_written += rows
+        self._reset_buffer()
+
+    def _reset_buffer(self) -> None:
+        self._buffer = {"source_path": [], "name": [], "email": [], "skills": []}
+
+
+def read_results(path: str, batch_size: int = 65_536) -> Iterator[ResumeData]:
+    """Stream ResumeData back from a file written by ColumnarResultWriter."""
+    _require_pyarrow()
+    with open(path, "rb") as f:
+        is_parquet = f.read(4) == b"PAR1"
+
+    if is_parquet:
+        batches = pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=["name", "email", "skills"])
+    else:
+        reader = pa.ipc.open_file(path)
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+
+    for batch in batches:
+        columns = batch.to_pydict()
+        for name, email, skills in zip(columns["name"], columns["email"], columns["skills"]):
+            yield ResumeData(name=name, email=email, skills=skills)
@@ -0,0 +1,56 @@
+"""Per-resume latency deadlines."""
+
+import time
+import contextvars
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class DeadlineExceeded(Exception):
+    """Raised when work is abandoned because the resume's deadline passed.
+
+    ``in_flight`` is True when a request had already been sent and the
+    deadline ran out waiting for its answer, and False when the work was
+    never started.
+    """
+
+    def __init__(self, message: str = "Resume deadline exceeded", in_flight: bool = False):
+        super().__init__(message)
+        self.in_flight = in_flight
+
+
+class Deadline:
+    """A point in time (monotonic clock) by which a resume must be finished."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+_current_deadline: contextvars.ContextVar = contextvars.ContextVar("resume_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline of the resume being processed on this thread, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """Make a new deadline visible to extractors for the duration of the block."""
+    if seconds is None:
+        yield current_deadline()
+        return
+
+    token = _current_deadline.set(Deadline(seconds))
+    try:
+        yield _current_deadline.get()
+    finally:
+        _current_deadline.reset(token)
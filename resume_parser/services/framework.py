@@ -1,10 +1,18 @@
 """Main framework orchestration and facade."""
 
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager, nullcontext
 from pathlib import Path
+import contextvars
 import logging
 
+from ..models.document import Document
 from ..models.resume_data import ResumeData
+from ..models.lazy_resume_data import LazyResumeData
+from .deadline import current_deadline, deadline_scope
+from .profiling import Profiler, profile_section
+from .tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -12,53 +20,261 @@ logger = logging.getLogger(__name__)
 class ResumeParserFramework:
     """Main framework for resume parsing."""
     
-    def __init__(self, parsers: Dict[str, object], extractors: Dict[str, object]):
+    FALLBACK_VALUES = {"name": "Unknown", "email": "", "skills": []}
+    
+    def __init__(self, parsers: Dict[str, object], extractors: Dict[str, object],
+                 normalizer: Optional[Callable[[str], str]] = None,
+                 deadline_seconds: Optional[float] = None,
+                 profiler: Optional[Profiler] = None):
         self.parsers = parsers
         self.extractors = extractors
-        logger.info(f"Framework initialized with {len(parsers)} parsers and {len(extractors)} extractors")
+        self.normalizer = normalizer
+        self.deadline_seconds = deadline_seconds
+        self.profiler = profiler if profiler is not None else Profiler.from_env()
+        logger.info("Framework initialized with %d parsers and %d extractors", len(parsers), len(extractors))
     
-    def parse_resume(self, file_path: str) -> ResumeData:
-        """Parse resume file and extract information."""
-        logger.info(f"Starting resume parsing for: {file_path}")
+    def parse_resume(self, file_path: str, deadline_seconds: Optional[float] = None,
+                     profile: Optional[bool] = None, fields: Optional[Iterable[str]] = None) -> ResumeData:
+        """Parse resume file and extract information.
+        
+        With a deadline, extractors still pending when it expires (including
+        in-flight LLM calls) return their fallback value instead of blocking.
+        ``profile=True`` writes a cProfile/tracemalloc report for this file;
+        ``None`` leaves the decision to the profiler's sample rate.
+        ``fields`` runs only those extractors; the other fields are None.
+        """
+        logger.info("Starting resume parsing for: %s", file_path)
+        fields = self._check_fields(fields)
+        
+        with self._resume_scope(file_path, deadline_seconds, profile):
+            raw_text = self.parse_text(file_path)
+            result = self.extract_data(self.build_document(raw_text, file_path), fields)
+        
+        skills_count = len(result.skills) if result.skills is not None else 0
+        logger.info("Successfully parsed resume: %s, %s, %d skills", result.name, result.email, skills_count)
+        return result
+    
+    def iter_parse_resume(self, file_path: str, deadline_seconds: Optional[float] = None,
+                          profile: Optional[bool] = None,
+                          fields: Optional[Iterable[str]] = None) -> Iterator[Union[Tuple[str, object], ResumeData]]:
+        """Parse a resume, yielding ``(field, value)`` as soon as each extractor finishes.
+        
+        Extractors run concurrently, so the email regex arrives right after
+        parsing and a slow LLM call only holds back its own field. Failed
+        extractors, and those still running when the deadline expires, yield
+        their fallback value. The last item is the assembled ResumeData,
+        the same one ``parse_resume`` would return.
+        """
+        # Drive the generator inside its own context so the deadline and
+        # tracing scopes it opens never leak into the caller between events
+        events = self._stream_resume(file_path, deadline_seconds, profile, self._check_fields(fields))
+        context = contextvars.copy_context()
+        try:
+            while True:
+                try:
+                    event = context.run(next, events)
+                except StopIteration:
+                    return
+                yield event
+        finally:
+            context.run(events.close)
+    
+    def _stream_resume(self, file_path: str, deadline_seconds: Optional[float], profile: Optional[bool],
+                       fields: Optional[List[str]]) -> Iterator[Union[Tuple[str, object], ResumeData]]:
+        logger.info("Starting streaming parse for: %s", file_path)
+        
+        extracted_data = {}
+        with self._resume_scope(file_path, deadline_seconds, profile, streaming=True):
+            raw_text = self.build_document(self.parse_text(file_path), file_path)
+            for field_name, value in self._iter_extract(raw_text, self._selected_extractors(fields)):
+                extracted_data[field_name] = value
+                yield field_name, value
         
+        yield self._assemble(extracted_data, fields)
+    
+    @contextmanager
+    def _resume_scope(self, file_path: str, deadline_seconds: Optional[float], profile: Optional[bool],
+                      **attributes) -> Iterator[None]:
+        """Top-level span, profile session and deadline for one resume."""
+        profiling = self.profiler.session(file_path) if self.profiler.should_profile(profile) else nullcontext()
+        with span("parse_resume", file=str(file_path), **attributes), profiling, \
+                deadline_scope(deadline_seconds if deadline_seconds is not None else self.deadline_seconds):
+            yield
+    
+    def parse_resume_lazy(self, file_path: str) -> LazyResumeData:
+        """Parse the file now but run each extractor only when its field is first read.
+        
+        Values are memoized on the returned record. The framework's default
+        deadline applies to each field access separately.
+        """
+        logger.info("Starting lazy resume parsing for: %s", file_path)
+        with span("parse_resume", file=str(file_path), lazy=True):
+            raw_text = self.build_document(self.parse_text(file_path), file_path)
+        return LazyResumeData(raw_text, self._extract_field)
+    
+    def _extract_field(self, field_name: str, raw_text: str) -> object:
+        extractor = self.extractors.get(field_name)
+        if extractor is None:
+            return self._fallback(field_name)
+        with deadline_scope(self.deadline_seconds):
+            try:
+                return self._run_extractor(field_name, extractor, raw_text)
+            except Exception as e:
+                logger.error("Extractor %s failed: %s", field_name, e)
+                return self._fallback(field_name)
+    
+    def _iter_extract(self, raw_text: str, extractors: Dict[str, object]) -> Iterator[Tuple[str, object]]:
+        if not extractors:
+            return
+        
+        deadline = current_deadline()
+        pool = ThreadPoolExecutor(max_workers=len(extractors), thread_name_prefix="stream-extract")
+        try:
+            # Each extractor sees the deadline, span and profile session of this resume
+            futures = {
+                pool.submit(contextvars.copy_context().run, self._run_extractor, field_name, extractor, raw_text): field_name
+                for field_name, extractor in extractors.items()
+            }
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=deadline.remaining() if deadline is not None else None,
+                                     return_when=FIRST_COMPLETED)
+                if not done:
+                    for future in pending:
+                        logger.warning("Deadline exceeded, abandoning extractor %s", futures[future])
+                        yield futures[future], self._fallback(futures[future])
+                    return
+                for future in done:
+                    field_name = futures[future]
+                    try:
+                        value = future.result()
+                    except Exception as e:
+                        logger.error("Extractor %s failed: %s", field_name, e)
+                        value = self._fallback(field_name)
+                    yield field_name, value
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def parse_text(self, file_path: str) -> str:
+        """Run the parser registered for the file's extension and return raw text."""
+        # Parse file to extract raw text
+        parser = self.get_parser(file_path)
+        logger.debug("Using %s to parse file", parser.__class__.__name__)
+        with span("parse", parser=parser.__class__.__name__), profile_section(f"parse {parser.__class__.__name__}"):
+            return parser.parse(file_path)
+    
+    def normalize_text(self, raw_text: str) -> str:
+        """Apply the configured normalizer (e.g. TextCompactor) to parsed text."""
+        if self.normalizer is None:
+            return raw_text
+        with span("normalize", chars=len(raw_text)):
+            return self.normalizer(raw_text)
+    
+    def build_document(self, raw_text: str, file_path: Optional[str] = None) -> Document:
+        """Normalize parsed text and wrap it in the Document every extractor shares."""
+        return Document(self.normalize_text(raw_text), source_path=str(file_path) if file_path is not None else None)
+    
+    def get_parser(self, file_path: str) -> object:
+        """Return the parser registered for the file's extension."""
         file_extension = Path(file_path).suffix.lower()
         
         if file_extension not in self.parsers:
-            logger.error(f"Unsupported file type: {file_extension}. Supported: {list(self.parsers.keys())}")
+            logger.error("Unsupported file type: %s. Supported: %s", file_extension, list(self.parsers.keys()))
             raise ValueError(f"Unsupported file type: {file_extension}")
         
-        # Parse file to extract raw text
-        parser = self.parsers[file_extension]
-        logger.debug(f"Using {parser.__class__.__name__} to parse file")
-        raw_text = parser.parse(file_path)
+        return self.parsers[file_extension]
+    
+    def extract_data(self, raw_text: str, fields: Optional[Iterable[str]] = None) -> ResumeData:
+        """Run every extractor (or only those for ``fields``) over already-parsed text.
         
-        # Extract structured data using extractors
+        Plain strings are wrapped in a Document so extractors share its cached
+        lines, sections and regex matches.
+        """
+        fields = self._check_fields(fields)
+        if not isinstance(raw_text, Document):
+            raw_text = Document(raw_text)
         extracted_data = {}
-        for field_name, extractor in self.extractors.items():
-            logger.debug(f"Running {extractor.__class__.__name__} for {field_name}")
+        deadline = current_deadline()
+        for field_name, extractor in self._selected_extractors(fields).items():
+            if deadline is not None and deadline.expired:
+                logger.warning("Deadline exceeded, skipping extractor %s", field_name)
+                self._apply_fallback(extracted_data, field_name)
+                continue
+            
             try:
-                extracted_data[field_name] = extractor.extract(raw_text)
+                extracted_data[field_name] = self._run_extractor(field_name, extractor, raw_text)
             except Exception as e:
-                logger.error(f"Extractor {field_name} failed: {e}")
+                logger.error("Extractor %s failed: %s", field_name, e)
                 # Provide fallback values
-                if field_name == "name":
-                    extracted_data[field_name] = "Unknown"
-                elif field_name == "email":
-                    extracted_data[field_name] = ""
-                elif field_name == "skills":
-                    extracted_data[field_name] = []
+                self._apply_fallback(extracted_data, field_name)
         
-        result = ResumeData(
+        return self._assemble(extracted_data, fields)
+    
+    def _check_fields(self, fields: Optional[Iterable[str]]) -> Optional[List[str]]:
+        if fields is None:
+            return None
+        fields = list(fields)
+        unknown = [field_name for field_name in fields if field_name not in self.extractors]
+        if unknown:
+            raise ValueError(f"No extractor registered for field(s): {unknown}. Available: {list(self.extractors)}")
+        return fields
+    
+    def _selected_extractors(self, fields: Optional[List[str]]) -> Dict[str, object]:
+        if fields is None:
+            return self.extractors
+        return {field_name: extractor for field_name, extractor in self.extractors.items() if field_name in fields}
+    
+    def _run_extractor(self, field_name: str, extractor: object, raw_text: str) -> object:
+        logger.debug("Running %s for %s", extractor.__class__.__name__, field_name)
+        with span(f"extract {field_name}", extractor=extractor.__class__.__name__), \
+                profile_section(f"extract {field_name}"):
+            return extractor.extract(raw_text)
+    
+    @staticmethod
+    def _assemble(extracted_data: Dict[str, object], fields: Optional[List[str]] = None) -> ResumeData:
+        if fields is not None:
+            # Fields nobody asked for stay None rather than looking like failures
+            return ResumeData(
+                name=extracted_data.get("name") if "name" in fields else None,
+                email=extracted_data.get("email") if "email" in fields else None,
+                skills=extracted_data.get("skills") if "skills" in fields else None
+            )
+        return ResumeData(
             name=extracted_data.get("name", "Unknown"),
             email=extracted_data.get("email", ""),
             skills=extracted_data.get("skills", [])
         )
-        
-        skills_count = len(result.skills) if result.skills is not None else 0
-        logger.info(f"Successfully parsed resume: {result.name}, {result.email}, {skills_count} skills")
-        return result
+    
+    def _fallback(self, field_name: str) -> object:
+        fallback = self.FALLBACK_VALUES.get(field_name)
+        return list(fallback) if isinstance(fallback, list) else fallback
+    
+    def _apply_fallback(self, extracted_data: Dict[str, object], field_name: str) -> None:
+        if field_name in self.FALLBACK_VALUES:
+            extracted_data[field_name] = self._fallback(field_name)
     
     
     @property
     def supported_file_types(self) -> List[str]:
-        return list(self.parsers.keys())
\ No newline at end of file
+        return list(self.parsers.keys())
+
+
+class ResumeScope:
+    """The span, profile session and deadline of ``parse_resume``, for work split across threads.
+    
+    Run each step with ``run``; all of them share one context, so the deadline
+    keeps counting from when the scope was opened. ``close`` ends the scope.
+    """
+    
+    def __init__(self, framework: ResumeParserFramework, file_path: str,
+                 deadline_seconds: Optional[float] = None, profile: Optional[bool] = None):
+        self._context = contextvars.copy_context()
+        self._stack = ExitStack()
+        self._context.run(self._stack.enter_context,
+                          framework._resume_scope(file_path, deadline_seconds, profile, split=True))
+    
+    def run(self, func: Callable, *args) -> object:
+        return self._context.run(func, *args)
+    
+    def close(self) -> None:
+        self._context.run(self._stack.close)
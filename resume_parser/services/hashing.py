@@ -0,0 +1,12 @@
+"""Content hashing shared by the sync, storage and sharding services."""
+
+import hashlib
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Hex sha256 of a file's content, read in ``chunk_size`` pieces."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,358 @@
+"""Local HTTP service with a bounded work queue and backpressure."""
+
+import os
+import json
+import queue
+import tempfile
+import threading
+import time
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+from .framework import ResumeParserFramework, ResumeScope
+from .deadline import DeadlineExceeded
+from .isolated_executor import ParseTimeout, WorkerCrashed
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceOverloaded(Exception):
+    """Raised when the work queue has no room for new jobs."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Work queue is full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class BatchTooLarge(ValueError):
+    """Raised when a batch has more files than the work queue can ever hold."""
+
+    def __init__(self, size: int, limit: int):
+        super().__init__(f"Batch of {size} files exceeds the queue size of {limit}")
+        self.size = size
+        self.limit = limit
+
+
+class ResumeParserService:
+    """Run parse jobs on separate parsing and extraction worker pools.
+
+    Parsing is CPU-bound and extraction is dominated by LLM latency, so each
+    side gets its own concurrency. Admission is capped at ``queue_size`` jobs
+    in flight; callers beyond that get ``ServiceOverloaded`` instead of
+    piling up more threads. A batch larger than ``queue_size`` could never
+    be admitted and raises ``BatchTooLarge`` instead.
+    """
+
+    def __init__(self, framework: ResumeParserFramework, queue_size: int = 32,
+                 parse_workers: int = 2, llm_workers: int = 8, retry_after: int = 1):
+        if queue_size < 1 or parse_workers < 1 or llm_workers < 1:
+            raise ValueError("queue_size, parse_workers and llm_workers must be positive")
+
+        self.framework = framework
+        self.queue_size = queue_size
+        self.parse_workers = parse_workers
+        self.llm_workers = llm_workers
+        self.retry_after = retry_after
+
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._threads: List[threading.Thread] = []
+        self._extract_pool: Optional[ThreadPoolExecutor] = None
+        self._running = False
+        self._stats = {
+            "submitted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+        }
+        self._total_latency = 0.0
+
+    def start(self) -> None:
+        if self._running:
+            return
+
+        self._running = True
+        self._extract_pool = ThreadPoolExecutor(max_workers=self.llm_workers,
+                                                thread_name_prefix="resume-extract")
+        for i in range(self.parse_workers):
+            thread = threading.Thread(target=self._parse_loop, name=f"resume-parse-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Service started with {self.parse_workers} parse workers, "
+                    f"{self.llm_workers} extraction workers, queue size {self.queue_size}")
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+
+        self._running = False
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._extract_pool.shutdown(wait=True)
+        logger.info("Service stopped")
+
+    def submit(self, file_path: str) -> Future:
+        """Queue a single file; raises ServiceOverloaded when the queue is full."""
+        return self.submit_batch([file_path])[0]
+
+    def submit_batch(self, file_paths: List[str]) -> List[Future]:
+        """Queue several files atomically: either all are admitted or none."""
+        if not self._running:
+            raise RuntimeError("Service is not running")
+        if len(file_paths) > self.queue_size:
+            raise BatchTooLarge(len(file_paths), self.queue_size)
+
+        with self._lock:
+            if self._in_flight + len(file_paths) > self.queue_size:
+                self._stats["rejected"] += len(file_paths)
+                logger.warning(f"Rejecting {len(file_paths)} job(s), {self._in_flight} already in flight")
+                raise ServiceOverloaded(self.retry_after)
+            self._in_flight += len(file_paths)
+            self._stats["submitted"] += len(file_paths)
+
+        futures = []
+        for file_path in file_paths:
+            future = Future()
+            self._jobs.put((file_path, future, time.monotonic()))
+            futures.append(future)
+        return futures
+
+    def metrics(self) -> Dict[str, object]:
+        with self._lock:
+            finished = self._stats["completed"] + self._stats["failed"]
+            return {
+                **self._stats,
+                "in_flight": self._in_flight,
+                "queue_depth": self._jobs.qsize(),
+                "queue_size": self.queue_size,
+                "parse_workers": self.parse_workers,
+                "llm_workers": self.llm_workers,
+                "avg_latency_ms": round(self._total_latency / finished * 1000, 2) if finished else 0.0,
+            }
+
+    def _parse_loop(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+
+            file_path, future, started = job
+            scope = None
+            try:
+                # Parsing and extraction share the resume's deadline, span and profile session
+                scope = ResumeScope(self.framework, file_path)
+                text = scope.run(self._parse, file_path)
+            except Exception as e:
+                logger.error(f"Parsing failed for {file_path}: {e}")
+                if scope is not None:
+                    scope.close()
+                self._finish(future, started, error=e)
+                continue
+
+            self._extract_pool.submit(self._extract, scope, text, future, started)
+
+    def _parse(self, file_path: str) -> str:
+        return self.framework.build_document(self.framework.parse_text(file_path), file_path)
+
+    def _extract(self, scope: ResumeScope, text: str, future: Future, started: float) -> None:
+        try:
+            result = scope.run(self.framework.extract_data, text)
+        except Exception as e:
+            self._finish(future, started, error=e)
+        else:
+            self._finish(future, started, result=result)
+        finally:
+            scope.close()
+
+    def _finish(self, future: Future, started: float, result=None, error: Exception = None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._total_latency += time.monotonic() - started
+            self._stats["failed" if error else "completed"] += 1
+
+        if error:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for ResumeParserService."""
+
+    service: ResumeParserService = None
+    max_upload_bytes = 10 * 1024 * 1024
+    max_batch_bytes = 1024 * 1024
+    batch_root: Optional[str] = None
+    result_timeout = 300
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/health":
+            self._send_json(200, {"status": "ok" if self.service._running else "stopped"})
+        elif path == "/metrics":
+            self._send_json(200, self.service.metrics())
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path == "/parse":
+            self._handle_upload(parse_qs(url.query))
+        elif url.path == "/batch":
+            self._handle_batch()
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def _handle_upload(self, query: Dict[str, List[str]]) -> None:
+        filename = self.headers.get("X-Filename") or query.get("filename", [""])[0]
+        suffix = Path(filename).suffix.lower()
+        if suffix not in self.service.framework.supported_file_types:
+            self._send_json(400, {"error": f"Unsupported file type: {suffix}"})
+            return
+
+        length = self._content_length(self.max_upload_bytes)
+        if length is None:
+            return
+        if length == 0:
+            self._send_json(400, {"error": "Empty upload"})
+            return
+
+        fd, temp_path = tempfile.mkstemp(suffix=suffix)
+        submitted = False
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.rfile.read(length))
+
+            try:
+                future = self.service.submit(temp_path)
+            except ServiceOverloaded as e:
+                self._send_overloaded(e)
+                return
+            # The job may outlive this request (on a result timeout), so it owns the file now
+            future.add_done_callback(lambda _: _remove(temp_path))
+            submitted = True
+
+            try:
+                result = future.result(timeout=self.result_timeout)
+            except Exception as e:
+                self._send_json(_status_for(e), {"error": str(e)})
+                return
+            self._send_json(200, result.to_dict())
+        finally:
+            if not submitted:
+                _remove(temp_path)
+
+    def _handle_batch(self) -> None:
+        if self.batch_root is None:
+            self._send_json(403, {"error": "Batch endpoint is disabled"})
+            return
+
+        length = self._content_length(self.max_batch_bytes)
+        if length is None:
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            paths = payload["paths"]
+            if not isinstance(paths, list) or not all(isinstance(p, str) for p in paths):
+                raise ValueError("'paths' must be a list of strings")
+            resolved = [self._resolve_batch_path(p) for p in paths]
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {"error": f"Invalid batch request: {e}"})
+            return
+
+        try:
+            futures = self.service.submit_batch(resolved)
+        except BatchTooLarge as e:
+            self._send_json(413, {"error": str(e)})
+            return
+        except ServiceOverloaded as e:
+            self._send_overloaded(e)
+            return
+
+        results = []
+        for path, future in zip(paths, futures):
+            try:
+                results.append({"path": path, "result": future.result(timeout=self.result_timeout).to_dict()})
+            except Exception as e:
+                results.append({"path": path, "error": str(e)})
+        self._send_json(200, {"results": results})
+
+    def _resolve_batch_path(self, path: str) -> str:
+        """Resolve ``path`` against ``batch_root``; anything outside it is rejected."""
+        root = os.path.realpath(self.batch_root)
+        resolved = os.path.realpath(os.path.join(root, path))
+        if os.path.commonpath([root, resolved]) != root:
+            raise ValueError(f"Path is outside the batch root: {path}")
+        return resolved
+
+    def _content_length(self, limit: int) -> Optional[int]:
+        """Return the request body size, or send 400/413 and return None."""
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send_json(400, {"error": "Invalid Content-Length"})
+            return None
+        if length > limit:
+            self._send_json(413, {"error": f"Request body exceeds {limit} bytes"})
+            return None
+        return length
+
+    def _send_overloaded(self, error: ServiceOverloaded) -> None:
+        self._send_json(429, {"error": str(error)}, {"Retry-After": str(error.retry_after)})
+
+    def _send_json(self, status: int, body: dict, headers: Dict[str, str] = None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _status_for(error: Exception) -> int:
+    # Runaway or crashing files are bad input, not a service fault
+    if isinstance(error, (ValueError, FileNotFoundError, ParseTimeout, WorkerCrashed, MemoryError)):
+        return 422
+    if isinstance(error, DeadlineExceeded):
+        return 504
+    return 500
+
+
+def create_server(service: ResumeParserService, host: str = "127.0.0.1", port: int = 8080,
+                  max_upload_bytes: int = 10 * 1024 * 1024,
+                  batch_root: Optional[str] = None) -> ThreadingHTTPServer:
+    """Build an HTTP server bound to the given service (not yet serving).
+
+    ``POST /batch`` parses files already on the server, so it is only enabled
+    when ``batch_root`` is given, and only for paths inside that directory.
+    """
+    handler = type("ResumeParserRequestHandler", (_RequestHandler,), {
+        "service": service,
+        "max_upload_bytes": max_upload_bytes,
+        "batch_root": batch_root,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
@@ -0,0 +1,197 @@
+"""Incremental directory sync that only re-parses new or changed files."""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..models.resume_data import ResumeData
+from .framework import ResumeParserFramework
+from .hashing import hash_file
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SyncReport:
+    """Summary of a single sync run."""
+    added: int = 0
+    modified: int = 0
+    retried: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    failed: int = 0
+    duration: float = 0.0
+
+
+class IncrementalSync:
+    """Keep a manifest of (path, size, mtime, content hash) -> result.
+
+    Each run only stats the tree. Files whose size and mtime match the
+    manifest are skipped without being read; files with a new stat are
+    hashed, and only those whose content actually changed are sent through
+    ``parse_resume``. Files that failed last time are parsed again and
+    counted as ``retried``. Manifest rows for files under the synced root
+    that disappeared are dropped; rows for other roots are left alone.
+    Results are committed every ``commit_every`` files, so an interrupted
+    run keeps what it already parsed. Paths are stored resolved to absolute,
+    symlink-free form, so ``./resumes`` and ``/data/resumes`` share entries.
+    """
+
+    SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_files_hash ON files (content_hash);
+"""
+
+    def __init__(self, manifest_path: str, framework: ResumeParserFramework, workers: int = 4,
+                 retry_failed: bool = True, commit_every: int = 100):
+        if commit_every < 1:
+            raise ValueError("commit_every must be at least 1")
+
+        self.manifest_path = manifest_path
+        self.framework = framework
+        self.workers = workers
+        self.retry_failed = retry_failed
+        self.commit_every = commit_every
+        self._conn = sqlite3.connect(manifest_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+
+    def run(self, root: str) -> SyncReport:
+        """Sync the manifest with the current contents of ``root``."""
+        started = time.monotonic()
+        root = os.path.realpath(root)
+        report = SyncReport()
+        manifest = self._load_manifest()
+        supported = {ext.lower() for ext in self.framework.supported_file_types}
+
+        to_parse: List[Tuple[str, int, int, str, str]] = []
+        touched: List[Tuple[int, int, str]] = []
+        seen = set()
+
+        for path, stat in self._scan(root, supported):
+            seen.add(path)
+            entry = manifest.get(path)
+            if entry is not None:
+                size, mtime_ns, content_hash, failed = entry
+                if size == stat.st_size and mtime_ns == stat.st_mtime_ns and not (failed and self.retry_failed):
+                    report.unchanged += 1
+                    continue
+
+            try:
+                new_hash = hash_file(path)
+            except OSError as e:
+                logger.warning(f"Could not read {path}: {e}")
+                continue
+
+            if entry is not None and new_hash == entry[2] and not (entry[3] and self.retry_failed):
+                # Touched but not changed (copy, checkout, backup restore)
+                touched.append((stat.st_size, stat.st_mtime_ns, path))
+                report.unchanged += 1
+                continue
+
+            if entry is None:
+                kind = "added"
+            elif entry[3]:
+                kind = "retried"
+            else:
+                kind = "modified"
+            to_parse.append((path, stat.st_size, stat.st_mtime_ns, new_hash, kind))
+
+        # The manifest may also track other roots; only this one was scanned
+        prefix = os.path.join(root, "")
+        deleted = [path for path in manifest if path.startswith(prefix) and path not in seen]
+        with self._conn:
+            self._conn.executemany("UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?", touched)
+            self._conn.executemany("DELETE FROM files WHERE path = ?", ((p,) for p in deleted))
+        report.deleted = len(deleted)
+
+        if to_parse:
+            logger.info(f"Parsing {len(to_parse)} new, modified or previously failed file(s)")
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                results = pool.map(self._parse, (item[0] for item in to_parse))
+                for stored, ((path, size, mtime_ns, content_hash, kind), (result, error)) in enumerate(
+                        zip(to_parse, results), 1):
+                    self._store(path, size, mtime_ns, content_hash, result, error)
+                    if stored % self.commit_every == 0:
+                        self._conn.commit()
+                    if error is not None:
+                        report.failed += 1
+                    elif kind == "added":
+                        report.added += 1
+                    elif kind == "retried":
+                        report.retried += 1
+                    else:
+                        report.modified += 1
+            self._conn.commit()
+
+        report.duration = time.monotonic() - started
+        logger.info(f"Sync of {root} finished in {report.duration:.2f}s: {report}")
+        return report
+
+    def results(self) -> Iterator[Tuple[str, ResumeData]]:
+        """Stream the current result for every successfully parsed file."""
+        rows = self._conn.execute("SELECT path, result FROM files WHERE result IS NOT NULL ORDER BY path")
+        for path, result in rows:
+            yield path, ResumeData(**json.loads(result))
+
+    def get(self, path: str) -> Optional[ResumeData]:
+        row = self._conn.execute("SELECT result FROM files WHERE path = ?", (os.path.realpath(path),)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return ResumeData(**json.loads(row[0]))
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _load_manifest(self) -> Dict[str, Tuple[int, int, str, bool]]:
+        rows = self._conn.execute("SELECT path, size, mtime_ns, content_hash, error IS NOT NULL FROM files")
+        return {path: (size, mtime_ns, content_hash, bool(failed)) for path, size, mtime_ns, content_hash, failed in rows}
+
+    def _scan(self, root: str, supported: set) -> Iterator[Tuple[str, os.stat_result]]:
+        # os.scandir avoids a separate stat call per directory entry on most platforms
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError as e:
+                logger.warning(f"Could not scan {directory}: {e}")
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in supported:
+                        try:
+                            yield entry.path, entry.stat()
+                        except OSError:
+                            continue
+
+    def _parse(self, path: str) -> Tuple[Optional[ResumeData], Optional[str]]:
+        try:
+            return self.framework.parse_resume(path), None
+        except Exception as e:
+            logger.error(f"Failed to parse {path}: {e}")
+            return None, str(e)
+
+    def _store(self, path: str, size: int, mtime_ns: int, content_hash: str,
+               result: Optional[ResumeData], error: Optional[str]) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO files (path, size, mtime_ns, content_hash, result, error, synced_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (path, size, mtime_ns, content_hash,
+             json.dumps(result.to_dict()) if result is not None else None, error, time.time()),
+        )
@@ -0,0 +1,263 @@
+"""Run parsers in recyclable child processes with hard time and memory limits."""
+
+import threading
+import logging
+import multiprocessing
+from typing import Any, Callable, Dict, List, Optional
+
+from .deadline import DeadlineExceeded, current_deadline
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Spawned workers import the package before they can take a job; that is not part of any job's timeout
+_STARTUP_TIMEOUT = 60.0
+
+
+class ParseTimeout(TimeoutError):
+    """Raised when a job exceeds its wall-clock limit and its worker is killed."""
+
+
+class WorkerCrashed(RuntimeError):
+    """Raised when a worker process dies before returning a result."""
+
+
+def _worker_main(conn, memory_limit: Optional[int]) -> None:
+    if memory_limit is not None and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    conn.send("ready")
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if job is None:
+            return
+        func, args, kwargs = job
+        try:
+            reply = ("ok", func(*args, **kwargs))
+        except BaseException as e:
+            reply = ("error", e)
+        try:
+            conn.send(reply)
+        except Exception as e:
+            # Unpicklable result or exception
+            conn.send(("error", RuntimeError(f"{type(e).__name__}: {e}")))
+        if reply[0] == "error" and isinstance(reply[1], MemoryError):
+            return  # the heap may be in a bad state; let the parent start a fresh worker
+
+
+class _Worker:
+    def __init__(self, context, memory_limit: Optional[int]):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, memory_limit), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+        try:
+            started = self.conn.poll(_STARTUP_TIMEOUT) and self.conn.recv() == "ready"
+        except (EOFError, OSError):
+            started = False
+        if not started:
+            self.kill()
+            raise WorkerCrashed(f"Worker process failed to start (exit code {self.process.exitcode})")
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class IsolatedExecutor:
+    """Pool of child processes, each running one job at a time.
+
+    A job that runs past ``timeout`` seconds (or past the current resume
+    deadline, whichever is sooner) has its worker killed and raises
+    ParseTimeout; only that worker is affected. ``memory_limit`` sets
+    RLIMIT_AS in each child so a runaway allocation raises MemoryError there
+    instead of pulling the parent into the OOM killer. Workers are retired
+    after ``max_jobs_per_worker`` jobs to contain leaks. A job whose resume
+    deadline has already passed raises DeadlineExceeded without being sent
+    to (or killing) a worker.
+
+    Workers are started with ``start_method`` ("forkserver" where available,
+    else "spawn" by default): the executor is used from threaded services,
+    and forking a multithreaded process can copy locks held by other threads.
+    ``run`` is thread-safe and blocks until a worker is free; functions and
+    arguments must be picklable and importable by the child.
+    """
+
+    def __init__(self, workers: int = 2, timeout: float = 60.0, memory_limit: Optional[int] = None,
+                 max_jobs_per_worker: int = 100, start_method: Optional[str] = None):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_jobs_per_worker < 1:
+            raise ValueError("max_jobs_per_worker must be at least 1")
+        if memory_limit is not None and resource is None:
+            logger.warning("resource module unavailable, memory_limit will not be enforced")
+
+        self.workers = workers
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.max_jobs_per_worker = max_jobs_per_worker
+        if start_method is None:
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self._context = multiprocessing.get_context(start_method)
+        self._idle: List[_Worker] = []
+        self._running = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._stats = {"jobs": 0, "failed": 0, "timeouts": 0, "crashes": 0, "expired": 0, "started": 0,
+                       "recycled": 0}
+
+    def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``func(*args, **kwargs)`` in a worker process and return its result."""
+        self._check_deadline(func)
+        worker = self._checkout()
+        try:
+            # Waiting for a free worker may have used up what was left
+            self._check_deadline(func)
+        except DeadlineExceeded:
+            self._checkin(worker, True)
+            raise
+        reusable = False
+        try:
+            status, value = self._execute(worker, func, args, kwargs)
+            # The child exits after a MemoryError, so it is not handed out again
+            reusable = not isinstance(value, MemoryError)
+        finally:
+            self._checkin(worker, reusable)
+
+        if status == "ok":
+            return value
+        raise value
+
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return dict(self._stats, idle=len(self._idle), busy=self._running - len(self._idle))
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._running -= len(idle)
+            self._condition.notify_all()
+        for worker in idle:
+            worker.stop()
+
+    def __enter__(self) -> "IsolatedExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _checkout(self) -> _Worker:
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("IsolatedExecutor is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._running < self.workers:
+                    self._running += 1
+                    self._stats["started"] += 1
+                    break
+                self._condition.wait()
+        try:
+            return _Worker(self._context, self.memory_limit)
+        except Exception:
+            with self._condition:
+                self._running -= 1
+                self._condition.notify()
+            raise
+
+    def _checkin(self, worker: _Worker, reusable: bool) -> None:
+        if reusable and worker.jobs < self.max_jobs_per_worker and not self._closed:
+            with self._condition:
+                self._idle.append(worker)
+                self._condition.notify()
+            return
+
+        if reusable:
+            worker.stop()
+            self._count("recycled")
+        else:
+            worker.kill()
+        with self._condition:
+            self._running -= 1
+            self._condition.notify()
+
+    def _execute(self, worker: _Worker, func, args, kwargs):
+        """Return ("ok", result) or ("error", exception) from the worker."""
+        timeout = self.timeout
+        deadline = current_deadline()
+        if deadline is not None:
+            timeout = min(timeout, deadline.remaining())
+
+        self._count("jobs")
+        worker.jobs += 1
+        try:
+            worker.conn.send((func, args, kwargs))
+            ready = worker.conn.poll(max(timeout, 0))
+        except (BrokenPipeError, EOFError, OSError):
+            ready = True  # surfaces as a crash on recv below
+
+        if not ready:
+            self._count("timeouts")
+            logger.error(f"Worker {worker.process.pid} exceeded {timeout:.1f}s running "
+                         f"{getattr(func, '__qualname__', func)}{args!r}; killing it")
+            raise ParseTimeout(f"Job exceeded {timeout:.1f}s and was killed")
+
+        try:
+            status, value = worker.conn.recv()
+        except (EOFError, OSError):
+            worker.process.join(timeout=5)
+            self._count("crashes")
+            logger.error(f"Worker {worker.process.pid} died with exit code {worker.process.exitcode}")
+            raise WorkerCrashed(f"Worker process died with exit code {worker.process.exitcode}")
+
+        if status == "error":
+            self._count("failed")
+            if isinstance(value, MemoryError):
+                logger.error(f"Worker {worker.process.pid} hit its memory limit of {self.memory_limit} bytes")
+        return status, value
+
+    def _check_deadline(self, func) -> None:
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired:
+            self._count("expired")
+            raise DeadlineExceeded(f"Resume deadline passed before {getattr(func, '__qualname__', func)} started")
+
+    def _count(self, key: str) -> None:
+        with self._condition:
+            self._stats[key] += 1
+
+
+class IsolatedParser:
+    """Parser wrapper that runs ``parser.parse`` through an IsolatedExecutor.
+
+    Drop-in for a framework parser: ``{".pdf": IsolatedParser(PDFParser(), executor)}``.
+    """
+
+    def __init__(self, parser: object, executor: IsolatedExecutor):
+        self.parser = parser
+        self.executor = executor
+
+    def parse(self, file_path: str) -> str:
+        return self.executor.run(self.parser.parse, file_path)
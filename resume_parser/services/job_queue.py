@@ -0,0 +1,296 @@
+"""Durable SQLite-backed job queue for resumable bulk runs."""
+
+import os
+import json
+import socket
+import sqlite3
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from ..models.resume_data import ResumeData
+from .framework import ResumeParserFramework
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Job:
+    """A leased unit of work."""
+    id: int
+    path: str
+    attempts: int
+
+
+class JobQueue:
+    """Track pending/in-progress/done/failed files in a SQLite database.
+
+    Workers lease jobs for ``lease_seconds``; a lease that is never completed
+    (worker crash, OOM kill) expires and the job becomes leasable again, so a
+    restarted run picks up exactly where the previous one stopped. Only the
+    worker holding a job's lease can complete or fail it, so a worker whose
+    lease expired and was taken over cannot overwrite the new holder's outcome.
+    """
+
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    DONE = "done"
+    FAILED = "failed"
+
+    SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    lease_expires REAL,
+    available_at REAL NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, available_at);
+"""
+
+    def __init__(self, db_path: str, max_attempts: int = 3, lease_seconds: float = 600,
+                 retry_delay: float = 0):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.retry_delay = retry_delay
+        self._local = threading.local()
+        self._conn().executescript(self.SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def enqueue(self, paths: Iterable[str]) -> int:
+        """Add files to the queue; paths already present are left untouched."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            before = conn.total_changes
+            conn.executemany("INSERT OR IGNORE INTO jobs (path, updated_at) VALUES (?, ?)",
+                             ((str(p), time.time()) for p in paths))
+            added = conn.total_changes - before
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        logger.info(f"Enqueued {added} new job(s)")
+        return added
+
+    def lease(self, worker_id: str) -> Optional[Job]:
+        """Claim the next runnable job, or return None when nothing is runnable."""
+        conn = self._conn()
+        while True:
+            now = time.time()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT id, path, attempts, status FROM jobs "
+                    "WHERE (status = ? AND available_at <= ?) OR (status = ? AND lease_expires < ?) "
+                    "ORDER BY id LIMIT 1",
+                    (self.PENDING, now, self.IN_PROGRESS, now),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+
+                job_id, path, attempts, status = row
+                if status == self.IN_PROGRESS and attempts >= self.max_attempts:
+                    # The worker holding this job died on every attempt
+                    conn.execute("UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+                                 (self.FAILED, "Lease expired", now, job_id))
+                    conn.execute("COMMIT")
+                    logger.warning(f"Job {job_id} ({path}) failed after {attempts} expired lease(s)")
+                    continue
+
+                conn.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, worker_id = ?, "
+                    "lease_expires = ?, updated_at = ? WHERE id = ?",
+                    (self.IN_PROGRESS, worker_id, now + self.lease_seconds, now, job_id),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            return Job(id=job_id, path=path, attempts=attempts + 1)
+
+    def complete(self, job_id: int, worker_id: str, result: ResumeData) -> bool:
+        """Record a result; returns False if ``worker_id`` no longer holds the lease."""
+        cursor = self._conn().execute(
+            "UPDATE jobs SET status = ?, result = ?, error = NULL, lease_expires = NULL, updated_at = ? "
+            "WHERE id = ? AND status = ? AND worker_id = ?",
+            (self.DONE, json.dumps(result.to_dict()), time.time(), job_id, self.IN_PROGRESS, worker_id),
+        )
+        return self._owned(cursor, job_id, worker_id)
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> bool:
+        """Record a failure; the job is retried until max_attempts is reached.
+
+        Returns False if ``worker_id`` no longer holds the lease.
+        """
+        now = time.time()
+        cursor = self._conn().execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+            "error = ?, lease_expires = NULL, available_at = ?, updated_at = ? "
+            "WHERE id = ? AND status = ? AND worker_id = ?",
+            (self.max_attempts, self.FAILED, self.PENDING, error, now + self.retry_delay, now,
+             job_id, self.IN_PROGRESS, worker_id),
+        )
+        return self._owned(cursor, job_id, worker_id)
+
+    def _owned(self, cursor: sqlite3.Cursor, job_id: int, worker_id: str) -> bool:
+        if cursor.rowcount == 0:
+            logger.warning(f"{worker_id} lost the lease on job {job_id}; its outcome was discarded")
+            return False
+        return True
+
+    def reclaim(self, is_alive: Callable[[str], bool]) -> int:
+        """Expire the leases of workers for which ``is_alive(worker_id)`` is False.
+
+        The jobs become leasable at once instead of after ``lease_seconds``;
+        the lost attempt still counts towards ``max_attempts``.
+        """
+        conn = self._conn()
+        holders = [row[0] for row in conn.execute(
+            "SELECT DISTINCT worker_id FROM jobs WHERE status = ?", (self.IN_PROGRESS,))]
+        dead = [worker_id for worker_id in holders if not is_alive(worker_id)]
+        if not dead:
+            return 0
+        cursor = conn.executemany(
+            "UPDATE jobs SET lease_expires = 0, updated_at = ? WHERE status = ? AND worker_id = ?",
+            ((time.time(), self.IN_PROGRESS, worker_id) for worker_id in dead),
+        )
+        logger.info(f"Reclaimed {cursor.rowcount} job(s) from {len(dead)} dead worker(s)")
+        return cursor.rowcount
+
+    def retry_failed(self) -> int:
+        """Move permanently failed jobs back to pending with a fresh attempt budget."""
+        cursor = self._conn().execute(
+            "UPDATE jobs SET status = ?, attempts = 0, available_at = 0, updated_at = ? WHERE status = ?",
+            (self.PENDING, time.time(), self.FAILED),
+        )
+        return cursor.rowcount
+
+    def next_retry_in(self) -> Optional[float]:
+        """Seconds until a delayed retry or an expiring lease may become runnable.
+
+        Returns None when no job is pending or in progress, i.e. nothing can
+        become runnable without new work being enqueued.
+        """
+        row = self._conn().execute(
+            "SELECT MIN(CASE WHEN status = ? THEN available_at ELSE lease_expires END) FROM jobs "
+            "WHERE status IN (?, ?)",
+            (self.PENDING, self.PENDING, self.IN_PROGRESS),
+        ).fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    def counts(self) -> Dict[str, int]:
+        counts = {self.PENDING: 0, self.IN_PROGRESS: 0, self.DONE: 0, self.FAILED: 0}
+        for status, count in self._conn().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"):
+            counts[status] = count
+        return counts
+
+    def results(self) -> Iterator[Tuple[str, ResumeData]]:
+        """Stream completed results in queue order."""
+        rows = self._conn().execute("SELECT path, result FROM jobs WHERE status = ? ORDER BY id", (self.DONE,))
+        for path, result in rows:
+            yield path, ResumeData(**json.loads(result))
+
+    def failures(self) -> Iterator[Tuple[str, str]]:
+        rows = self._conn().execute("SELECT path, error FROM jobs WHERE status = ? ORDER BY id", (self.FAILED,))
+        yield from rows
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class JobQueueRunner:
+    """Drain a JobQueue through ResumeParserFramework.parse_resume.
+
+    Worker ids are ``host:pid:index``. On start, jobs still leased by a
+    process on this host that is no longer running (a previous run that
+    crashed) are reclaimed at once; leases held on other hosts are left to
+    expire. Idle workers poll every ``poll_interval`` seconds while other
+    workers still hold jobs, and return once nothing is pending or in progress.
+    """
+
+    def __init__(self, job_queue: JobQueue, framework: ResumeParserFramework, workers: int = 4,
+                 poll_interval: float = 1.0):
+        self.job_queue = job_queue
+        self.framework = framework
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._host = socket.gethostname()
+
+    def run(self) -> Dict[str, int]:
+        """Process every runnable job and return the final status counts."""
+        self.job_queue.reclaim(self._holder_alive)
+        prefix = f"{self._host}:{os.getpid()}"
+        threads = [threading.Thread(target=self._work, args=(f"{prefix}:{i}",), daemon=True)
+                   for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        counts = self.job_queue.counts()
+        logger.info(f"Job queue run finished: {counts}")
+        return counts
+
+    def _holder_alive(self, worker_id: str) -> bool:
+        host, _, rest = worker_id.rpartition(":")[0].rpartition(":")
+        if host != self._host or not rest.isdigit():
+            return True  # another machine, or not one of our ids: wait for the lease to expire
+        pid = int(rest)
+        if pid == os.getpid():
+            return True
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def _work(self, worker_id: str) -> None:
+        try:
+            while True:
+                job = self.job_queue.lease(worker_id)
+                if job is None:
+                    wait = self.job_queue.next_retry_in()
+                    if wait is None:
+                        return
+                    time.sleep(min(wait, self.poll_interval))
+                    continue
+
+                logger.debug(f"{worker_id} processing job {job.id} (attempt {job.attempts}): {job.path}")
+                try:
+                    result = self.framework.parse_resume(job.path)
+                except Exception as e:
+                    logger.error(f"Job {job.id} failed on attempt {job.attempts}: {e}")
+                    self.job_queue.fail(job.id, worker_id, str(e))
+                else:
+                    self.job_queue.complete(job.id, worker_id, result)
+        finally:
+            self.job_queue.close()
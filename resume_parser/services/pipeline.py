@@ -0,0 +1,256 @@
+"""Staged producer/consumer pipeline for batch parsing."""
+
+import os
+import queue
+import threading
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..models.resume_data import ResumeData
+from .framework import ResumeParserFramework, ResumeScope
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class PipelineItem:
+    """A single resume as it moves through the pipeline."""
+    path: str
+    parser: Any = None
+    data: Optional[bytes] = None
+    text: Optional[str] = None
+    result: Optional[ResumeData] = None
+    error: Optional[Exception] = None
+    failed_stage: Optional[str] = None
+    scope: Optional[ResumeScope] = None
+
+
+@dataclass
+class StageStats:
+    """Per-stage counters reported after a run."""
+    name: str
+    workers: int
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    utilization: float = 0.0
+
+
+class Stage:
+    """One pipeline step with its own worker threads and bounded input queue.
+
+    ``func`` receives a PipelineItem and returns it (or a replacement); a
+    function that returns None fails the item. Items that already failed in
+    an earlier stage are passed straight through unless ``handles_errors``
+    is set, which is what a sink normally wants.
+    """
+
+    def __init__(self, name: str, func: Callable[[PipelineItem], PipelineItem], workers: int = 1,
+                 queue_size: int = 32, handles_errors: bool = False):
+        if workers < 1:
+            raise ValueError(f"Stage {name} needs at least one worker")
+
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.queue_size = queue_size
+        self.handles_errors = handles_errors
+
+
+class Pipeline:
+    """Run items through a chain of stages connected by bounded queues.
+
+    A slow stage fills its input queue, which blocks the stage before it, so
+    memory stays bounded no matter how far ahead the producer could run.
+    Every stage is shut down even when ``paths`` raises; the error is
+    re-raised once the items already fed in have drained.
+    """
+
+    def __init__(self, stages: List[Stage], on_finish: Optional[Callable[[], None]] = None):
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self.stages = stages
+        self.on_finish = on_finish
+
+    def run(self, paths: Iterable[str]) -> Dict[str, StageStats]:
+        """Feed ``paths`` through every stage and return per-stage statistics."""
+        try:
+            return self._run(paths)
+        finally:
+            if self.on_finish is not None:
+                self.on_finish()
+
+    def _run(self, paths: Iterable[str]) -> Dict[str, StageStats]:
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        stats = {stage.name: StageStats(stage.name, stage.workers) for stage in self.stages}
+        lock = threading.Lock()
+        remaining = [stage.workers for stage in self.stages]
+        threads = []
+
+        def work(index: int) -> None:
+            stage = self.stages[index]
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(self.stages) else None
+            stage_stats = stats[stage.name]
+
+            try:
+                while True:
+                    item = inbox.get()
+                    if item is _DONE:
+                        break
+
+                    if item.error is None or stage.handles_errors:
+                        started = time.perf_counter()
+                        try:
+                            with span(f"stage {stage.name}", path=str(item.path)):
+                                returned = stage.func(item)
+                            if returned is None:
+                                raise TypeError(f"Stage {stage.name} returned None")
+                            item = returned
+                        except Exception as e:
+                            logger.error(f"Stage {stage.name} failed for {item.path}: {e}")
+                            item.error = e
+                            item.failed_stage = stage.name
+                        elapsed = time.perf_counter() - started
+
+                        with lock:
+                            stage_stats.busy_seconds += elapsed
+                            stage_stats.processed += 1
+                            if item.failed_stage == stage.name:
+                                stage_stats.failed += 1
+
+                    if outbox is not None:
+                        outbox.put(item)
+            finally:
+                with lock:
+                    remaining[index] -= 1
+                    last_worker = remaining[index] == 0
+                # The last worker out tells every worker of the next stage to stop
+                if last_worker and outbox is not None:
+                    for _ in range(self.stages[index + 1].workers):
+                        outbox.put(_DONE)
+
+        started = time.perf_counter()
+        for index, stage in enumerate(self.stages):
+            for i in range(stage.workers):
+                thread = threading.Thread(target=work, args=(index,), name=f"pipeline-{stage.name}-{i}",
+                                          daemon=True)
+                thread.start()
+                threads.append(thread)
+
+        try:
+            for path in paths:
+                queues[0].put(PipelineItem(path=path))
+        finally:
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+        elapsed = time.perf_counter() - started
+
+        for stage in self.stages:
+            stage_stats = stats[stage.name]
+            capacity = elapsed * stage.workers
+            stage_stats.utilization = round(stage_stats.busy_seconds / capacity, 4) if capacity else 0.0
+            logger.info(f"Stage {stage.name}: {stage_stats.processed} processed, {stage_stats.failed} failed, "
+                        f"{stage_stats.utilization:.0%} utilization across {stage.workers} worker(s)")
+        return stats
+
+
+def _parse_in_process(parser, path: str, data: Optional[bytes]) -> str:
+    return _parse_item(parser, path, data)
+
+
+def _parse_item(parser, path: str, data: Optional[bytes]) -> str:
+    # Parsers that can take the bytes the read stage loaded don't touch the disk again
+    if data is not None and hasattr(type(parser), "parse_bytes"):
+        return parser.parse_bytes(data, path)
+    return parser.parse(path)
+
+
+def build_resume_pipeline(framework: ResumeParserFramework, sink: Callable[[PipelineItem], None],
+                          read_workers: int = 2, parse_workers: Optional[int] = None,
+                          normalize_workers: int = 1, extract_workers: int = 8, sink_workers: int = 1,
+                          queue_size: int = 32, parse_in_processes: bool = False,
+                          normalizer: Optional[Callable[[str], str]] = None) -> Pipeline:
+    """Split ``parse_resume`` into read -> parse -> normalize -> extract -> sink stages.
+
+    With ``parse_in_processes`` the parse stage hands files to a process pool
+    of ``parse_workers`` processes so CPU-bound parsing is not limited by the
+    GIL; parsers must then be picklable. The read stage loads each file into
+    memory; parsers that provide ``parse_bytes(data, name)`` (the built-in
+    PDF and Word parsers do) parse those bytes, so file I/O overlaps with
+    parsing, and other parsers are given the path. The normalize stage uses
+    the framework's normalizer unless ``normalizer`` overrides it. Each resume's
+    stages run in one ResumeScope, so the framework's deadline, span and
+    profiling cover them as they do in ``parse_resume``.
+    """
+    parse_workers = parse_workers or os.cpu_count() or 1
+    normalizer = normalizer or framework.normalize_text
+    pool_lock = threading.Lock()
+    process_pool = []
+
+    def get_process_pool() -> ProcessPoolExecutor:
+        with pool_lock:
+            if not process_pool:
+                process_pool.append(ProcessPoolExecutor(max_workers=parse_workers))
+            return process_pool[0]
+
+    def shutdown_process_pool() -> None:
+        with pool_lock:
+            if process_pool:
+                process_pool.pop().shutdown()
+
+    def scoped(func: Callable[[PipelineItem], PipelineItem]) -> Callable[[PipelineItem], PipelineItem]:
+        return lambda item: item.scope.run(func, item)
+
+    def open_scope(item: PipelineItem) -> PipelineItem:
+        item.scope = ResumeScope(framework, item.path)
+        return item.scope.run(read, item)
+
+    def read(item: PipelineItem) -> PipelineItem:
+        item.parser = framework.get_parser(item.path)
+        if not os.path.isfile(item.path):
+            raise FileNotFoundError(f"File not found: {item.path}")
+        with open(item.path, "rb") as f:
+            item.data = f.read()
+        return item
+
+    def parse(item: PipelineItem) -> PipelineItem:
+        if parse_in_processes:
+            item.text = get_process_pool().submit(_parse_in_process, item.parser, item.path, item.data).result()
+        else:
+            item.text = _parse_item(item.parser, item.path, item.data)
+        item.data = None
+        return item
+
+    def normalize(item: PipelineItem) -> PipelineItem:
+        item.text = normalizer(item.text)
+        return item
+
+    def extract(item: PipelineItem) -> PipelineItem:
+        item.result = framework.extract_data(item.text)
+        return item
+
+    def write(item: PipelineItem) -> PipelineItem:
+        try:
+            sink(item)
+        finally:
+            if item.scope is not None:
+                item.scope.close()
+                item.scope = None
+        return item
+
+    return Pipeline([
+        Stage("read", open_scope, workers=read_workers, queue_size=queue_size),
+        Stage("parse", scoped(parse), workers=parse_workers, queue_size=queue_size),
+        Stage("normalize", scoped(normalize), workers=normalize_workers, queue_size=queue_size),
+        Stage("extract", scoped(extract), workers=extract_workers, queue_size=queue_size),
+        Stage("sink", write, workers=sink_workers, queue_size=queue_size, handles_errors=True),
+    ], on_finish=shutdown_process_pool)
@@ -0,0 +1,326 @@
+"""Long-lived daemon that forks warm parse workers behind a Unix socket."""
+
+import os
+import gc
+import json
+import time
+import signal
+import socket
+import logging
+from typing import Dict, Iterable, Optional
+
+from .async_logging import stop_async_logging
+from .framework import ResumeParserFramework
+
+logger = logging.getLogger(__name__)
+
+# A worker that exits sooner than this after starting is respawned with a delay
+_MIN_WORKER_LIFETIME = 1.0
+
+
+class DaemonError(RuntimeError):
+    """Raised by DaemonClient when a request fails in, or cannot reach, the daemon."""
+
+    def __init__(self, message: str, error_type: Optional[str] = None):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+class PreforkDaemon:
+    """Serve parse requests from pre-forked workers that share one warm framework.
+
+    The framework (with its imports, ``genai.configure`` and model objects)
+    is built once in the parent; ``serve_forever`` then binds ``socket_path``
+    and forks ``workers`` children that inherit it copy-on-write and accept
+    connections on the shared socket. Nothing may call the LLM in the parent
+    before forking: each worker opens its own API connection on first use.
+
+    The protocol is one JSON object per line in each direction. A request
+    is ``{"path": ..., "fields": [...], "deadline": seconds}`` (only
+    ``path`` is required) or ``{"op": "ping"}``; the reply is
+    ``{"ok": true, "result": {...}}`` or ``{"ok": false, "error": ...,
+    "type": ...}``. Paths are resolved by the daemon, so clients should
+    send absolute ones.
+
+    Each worker serves one connection at a time, so a persistent
+    connection holds a whole worker: at most ``workers`` clients are served
+    at once, and the rest wait in the listen backlog. A connection that
+    sends nothing for ``idle_timeout`` seconds is closed, and its worker
+    goes back to ``accept()``; DaemonClient reconnects transparently on its
+    next request. Clients that keep a connection open should still send
+    their requests back to back, not hold it between unrelated batches.
+
+    A worker exits after ``max_jobs_per_worker`` requests (at the end of
+    the connection it is serving) to contain leaks, and dead workers are
+    replaced. SIGTERM or SIGINT stops the daemon: workers finish the request
+    in hand, and are killed after ``shutdown_timeout`` seconds.
+    """
+
+    def __init__(self, framework: ResumeParserFramework, socket_path: str, workers: int = 4,
+                 max_jobs_per_worker: int = 1000, backlog: int = 128, shutdown_timeout: float = 30.0,
+                 idle_timeout: float = 5.0):
+        if not hasattr(os, "fork"):
+            raise RuntimeError("PreforkDaemon requires os.fork")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_jobs_per_worker < 1:
+            raise ValueError("max_jobs_per_worker must be at least 1")
+        if idle_timeout <= 0:
+            raise ValueError("idle_timeout must be positive")
+
+        self.framework = framework
+        self.socket_path = socket_path
+        self.workers = workers
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.backlog = backlog
+        self.shutdown_timeout = shutdown_timeout
+        self.idle_timeout = idle_timeout
+        self._listener: Optional[socket.socket] = None
+        self._children: Dict[int, float] = {}
+        self._stopping = False
+        self._busy = False
+        self._stats = {"started": 0, "exited": 0, "crashed": 0}
+
+    def serve_forever(self) -> None:
+        """Bind, fork the workers and keep their number up until stopped."""
+        self._stopping = False
+        self._listener = self._bind()
+        handlers = {sig: signal.signal(sig, self._request_stop) for sig in (signal.SIGTERM, signal.SIGINT)}
+        # Everything built so far is shared with the workers; keep the collector
+        # from writing to (and so copying) those pages in every child
+        gc.collect()
+        gc.freeze()
+        logger.info(f"Daemon listening on {self.socket_path} with {self.workers} workers")
+        try:
+            while not self._stopping:
+                while len(self._children) < self.workers and not self._stopping:
+                    self._spawn()
+                self._reap(block_seconds=0.1)
+        finally:
+            self._shutdown()
+            gc.unfreeze()
+            for sig, handler in handlers.items():
+                signal.signal(sig, handler)
+
+    def stop(self) -> None:
+        self._stopping = True
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats, running=len(self._children))
+
+    def _request_stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def _worker_stop(self, signum, frame) -> None:
+        # Finish the request in hand; a worker waiting for one can leave at once
+        self._stopping = True
+        if not self._busy:
+            raise SystemExit(0)
+
+    def _bind(self) -> socket.socket:
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+            except OSError:
+                os.unlink(self.socket_path)  # left behind by a daemon that was killed
+            else:
+                raise RuntimeError(f"Another daemon is already listening on {self.socket_path}")
+            finally:
+                probe.close()
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+        listener.listen(self.backlog)
+        return listener
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                code = self._worker_main()
+            except SystemExit:
+                code = 0
+            except BaseException:
+                logger.exception(f"Worker {os.getpid()} failed")
+            finally:
+                stop_async_logging()
+                os._exit(code)
+        self._children[pid] = time.monotonic()
+        self._stats["started"] += 1
+        logger.debug("Started worker %d", pid)
+
+    def _reap(self, block_seconds: float) -> None:
+        pid, status = os.waitpid(-1, os.WNOHANG)
+        if pid == 0:
+            time.sleep(block_seconds)
+            return
+        started = self._children.pop(pid, None)
+        if started is None:
+            return
+        code = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+        self._stats["exited"] += 1
+        if code != 0:
+            self._stats["crashed"] += 1
+            logger.warning(f"Worker {pid} exited with code {code}")
+        if code != 0 and time.monotonic() - started < _MIN_WORKER_LIFETIME:
+            time.sleep(_MIN_WORKER_LIFETIME)  # don't fork in a tight loop when workers die on start
+
+    def _shutdown(self) -> None:
+        self._listener.close()
+        for pid in self._children:
+            _signal(pid, signal.SIGTERM)
+        give_up = time.monotonic() + self.shutdown_timeout
+        while self._children and time.monotonic() < give_up:
+            self._reap(block_seconds=0.05)
+        for pid in self._children:
+            logger.warning(f"Killing worker {pid} after {self.shutdown_timeout:.0f}s")
+            _signal(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self._children.clear()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        logger.info(f"Daemon stopped: {self._stats}")
+
+    def _worker_main(self) -> int:
+        self._children = {}
+        signal.signal(signal.SIGTERM, self._worker_stop)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl-C reaches the whole group; the parent handles it
+        parent = os.getppid()
+        # Wake up regularly to notice a parent that died
+        self._listener.settimeout(1.0)
+
+        jobs = 0
+        while not self._stopping and jobs < self.max_jobs_per_worker:
+            try:
+                conn, _ = self._listener.accept()
+            except socket.timeout:
+                if os.getppid() != parent:
+                    logger.warning(f"Worker {os.getpid()} lost its parent, exiting")
+                    break
+                continue
+            with conn:
+                # Bounds the wait for a client's next request; parsing itself is not limited
+                conn.settimeout(self.idle_timeout)
+                jobs = self._serve_connection(conn, jobs)
+        return 0
+
+    def _serve_connection(self, conn: socket.socket, jobs: int) -> int:
+        with conn.makefile("rb") as lines:
+            try:
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    self._busy = True
+                    try:
+                        reply = self._handle(line, jobs)
+                        jobs += 1
+                        conn.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+                    finally:
+                        self._busy = False
+                    if self._stopping or jobs >= self.max_jobs_per_worker:
+                        break
+            except socket.timeout:
+                logger.debug("Closing connection idle for %.1fs", self.idle_timeout)
+            except OSError:
+                pass  # client went away
+        return jobs
+
+    def _handle(self, line: bytes, jobs: int) -> Dict[str, object]:
+        try:
+            request = json.loads(line)
+            op = request.get("op", "parse")
+            if op == "ping":
+                return {"ok": True, "pid": os.getpid(), "jobs": jobs}
+            if op != "parse":
+                raise ValueError(f"Unsupported op: {op}")
+            result = self.framework.parse_resume(request["path"], deadline_seconds=request.get("deadline"),
+                                                 fields=request.get("fields"))
+            return {"ok": True, "result": result.to_dict()}
+        except Exception as e:
+            logger.error(f"Daemon request failed: {e}")
+            return {"ok": False, "error": str(e), "type": type(e).__name__}
+
+
+def _signal(pid: int, signum: int) -> None:
+    try:
+        os.kill(pid, signum)
+    except ProcessLookupError:
+        pass
+
+
+class DaemonClient:
+    """Submit files to a PreforkDaemon over its Unix socket.
+
+    Keeps one connection open across calls. A request whose connection
+    drops before the reply (for example because its worker was recycled)
+    is retried once on a new connection.
+    """
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._conn: Optional[socket.socket] = None
+        self._reader = None
+
+    def parse(self, file_path: str, fields: Optional[Iterable[str]] = None,
+              deadline_seconds: Optional[float] = None) -> Dict[str, object]:
+        """Parse ``file_path`` in the daemon and return the result dict."""
+        request = {"path": os.path.abspath(file_path)}
+        if fields is not None:
+            request["fields"] = list(fields)
+        if deadline_seconds is not None:
+            request["deadline"] = deadline_seconds
+        return self._request(request)["result"]
+
+    def ping(self) -> Dict[str, object]:
+        return self._request({"op": "ping"})
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._reader.close()
+            self._conn.close()
+            self._conn = self._reader = None
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _request(self, request: Dict[str, object]) -> Dict[str, object]:
+        payload = json.dumps(request).encode("utf-8") + b"\n"
+        for attempt in range(2):
+            try:
+                if self._conn is None:
+                    self._connect()
+                self._conn.sendall(payload)
+                line = self._reader.readline()
+            except OSError as e:
+                self.close()
+                if attempt or not isinstance(e, ConnectionError):
+                    raise DaemonError(f"Request to daemon at {self.socket_path} failed: {e}") from e
+                continue
+            if line:
+                break
+            self.close()
+        else:
+            raise DaemonError("Daemon closed the connection without replying")
+
+        reply = json.loads(line)
+        if not reply["ok"]:
+            raise DaemonError(reply["error"], reply.get("type"))
+        return reply
+
+    def _connect(self) -> None:
+        self._conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._conn.settimeout(self.timeout)
+        try:
+            self._conn.connect(self.socket_path)
+        except OSError:
+            self._conn.close()
+            self._conn = None
+            raise
+        self._reader = self._conn.makefile("rb")
@@ -0,0 +1,214 @@
+"""Opt-in cProfile / tracemalloc profiling of individual resumes."""
+
+import io
+import os
+import time
+import pstats
+import random
+import cProfile
+import threading
+import contextvars
+import tracemalloc
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SectionProfile:
+    """Timing and allocation data for one profiled section."""
+    name: str
+    seconds: float = 0.0
+    stats: Optional[pstats.Stats] = None
+    allocations: List[tracemalloc.StatisticDiff] = field(default_factory=list)
+
+
+class ProfileSession:
+    """Profiles collected while parsing one file."""
+
+    def __init__(self, profiler: "Profiler", file_path: str):
+        self.profiler = profiler
+        self.file_path = file_path
+        self.sections: List[SectionProfile] = []
+        self.started = time.perf_counter()
+        self.report_path: Optional[str] = None
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[SectionProfile]:
+        """Run the block under cProfile and diff tracemalloc snapshots around it."""
+        section = SectionProfile(name)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler (e.g. a concurrent session) owns the hook
+            logger.warning(f"cProfile unavailable for section {name}, recording timing only")
+            profile = None
+        before = tracemalloc.take_snapshot() if self.profiler.trace_memory else None
+        started = time.perf_counter()
+        try:
+            yield section
+        finally:
+            section.seconds = time.perf_counter() - started
+            if profile is not None:
+                profile.disable()
+                try:
+                    section.stats = pstats.Stats(profile)
+                except TypeError:
+                    pass  # nothing was called inside the section
+            if before is not None:
+                after = tracemalloc.take_snapshot()
+                section.allocations = after.compare_to(before, "lineno")[:self.profiler.top_n]
+            self.sections.append(section)
+
+    def render(self) -> str:
+        total = time.perf_counter() - self.started
+        out = io.StringIO()
+        out.write(f"Profile for {self.file_path}\nTotal: {total:.3f}s\n")
+        for section in self.sections:
+            out.write(f"\n== {section.name} ({section.seconds:.3f}s) ==\n")
+            if section.stats is not None:
+                out.write("-- top functions by cumulative time --\n")
+                section.stats.stream = out
+                section.stats.sort_stats("cumulative").print_stats(self.profiler.top_n)
+            if section.allocations:
+                out.write("-- top allocation sites --\n")
+                for stat in section.allocations:
+                    out.write(f"{stat}\n")
+        return out.getvalue()
+
+    def write(self) -> str:
+        """Write the text report and a combined ``.prof`` file; return the report path."""
+        directory = Path(self.profiler.output_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = f"{Path(self.file_path).name}.{time.strftime('%Y%m%d-%H%M%S')}.{os.getpid()}.{threading.get_ident()}"
+        report_path = directory / f"{stem}.profile.txt"
+        report_path.write_text(self.render(), encoding="utf-8")
+
+        combined = pstats.Stats()
+        combined.add(*(section.stats for section in self.sections if section.stats is not None))
+        if combined.total_calls:
+            combined.dump_stats(str(directory / f"{stem}.prof"))
+        self.report_path = str(report_path)
+        return self.report_path
+
+
+class Profiler:
+    """Decide which resumes to profile and where reports go.
+
+    A resume is profiled when ``parse_resume(..., profile=True)`` asks for it,
+    or at random with probability ``sample_rate``. Reports name the top
+    ``top_n`` functions by cumulative time and, with ``trace_memory``, the
+    top allocation sites per section. tracemalloc is process-wide, so
+    allocation sites from concurrently running resumes can show up too.
+    """
+
+    def __init__(self, output_dir: str = "profiles", sample_rate: float = 0.0, top_n: int = 25,
+                 trace_memory: bool = True):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.top_n = top_n
+        self.trace_memory = trace_memory
+        self.reports: List[str] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "Profiler":
+        """Configure from RESUME_PROFILE_RATE (0-1) and RESUME_PROFILE_DIR.
+
+        Every framework reads these, so a malformed rate disables sampling
+        with an error in the log instead of failing framework construction.
+        """
+        output_dir = os.getenv("RESUME_PROFILE_DIR", "profiles")
+        value = os.getenv("RESUME_PROFILE_RATE", "").strip()
+        try:
+            sample_rate = float(value) if value else 0.0
+            if not 0.0 <= sample_rate <= 1.0:
+                raise ValueError("must be between 0 and 1")
+        except ValueError as e:
+            logger.error(f"Ignoring RESUME_PROFILE_RATE={value!r} ({e}); profiling only on request")
+            sample_rate = 0.0
+        if sample_rate:
+            logger.info(f"Profiling {sample_rate:.2%} of resumes into {output_dir}")
+        return cls(output_dir=output_dir, sample_rate=sample_rate)
+
+    def should_profile(self, requested: Optional[bool] = None) -> bool:
+        if requested is not None:
+            return requested
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    @contextmanager
+    def session(self, file_path: str) -> Iterator[ProfileSession]:
+        """Profile everything run through ``profile_section`` inside the block."""
+        session = ProfileSession(self, file_path)
+        if self.trace_memory:
+            acquire_tracemalloc()
+        token = _current_session.set(session)
+        try:
+            yield session
+        finally:
+            _current_session.reset(token)
+            if self.trace_memory:
+                release_tracemalloc()
+            try:
+                report = session.write()
+            except OSError as e:
+                logger.error(f"Could not write profile for {file_path}: {e}")
+            else:
+                with self._lock:
+                    self.reports.append(report)
+                logger.info(f"Profile for {file_path} written to {report}")
+
+
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+
+
+def acquire_tracemalloc() -> None:
+    """Make sure tracemalloc is tracing until the matching ``release_tracemalloc``.
+
+    Shared by profile sessions and PDFParser(track_memory=True), so one user
+    finishing never stops tracing under another. Tracing that was already
+    on before the first user (started by the application) is never stopped.
+    """
+    global _tracing_users
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_users = 1
+        elif _tracing_users:
+            _tracing_users += 1
+
+
+def release_tracemalloc() -> None:
+    global _tracing_users
+    with _tracing_lock:
+        if _tracing_users:
+            _tracing_users -= 1
+            if _tracing_users == 0:
+                tracemalloc.stop()
+
+
+_current_session: contextvars.ContextVar = contextvars.ContextVar("profile_session", default=None)
+
+
+def current_session() -> Optional[ProfileSession]:
+    """Return the profile session of the resume being processed, if any."""
+    return _current_session.get()
+
+
+@contextmanager
+def profile_section(name: str) -> Iterator[None]:
+    """Profile the block as ``name`` when a session is active; otherwise a no-op."""
+    session = _current_session.get()
+    if session is None:
+        yield
+        return
+    with session.section(name):
+        yield
@@ -0,0 +1,222 @@
+"""Durable SQLite result store with batched, upserting writes."""
+
+import json
+import queue
+import sqlite3
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+from ..models.resume_data import ResumeData
+from .hashing import hash_file
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+@dataclass
+class StoredResult:
+    """A result row with its provenance."""
+    content_hash: str
+    path: str
+    result: ResumeData
+    created_at: float
+    updated_at: float
+
+
+class ResultStore:
+    """Keep every parsed resume in a SQLite database in WAL mode.
+
+    ``put`` only enqueues; a single writer thread drains the queue and
+    commits up to ``batch_size`` rows per transaction, so concurrent workers
+    never contend for the write lock. Rows are keyed by the file's content
+    hash: re-parsing the same bytes (under any path) updates the existing
+    row instead of adding a duplicate. Reads use their own per-thread
+    connections and see committed batches while writes continue.
+    """
+
+    SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    content_hash TEXT NOT NULL UNIQUE,
+    path TEXT NOT NULL,
+    name TEXT,
+    email TEXT,
+    skills TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_path ON results (path);
+"""
+
+    UPSERT = """
+INSERT INTO results (content_hash, path, name, email, skills, created_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (content_hash) DO UPDATE SET
+    path = excluded.path,
+    name = excluded.name,
+    email = excluded.email,
+    skills = excluded.skills,
+    updated_at = excluded.updated_at
+"""
+
+    def __init__(self, db_path: str, batch_size: int = 500, max_pending: int = 10_000):
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._local = threading.local()
+        self._pending: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+        self._writer_conn = self._connect()
+        self._writer_conn.executescript(self.SCHEMA)
+        self._writer = threading.Thread(target=self._write_loop, name="result-store-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _conn(self) -> sqlite3.Connection:
+        # Read connection per thread; the writer thread has its own
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def put(self, result: ResumeData, path: str, content_hash: Optional[str] = None) -> None:
+        """Queue a result for writing; the file is hashed when no hash is given."""
+        if self._closed:
+            raise RuntimeError("ResultStore is closed")
+        self._raise_writer_error()
+        if content_hash is None:
+            content_hash = hash_file(path)
+        self._pending.put((content_hash, str(path), result, time.time()))
+
+    def pipeline_sink(self, item) -> None:
+        """Sink for build_resume_pipeline: store successful results, skip failures."""
+        if item.error is None and item.result is not None:
+            self.put(item.result, item.path)
+
+    def flush(self) -> None:
+        """Block until every queued result is committed."""
+        self._pending.join()
+        self._raise_writer_error()
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._pending.put(_STOP)
+            self._writer.join()
+            self._writer_conn.close()
+            conn = getattr(self._local, "conn", None)
+            if conn is not None:
+                conn.close()
+                self._local.conn = None
+            logger.info(f"Stored {self.rows_written} result(s) in {self.db_path}")
+        self._raise_writer_error()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def get(self, content_hash: str) -> Optional[StoredResult]:
+        row = self._conn().execute(
+            "SELECT content_hash, path, name, email, skills, created_at, updated_at "
+            "FROM results WHERE content_hash = ?", (content_hash,)).fetchone()
+        return _to_stored(row) if row else None
+
+    def find_by_path(self, path: str) -> List[StoredResult]:
+        rows = self._conn().execute(
+            "SELECT content_hash, path, name, email, skills, created_at, updated_at "
+            "FROM results WHERE path = ? ORDER BY id", (str(path),))
+        return [_to_stored(row) for row in rows]
+
+    def count(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def iter_results(self, since: Optional[float] = None, page_size: int = 1000) -> Iterator[StoredResult]:
+        """Stream results in insertion order, ``page_size`` rows per query.
+
+        Pages are fetched by primary key, so no read transaction stays open
+        between pages and memory use is independent of the table size.
+        ``since`` limits the stream to rows updated at or after that time.
+        """
+        last_id = 0
+        while True:
+            rows = self._conn().execute(
+                "SELECT id, content_hash, path, name, email, skills, created_at, updated_at FROM results "
+                "WHERE id > ? AND updated_at >= ? ORDER BY id LIMIT ?",
+                (last_id, since if since is not None else 0, page_size)).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield _to_stored(row[1:])
+            last_id = rows[-1][0]
+
+    def _write_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self._pending.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows = []
+            for entry in batch:
+                if entry is _STOP:
+                    stopping = True
+                else:
+                    rows.append(entry)
+            try:
+                if rows and self._error is None:
+                    self._write_batch(rows)
+            except Exception as e:
+                logger.error(f"Failed to write {len(rows)} result(s): {e}")
+                self._error = e
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+
+    def _write_batch(self, rows: List[Tuple[str, str, ResumeData, float]]) -> None:
+        conn = self._writer_conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(self.UPSERT, (
+                (content_hash, path, result.name, result.email, json.dumps(result.skills or []), at, at)
+                for content_hash, path, result, at in rows
+            ))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self.rows_written += len(rows)
+        logger.debug("Committed batch of %d result(s)", len(rows))
+
+    def _raise_writer_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"ResultStore writer failed: {self._error}") from self._error
+
+
+def _to_stored(row) -> StoredResult:
+    content_hash, path, name, email, skills, created_at, updated_at = row
+    return StoredResult(
+        content_hash=content_hash,
+        path=path,
+        result=ResumeData(name=name, email=email, skills=json.loads(skills)),
+        created_at=created_at,
+        updated_at=updated_at,
+    )
@@ -0,0 +1,277 @@
+"""Deterministic sharding of corpus runs across machines, and merging of their partitions."""
+
+import os
+import json
+import time
+import socket
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from .framework import ResumeParserFramework
+from .hashing import hash_file
+
+logger = logging.getLogger(__name__)
+
+SHARD_KEYS = ("path", "content")
+
+
+def stable_hash(value: str) -> int:
+    """64-bit hash that is the same on every machine and Python version (unlike ``hash``)."""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One of ``count`` disjoint slices of a corpus (``index`` is 0-based)."""
+    index: int
+    count: int
+    key: str = "path"
+
+    def __post_init__(self):
+        if self.count < 1 or not 0 <= self.index < self.count:
+            raise ValueError(f"Invalid shard {self.index + 1}/{self.count}")
+        if self.key not in SHARD_KEYS:
+            raise ValueError(f"Unsupported shard key: {self.key}. Supported: {list(SHARD_KEYS)}")
+
+    @classmethod
+    def parse(cls, spec: str, key: str = "path") -> "Shard":
+        """Parse ``i/N`` with a 1-based ``i``: ``1/4`` through ``4/4``."""
+        try:
+            index, count = (int(part) for part in spec.split("/"))
+        except ValueError:
+            raise ValueError(f"Shard must look like i/N, got {spec!r}") from None
+        return cls(index - 1, count, key)
+
+    @property
+    def name(self) -> str:
+        return f"part-{self.index + 1:05d}-of-{self.count:05d}"
+
+    def owns(self, key_value: str) -> bool:
+        return stable_hash(key_value) % self.count == self.index
+
+
+def list_inputs(root: str, extensions: Iterable[str]) -> List[str]:
+    """Supported files under ``root`` as sorted, '/'-separated paths relative to it.
+
+    Relative paths keep shard assignment identical on nodes that mount the
+    corpus in different places.
+    """
+    supported = {ext.lower() for ext in extensions}
+    found = []
+    for directory, _, files in os.walk(root):
+        for name in files:
+            if os.path.splitext(name)[1].lower() in supported:
+                found.append(Path(os.path.relpath(os.path.join(directory, name), root)).as_posix())
+    return sorted(found)
+
+
+@dataclass
+class ShardReport:
+    """Summary of one node's run."""
+    shard: str
+    assigned: int = 0
+    parsed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    duration: float = 0.0
+
+
+class ShardRunner:
+    """Parse this node's share of a corpus into its own partition.
+
+    Writes ``<shard name>.jsonl`` (one record per file) and
+    ``<shard name>.manifest.json`` (shard, key, every assigned item id and a
+    completion flag) to ``output_dir``, which may be shared storage or
+    collected afterwards. Files already parsed by an earlier run of the same
+    shard are skipped, so a node can simply be restarted.
+
+    With ``key="content"`` files are assigned by content hash, so identical
+    files always land on the same shard; every node then reads every file
+    once to hash it. The default ``"path"`` key only lists the tree.
+    """
+
+    def __init__(self, framework: ResumeParserFramework, root: str, shard: Shard, output_dir: str,
+                 workers: int = 4):
+        self.framework = framework
+        self.root = root
+        self.shard = shard
+        self.output_dir = Path(output_dir)
+        self.workers = workers
+
+    @property
+    def partition_path(self) -> Path:
+        return self.output_dir / f"{self.shard.name}.jsonl"
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.output_dir / f"{self.shard.name}.manifest.json"
+
+    def assigned(self) -> List[str]:
+        """Item ids (relative paths) belonging to this shard."""
+        items = list_inputs(self.root, self.framework.supported_file_types)
+        if self.shard.key == "path":
+            return [item for item in items if self.shard.owns(item)]
+        return [item for item in items if self.shard.owns(hash_file(os.path.join(self.root, item)))]
+
+    def run(self) -> ShardReport:
+        started = time.monotonic()
+        report = ShardReport(shard=self.shard.name)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        items = self.assigned()
+        report.assigned = len(items)
+        self._write_manifest(items, complete=False)
+
+        done = self._completed_items()
+        pending = [item for item in items if item not in done]
+        report.skipped = len(items) - len(pending)
+        logger.info(f"Shard {self.shard.name}: {len(items)} assigned, {len(pending)} to parse")
+
+        with open(self.partition_path, "a", encoding="utf-8") as out, \
+                ThreadPoolExecutor(max_workers=self.workers) as pool:
+            if out.tell() and not self._ends_with_newline():
+                out.write("\n")
+            for record in pool.map(self._parse, pending):
+                out.write(json.dumps(record) + "\n")
+                if "error" in record:
+                    report.failed += 1
+                else:
+                    report.parsed += 1
+
+        self._write_manifest(items, complete=True)
+        report.duration = time.monotonic() - started
+        logger.info(f"Shard {self.shard.name} finished in {report.duration:.2f}s: {report}")
+        return report
+
+    def _parse(self, item: str) -> Dict[str, object]:
+        path = os.path.join(self.root, item)
+        record = {"id": item, "shard": self.shard.index}
+        try:
+            record["content_hash"] = hash_file(path)
+            record["result"] = self.framework.parse_resume(path).to_dict()
+        except Exception as e:
+            logger.error(f"Failed to parse {item}: {e}")
+            record["error"] = str(e)
+        return record
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.partition_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _completed_items(self) -> set:
+        if not self.partition_path.exists():
+            return set()
+        return {record["id"] for record in _read_partition(self.partition_path) if "result" in record}
+
+    def _write_manifest(self, items: List[str], complete: bool) -> None:
+        manifest = {
+            "shard": self.shard.index,
+            "shards": self.shard.count,
+            "key": self.shard.key,
+            "host": socket.gethostname(),
+            "complete": complete,
+            "updated_at": time.time(),
+            "items": items,
+        }
+        temp_path = self.manifest_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(temp_path, self.manifest_path)
+
+
+@dataclass
+class MergeReport:
+    """What a merge found across all partitions."""
+    shards: int = 0
+    expected: int = 0
+    merged: int = 0
+    failed: int = 0
+    missing_shards: List[int] = field(default_factory=list)
+    incomplete_shards: List[int] = field(default_factory=list)
+    missing_items: List[str] = field(default_factory=list)
+    duplicate_items: List[str] = field(default_factory=list)
+    duplicate_content: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True when every shard finished and every item appears exactly once."""
+        return not (self.missing_shards or self.incomplete_shards or self.missing_items or self.duplicate_items)
+
+
+def merge_partitions(input_dir: str, output_path: str) -> MergeReport:
+    """Combine shard partitions into one JSONL file sorted by item id.
+
+    Within a partition the last record for an item wins (reruns append).
+    An item recorded by more than one shard, or assigned to a shard but
+    never recorded, is reported; so are shards without a manifest and
+    distinct items with identical content. The output is written even when
+    problems are found; check ``MergeReport.ok``.
+    """
+    directory = Path(input_dir)
+    report = MergeReport()
+    manifests = {}
+    for manifest_path in sorted(directory.glob("part-*.manifest.json")):
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if report.shards and manifest["shards"] != report.shards:
+            raise ValueError(f"{manifest_path.name} is from a {manifest['shards']}-shard run, "
+                             f"others are from a {report.shards}-shard run")
+        report.shards = manifest["shards"]
+        manifests[manifest["shard"]] = manifest
+    if not manifests:
+        raise ValueError(f"No shard manifests found in {input_dir}")
+
+    report.missing_shards = [index for index in range(report.shards) if index not in manifests]
+    report.incomplete_shards = sorted(index for index, manifest in manifests.items() if not manifest["complete"])
+    expected = {item for manifest in manifests.values() for item in manifest["items"]}
+    report.expected = len(expected)
+
+    records: Dict[str, Dict[str, object]] = {}
+    owners: Dict[str, set] = {}
+    for index in sorted(manifests):
+        shard = Shard(index, report.shards, manifests[index]["key"])
+        partition_path = directory / f"{shard.name}.jsonl"
+        if not partition_path.exists():
+            continue
+        for record in _read_partition(partition_path):
+            owners.setdefault(record["id"], set()).add(index)
+            existing = records.get(record["id"])
+            if existing is None or existing["shard"] == index:
+                records[record["id"]] = record
+
+    report.duplicate_items = sorted(item for item, shards in owners.items() if len(shards) > 1)
+    report.missing_items = sorted(expected - records.keys())
+
+    by_content: Dict[str, List[str]] = {}
+    with open(output_path, "w", encoding="utf-8") as out:
+        for item in sorted(records):
+            record = records[item]
+            out.write(json.dumps(record) + "\n")
+            if "error" in record:
+                report.failed += 1
+            else:
+                report.merged += 1
+            if record.get("content_hash"):
+                by_content.setdefault(record["content_hash"], []).append(item)
+    report.duplicate_content = {digest: items for digest, items in by_content.items() if len(items) > 1}
+
+    log = logger.info if report.ok else logger.warning
+    log(f"Merged {report.merged} result(s) and {report.failed} failure(s) from {len(manifests)} of "
+        f"{report.shards} shard(s) into {output_path}; missing items: {len(report.missing_items)}, "
+        f"duplicate items: {len(report.duplicate_items)}")
+    return report
+
+
+def _read_partition(path: Path) -> Iterable[Dict[str, object]]:
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A node killed mid-write leaves a truncated last line
+                logger.warning(f"Skipping unreadable line {line_number} in {path.name}")
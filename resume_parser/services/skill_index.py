@@ -0,0 +1,366 @@
+"""In-memory inverted index from skills to resumes."""
+
+import os
+import re
+import json
+import mmap
+import bisect
+import struct
+import logging
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from ..models.resume_data import ResumeData
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency; posting lists are then merged in Python
+    np = None
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"SKIX0001"
+_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+_OPERATORS = {"AND", "OR", "NOT"}
+
+Postings = Union[array, memoryview]
+
+
+class SkillIndex:
+    """Map each normalized skill to a sorted posting list of document ids.
+
+    Document ids are assigned sequentially by ``add``, so appending keeps
+    every posting list sorted without re-sorting. Posting lists are
+    ``array('I')`` (4 bytes per entry); an index opened with ``load`` serves
+    them as zero-copy views into a memory-mapped file and only copies a
+    list when new documents are appended to it. Queries combine the sorted
+    posting lists directly, with numpy when it is installed and bisect merges
+    otherwise, and only turn the final list into Python ints.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Postings] = {}
+        self._sorted_skills: Optional[List[str]] = None
+        self._keys: List[Optional[str]] = []
+        self._deleted: Set[int] = set()
+        self._mmap: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        return len(self._keys) - len(self._deleted)
+
+    @staticmethod
+    def normalize(skill: str) -> str:
+        return " ".join(skill.lower().split())
+
+    def add(self, skills: Iterable[str], key: Optional[str] = None) -> int:
+        """Index one resume's skills and return its document id."""
+        doc_id = len(self._keys)
+        self._keys.append(key)
+        for skill in {self.normalize(s) for s in skills or () if s and s.strip()}:
+            postings = self._postings.get(skill)
+            if postings is None:
+                self._postings[skill] = array("I", [doc_id])
+                self._sorted_skills = None
+            else:
+                if not isinstance(postings, array):
+                    # Copy-on-write for lists still backed by the memory map
+                    postings = self._postings[skill] = array("I", postings)
+                postings.append(doc_id)
+        return doc_id
+
+    def add_result(self, result: ResumeData, key: Optional[str] = None) -> int:
+        return self.add(result.skills or [], key)
+
+    def remove(self, doc_id: int) -> None:
+        """Hide a document from all future queries."""
+        if not 0 <= doc_id < len(self._keys):
+            raise KeyError(doc_id)
+        self._deleted.add(doc_id)
+
+    def key(self, doc_id: int) -> Optional[str]:
+        return self._keys[doc_id]
+
+    def postings(self, skill: str) -> Postings:
+        return self._postings.get(self.normalize(skill), array("I"))
+
+    def skills(self) -> List[str]:
+        if self._sorted_skills is None:
+            self._sorted_skills = sorted(self._postings)
+        return self._sorted_skills
+
+    def prefix(self, prefix: str) -> List[int]:
+        """Documents having any skill that starts with ``prefix``."""
+        return self._finish(self._prefix_postings(self.normalize(prefix)))
+
+    def all_of(self, skills: Iterable[str]) -> List[int]:
+        return self.search(" AND ".join(_quote(s) for s in skills))
+
+    def any_of(self, skills: Iterable[str]) -> List[int]:
+        return self.search(" OR ".join(_quote(s) for s in skills))
+
+    def search(self, query: str) -> List[int]:
+        """Evaluate a boolean query such as ``python AND (aws OR gcp) AND NOT php``.
+
+        Terms may be quoted (``"machine learning"``) and a trailing ``*``
+        makes a prefix term (``py*``). Adjacent terms without an operator are
+        ANDed. Returns sorted document ids.
+        """
+        tokens = _tokenize(query)
+        if not tokens:
+            return []
+        parser = _QueryParser(tokens, self)
+        negated, ids = parser.parse()
+        if negated:
+            ids = _difference(_all_ids(len(self._keys)), ids)
+        return self._finish(ids)
+
+    def save(self, path: str) -> None:
+        """Write the index to ``path`` in a layout that ``load`` can memory-map.
+
+        The file is written beside ``path`` and renamed over it, so an index
+        loaded from ``path`` keeps its mapped posting lists while saving.
+        """
+        skills = self.skills()
+        directory = []
+        offset = 0
+        for skill in skills:
+            count = len(self._postings[skill])
+            directory.append([skill, offset, count])
+            offset += count * 4
+        header = json.dumps({
+            "skills": directory,
+            "keys": self._keys,
+            "deleted": sorted(self._deleted),
+        }).encode("utf-8")
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            f.write(b"\0" * (-f.tell() % 4))
+            for skill in skills:
+                postings = self._postings[skill]
+                f.write(postings.tobytes() if isinstance(postings, array) else bytes(postings))
+        os.replace(temp_path, path)
+        logger.info(f"Saved skill index with {len(skills)} skills and {len(self._keys)} documents to {path}")
+
+    @classmethod
+    def load(cls, path: str) -> "SkillIndex":
+        """Open a saved index; posting lists stay in the page cache until touched."""
+        index = cls()
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapped[:len(_MAGIC)] != _MAGIC:
+            mapped.close()
+            raise ValueError(f"Not a skill index file: {path}")
+
+        header_length = struct.unpack_from("<Q", mapped, len(_MAGIC))[0]
+        header_start = len(_MAGIC) + 8
+        header = json.loads(mapped[header_start:header_start + header_length])
+        data_start = header_start + header_length
+        data_start += -data_start % 4
+
+        view = memoryview(mapped)
+        for skill, offset, count in header["skills"]:
+            start = data_start + offset
+            index._postings[skill] = view[start:start + count * 4].cast("I")
+        index._keys = header["keys"]
+        index._deleted = set(header["deleted"])
+        index._mmap = mapped
+        return index
+
+    def _prefix_postings(self, prefix: str) -> Postings:
+        skills = self.skills()
+        ids: Postings = array("I")
+        position = bisect.bisect_left(skills, prefix)
+        while position < len(skills) and skills[position].startswith(prefix):
+            ids = _union(ids, self._postings[skills[position]])
+            position += 1
+        return ids
+
+    def _term_postings(self, term: str) -> Postings:
+        if term.endswith("*"):
+            return self._prefix_postings(self.normalize(term[:-1]))
+        return self._postings.get(self.normalize(term), array("I"))
+
+    def _finish(self, ids: Postings) -> List[int]:
+        if self._deleted:
+            ids = _difference(ids, array("I", sorted(self._deleted)))
+        return ids.tolist()
+
+
+def _all_ids(count: int) -> Postings:
+    return np.arange(count, dtype=np.uint32) if np is not None else array("I", range(count))
+
+
+def _intersect(left: Postings, right: Postings) -> Postings:
+    """Ids in both sorted lists; walks the shorter one and gallops through the longer with bisect."""
+    if np is not None:
+        return np.intersect1d(_view(left), _view(right), assume_unique=True)
+    if len(left) > len(right):
+        left, right = right, left
+    result = array("I")
+    position, end = 0, len(right)
+    for doc_id in left:
+        position = bisect.bisect_left(right, doc_id, position)
+        if position == end:
+            break
+        if right[position] == doc_id:
+            result.append(doc_id)
+            position += 1
+    return result
+
+
+def _union(left: Postings, right: Postings) -> Postings:
+    """Ids in either sorted list; runs of the longer list between ids of the shorter are copied as slices."""
+    if np is not None:
+        return np.union1d(_view(left), _view(right))
+    if len(left) > len(right):
+        left, right = right, left
+    result = array("I")
+    position, end = 0, len(right)
+    for doc_id in left:
+        found = bisect.bisect_left(right, doc_id, position)
+        result.extend(right[position:found])
+        if found < end and right[found] == doc_id:
+            found += 1
+        result.append(doc_id)
+        position = found
+    result.extend(right[position:])
+    return result
+
+
+def _difference(left: Postings, right: Postings) -> Postings:
+    """Ids of sorted ``left`` that are not in sorted ``right``."""
+    if np is not None:
+        return np.setdiff1d(_view(left), _view(right), assume_unique=True)
+    result = array("I")
+    if len(right) < len(left):
+        # Few exclusions: copy the runs of ``left`` between them
+        position, end = 0, len(left)
+        for doc_id in right:
+            found = bisect.bisect_left(left, doc_id, position)
+            result.extend(left[position:found])
+            position = found + 1 if found < end and left[found] == doc_id else found
+        result.extend(left[position:])
+        return result
+    position, end = 0, len(right)
+    for doc_id in left:
+        position = bisect.bisect_left(right, doc_id, position)
+        if position == end or right[position] != doc_id:
+            result.append(doc_id)
+    return result
+
+
+def _view(postings: Postings):
+    """Zero-copy numpy view of a posting list."""
+    return postings if isinstance(postings, np.ndarray) else np.frombuffer(postings, dtype=np.uint32)
+
+
+def _quote(skill: str) -> str:
+    return '"' + skill.replace('"', "") + '"'
+
+
+def _tokenize(query: str) -> List[Tuple[str, str]]:
+    tokens = []
+    position = 0
+    query = query.strip()
+    while position < len(query):
+        match = _TOKEN.match(query, position)
+        if match is None:
+            break
+        position = match.end()
+        open_paren, close_paren, quoted, word = match.groups()
+        if open_paren:
+            tokens.append(("(", open_paren))
+        elif close_paren:
+            tokens.append((")", close_paren))
+        elif quoted is not None:
+            tokens.append(("term", quoted))
+        elif word.upper() in _OPERATORS:
+            tokens.append((word.upper(), word))
+        else:
+            tokens.append(("term", word))
+    return tokens
+
+
+class _QueryParser:
+    """Recursive-descent evaluator producing (negated, ids) pairs.
+
+    Keeping NOT symbolic lets ``a AND NOT b`` run as a difference
+    instead of materializing the complement of ``b``.
+    """
+
+    def __init__(self, tokens: List[Tuple[str, str]], index: SkillIndex):
+        self.tokens = tokens
+        self.position = 0
+        self.index = index
+
+    def parse(self) -> Tuple[bool, Postings]:
+        result = self._or()
+        if self.position != len(self.tokens):
+            raise ValueError(f"Unexpected token in query: {self.tokens[self.position][1]!r}")
+        return result
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def _or(self) -> Tuple[bool, Postings]:
+        left = self._and()
+        while self._peek() == "OR":
+            self.position += 1
+            left = _combine_or(left, self._and())
+        return left
+
+    def _and(self) -> Tuple[bool, Postings]:
+        left = self._not()
+        while self._peek() in ("AND", "NOT", "term", "("):
+            if self._peek() == "AND":
+                self.position += 1
+            left = _combine_and(left, self._not())
+        return left
+
+    def _not(self) -> Tuple[bool, Postings]:
+        if self._peek() == "NOT":
+            self.position += 1
+            negated, ids = self._not()
+            return not negated, ids
+        return self._atom()
+
+    def _atom(self) -> Tuple[bool, Postings]:
+        kind = self._peek()
+        if kind == "(":
+            self.position += 1
+            result = self._or()
+            if self._peek() != ")":
+                raise ValueError("Unbalanced parentheses in query")
+            self.position += 1
+            return result
+        if kind == "term":
+            term = self.tokens[self.position][1]
+            self.position += 1
+            return False, self.index._term_postings(term)
+        raise ValueError("Query ended unexpectedly" if kind is None else f"Unexpected token in query: {kind!r}")
+
+
+def _combine_and(left: Tuple[bool, Postings], right: Tuple[bool, Postings]) -> Tuple[bool, Postings]:
+    (left_neg, left_ids), (right_neg, right_ids) = left, right
+    if not left_neg and not right_neg:
+        return False, _intersect(left_ids, right_ids)
+    if not left_neg:
+        return False, _difference(left_ids, right_ids)
+    if not right_neg:
+        return False, _difference(right_ids, left_ids)
+    return True, _union(left_ids, right_ids)
+
+
+def _combine_or(left: Tuple[bool, Postings], right: Tuple[bool, Postings]) -> Tuple[bool, Postings]:
+    (left_neg, left_ids), (right_neg, right_ids) = left, right
+    if not left_neg and not right_neg:
+        return False, _union(left_ids, right_ids)
+    if not left_neg:
+        return True, _difference(right_ids, left_ids)
+    if not right_neg:
+        return True, _difference(left_ids, right_ids)
+    return True, _intersect(left_ids, right_ids)
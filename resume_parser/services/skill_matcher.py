@@ -0,0 +1,165 @@
+"""Vectorized candidate-to-job skill matching over a sparse skill matrix."""
+
+import logging
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+from ..models.resume_data import ResumeData
+
+try:
+    import numpy as np
+    import scipy.sparse as sp
+except ImportError:  # optional dependency, only needed for matching
+    np = None
+    sp = None
+
+logger = logging.getLogger(__name__)
+
+JobSkills = Union[Sequence[str], Mapping[str, float]]
+
+
+@dataclass
+class Match:
+    """A ranked candidate for a job."""
+    doc_id: int
+    key: Optional[str]
+    score: float
+
+
+class SkillMatcher:
+    """Rank resumes against job requisitions by skill overlap.
+
+    The corpus is encoded once as a binary CSR matrix (resumes x skills).
+    Scoring a job is a single sparse matrix-vector product followed by a
+    per-resume normalization, and a batch of jobs is one sparse
+    matrix-matrix product. Top-k uses ``argpartition`` so only k scores are
+    fully sorted.
+
+    Methods: ``overlap`` (sum of matched job weights), ``jaccard`` (on skill
+    sets) and ``bm25`` (binary term frequency, document length = skill count).
+    """
+
+    METHODS = ("overlap", "jaccard", "bm25")
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        if np is None or sp is None:
+            raise ImportError("numpy and scipy are required for skill matching: pip install numpy scipy")
+
+        self.k1 = k1
+        self.b = b
+        self._vocabulary: Dict[str, int] = {}
+        self._keys: List[Optional[str]] = []
+        self._indices = array("i")
+        self._indptr = array("q", [0])
+        self._matrix = None
+        self._doc_lengths = None
+        self._idf = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def normalize(skill: str) -> str:
+        return " ".join(skill.lower().split())
+
+    @classmethod
+    def from_results(cls, results: Iterable[ResumeData], keys: Optional[Iterable[str]] = None,
+                     **kwargs) -> "SkillMatcher":
+        matcher = cls(**kwargs)
+        keys = iter(keys) if keys is not None else None
+        for result in results:
+            matcher.add(result.skills or [], next(keys) if keys is not None else None)
+        return matcher
+
+    def add(self, skills: Iterable[str], key: Optional[str] = None) -> int:
+        """Append one resume; the matrix is rebuilt lazily on the next query."""
+        columns = set()
+        for skill in skills:
+            if skill and skill.strip():
+                columns.add(self._vocabulary.setdefault(self.normalize(skill), len(self._vocabulary)))
+        self._indices.extend(sorted(columns))
+        self._indptr.append(len(self._indices))
+        self._keys.append(key)
+        self._matrix = None
+        return len(self._keys) - 1
+
+    def build(self) -> None:
+        """Encode the corpus as CSR and precompute per-resume statistics."""
+        # Copy out of the arrays so ``add`` can keep growing them
+        indices = np.array(self._indices, dtype=np.int32)
+        indptr = np.array(self._indptr, dtype=np.int64)
+        data = np.ones(len(indices), dtype=np.float32)
+        self._matrix = sp.csr_matrix((data, indices, indptr), shape=(len(self._keys), len(self._vocabulary)))
+
+        self._doc_lengths = np.diff(indptr).astype(np.float32)
+        document_frequency = np.bincount(indices, minlength=len(self._vocabulary)).astype(np.float32)
+        n = float(len(self._keys))
+        self._idf = np.log((n - document_frequency + 0.5) / (document_frequency + 0.5) + 1.0).astype(np.float32)
+        logger.info(f"Built skill matrix: {self._matrix.shape[0]} resumes x {self._matrix.shape[1]} skills, "
+                    f"{self._matrix.nnz} entries")
+
+    def top_k(self, job: JobSkills, k: int = 10, method: str = "overlap") -> List[Match]:
+        return self.top_k_batch([job], k=k, method=method)[0]
+
+    def top_k_batch(self, jobs: Sequence[JobSkills], k: int = 10, method: str = "overlap") -> List[List[Match]]:
+        """Score every job against the corpus in one pass and return the top ``k`` per job."""
+        scores = self.score_batch(jobs, method)
+        return [self._select(scores[:, column], k) for column in range(scores.shape[1])]
+
+    def score_batch(self, jobs: Sequence[JobSkills], method: str = "overlap"):
+        """Dense (resumes x jobs) score matrix."""
+        if method not in self.METHODS:
+            raise ValueError(f"Unsupported method: {method}. Supported: {list(self.METHODS)}")
+        if self._matrix is None:
+            self.build()
+
+        query = self._encode_jobs(jobs)
+        if method == "overlap":
+            return (self._matrix @ query).toarray().astype(np.float32, copy=False)
+
+        if method == "jaccard":
+            binary = query.copy()
+            binary.data[:] = 1.0
+            intersection = (self._matrix @ binary).toarray().astype(np.float32, copy=False)
+            # Skills missing from the corpus vocabulary are not in the query matrix but still count toward the union
+            job_sizes = np.asarray([[len(self._job_skills(job)) for job in jobs]], dtype=np.float32)
+            union = self._doc_lengths[:, None] + job_sizes - intersection
+            return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+        # BM25 with binary tf: each matched term contributes idf * (k1 + 1) / (1 + k1 * length_norm)
+        weighted = sp.diags(self._idf) @ query
+        raw = (self._matrix @ weighted).toarray().astype(np.float32, copy=False)
+        average_length = float(self._doc_lengths.mean()) if len(self._doc_lengths) else 0.0
+        length_norm = 1.0 - self.b + self.b * (self._doc_lengths / average_length if average_length else 0.0)
+        return raw * ((self.k1 + 1.0) / (1.0 + self.k1 * length_norm))[:, None]
+
+    def _job_skills(self, job: JobSkills) -> set:
+        return {self.normalize(skill) for skill in job if skill and skill.strip()}
+
+    def _encode_jobs(self, jobs: Sequence[JobSkills]):
+        rows, columns, weights = [], [], []
+        for column, job in enumerate(jobs):
+            items = job.items() if isinstance(job, Mapping) else ((skill, 1.0) for skill in job)
+            seen = set()
+            for skill, weight in items:
+                row = self._vocabulary.get(self.normalize(skill))
+                if row is None or row in seen:
+                    continue
+                seen.add(row)
+                rows.append(row)
+                columns.append(column)
+                weights.append(weight)
+        return sp.csc_matrix((np.asarray(weights, dtype=np.float32), (rows, columns)),
+                             shape=(len(self._vocabulary), len(jobs)))
+
+    def _select(self, scores, k: int) -> List[Match]:
+        if k < 1:
+            return []
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            # Partial selection: O(n) to find the k best, then sort only those
+            candidates = np.sort(candidates[np.argpartition(-scores[candidates], k - 1)[:k]])
+        # Stable sort keeps ties in document order
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [Match(doc_id=int(i), key=self._keys[i], score=float(scores[i])) for i in order]
@@ -0,0 +1,196 @@
+"""Lightweight span tracing with Chrome trace-event and OTLP JSON export."""
+
+import os
+import json
+import time
+import random
+import threading
+import contextvars
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """One timed operation."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: Optional[int] = None
+    thread_id: int = 0
+    thread_name: str = ""
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.end_ns or time.time_ns()) - self.start_ns
+
+
+class Tracer:
+    """Collect finished spans in memory and write them out as JSON.
+
+    ``export(path, "chrome")`` writes the trace-event format understood by
+    Perfetto and chrome://tracing (one track per thread, so overlap and idle
+    gaps are visible); ``"otlp"`` writes the OTLP/JSON ``resourceSpans``
+    layout. At most ``max_spans`` spans are kept; later ones are counted in
+    ``dropped`` and discarded.
+    """
+
+    FORMATS = ("chrome", "otlp")
+
+    def __init__(self, service_name: str = "resume-parser", max_spans: int = 1_000_000):
+        self.service_name = service_name
+        self.max_spans = max_spans
+        self.dropped = 0
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, parent: Optional[Span] = None, **attributes) -> Span:
+        thread = threading.current_thread()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else f"{random.getrandbits(128):032x}",
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent.span_id if parent is not None else None,
+            start_ns=time.time_ns(),
+            thread_id=thread.ident or 0,
+            thread_name=thread.name,
+            attributes=attributes,
+        )
+
+    def finish(self, span: Span) -> None:
+        span.end_ns = time.time_ns()
+        with self._lock:
+            if len(self._spans) < self.max_spans:
+                self._spans.append(span)
+            else:
+                self.dropped += 1
+
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self.dropped = 0
+
+    def to_chrome(self) -> Dict[str, Any]:
+        pid = os.getpid()
+        events = []
+        threads = {}
+        for recorded in self.spans():
+            threads[recorded.thread_id] = recorded.thread_name
+            args = dict(recorded.attributes)
+            if recorded.error is not None:
+                args["error"] = recorded.error
+            events.append({
+                "name": recorded.name,
+                "cat": recorded.name.split(" ", 1)[0].split(".", 1)[0],
+                "ph": "X",
+                "ts": recorded.start_ns / 1000,
+                "dur": recorded.duration_ns / 1000,
+                "pid": pid,
+                "tid": recorded.thread_id,
+                "args": args,
+            })
+        for thread_id, thread_name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id,
+                           "args": {"name": thread_name}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_otlp(self) -> Dict[str, Any]:
+        spans = []
+        for recorded in self.spans():
+            attributes = dict(recorded.attributes, **{"thread.id": recorded.thread_id, "thread.name": recorded.thread_name})
+            otlp_span = {
+                "traceId": recorded.trace_id,
+                "spanId": recorded.span_id,
+                "name": recorded.name,
+                "kind": 1,
+                "startTimeUnixNano": str(recorded.start_ns),
+                "endTimeUnixNano": str(recorded.end_ns),
+                "attributes": [_otlp_attribute(key, value) for key, value in attributes.items()],
+                "status": {"code": 2, "message": recorded.error} if recorded.error is not None else {"code": 1},
+            }
+            if recorded.parent_id is not None:
+                otlp_span["parentSpanId"] = recorded.parent_id
+            spans.append(otlp_span)
+        return {"resourceSpans": [{
+            "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+            "scopeSpans": [{"scope": {"name": "resume_parser"}, "spans": spans}],
+        }]}
+
+    def export(self, path: str, format: str = "chrome") -> None:
+        if format not in self.FORMATS:
+            raise ValueError(f"Unsupported format: {format}. Supported: {list(self.FORMATS)}")
+        payload = self.to_chrome() if format == "chrome" else self.to_otlp()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        logger.info(f"Exported {len(self.spans())} spans to {path} as {format}")
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+_tracer: Optional[Tracer] = None
+_current_span: contextvars.ContextVar = contextvars.ContextVar("trace_span", default=None)
+_INHERIT = object()
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Install ``tracer`` process-wide (``None`` turns tracing off)."""
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def current_span() -> Optional[Span]:
+    """Return the innermost open span on this thread, if any."""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, parent: Any = _INHERIT, **attributes) -> Iterator[Optional[Span]]:
+    """Record the block as a span; yields None (and costs almost nothing) without a tracer.
+
+    The parent defaults to the current span. Work handed to another thread
+    should pass ``parent=`` explicitly, since context does not follow it.
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield None
+        return
+
+    opened = tracer.start_span(name, current_span() if parent is _INHERIT else parent, **attributes)
+    token = _current_span.set(opened)
+    try:
+        yield opened
+    except BaseException as e:
+        opened.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(token)
+        tracer.finish(opened)
@@ -0,0 +1,114 @@
+"""Parse one shard of a resume corpus, or merge the shards' partitions.
+
+Each node runs the same command with its own --shard; no coordinator is needed:
+
+    python run_corpus.py parse /data/resumes --shard 1/4 --out /shared/partitions
+    python run_corpus.py parse /data/resumes --shard 2/4 --out /shared/partitions
+    ...
+    python run_corpus.py merge /shared/partitions --out results.jsonl
+"""
+
+import sys
+import os
+import argparse
+import logging
+from dotenv import load_dotenv
+
+sys.path.insert(0, '.')
+load_dotenv()
+
+from resume_parser.services.async_logging import configure_async_logging
+
+configure_async_logging(
+    [logging.StreamHandler()],
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    debug_sample_every=int(os.getenv("LOG_DEBUG_SAMPLE_EVERY", "1")),
+)
+logger = logging.getLogger(__name__)
+
+
+def build_framework():
+    from resume_parser import (
+        ResumeParserFramework,
+        PDFParser,
+        WordParser,
+        NameExtractor,
+        EmailExtractor,
+        SkillsExtractor,
+        SkillCanonicalizer,
+        TextCompactor,
+    )
+    from resume_parser.extractors.model_router import ModelRouter
+
+    parsers = {
+        ".pdf": PDFParser(
+            max_pages=int(os.getenv("PDF_MAX_PAGES", "50")),
+            max_bytes=int(os.getenv("PDF_MAX_BYTES", str(20 * 1024 * 1024))),
+        ),
+        ".docx": WordParser(),
+        ".doc": WordParser(),
+    }
+    router = ModelRouter.from_env()
+    extractors = {
+        "name": NameExtractor(router=router),
+        "email": EmailExtractor(),
+        "skills": SkillsExtractor(canonicalizer=SkillCanonicalizer(), router=router),
+    }
+    return ResumeParserFramework(parsers, extractors, normalizer=TextCompactor())
+
+
+def parse_command(args) -> int:
+    from resume_parser.services.sharding import Shard, ShardRunner
+
+    # The fake backend (GEMINI_BACKEND=fake) runs without an API key
+    if not os.getenv("GEMINI_API_KEY") and os.getenv("GEMINI_BACKEND", "gemini").lower() != "fake":
+        logger.error("GEMINI_API_KEY environment variable not found")
+        return 1
+
+    shard = Shard.parse(args.shard, key=args.key)
+    report = ShardRunner(build_framework(), args.root, shard, args.out, workers=args.workers).run()
+    print(f"{report.shard}: {report.parsed} parsed, {report.failed} failed, "
+          f"{report.skipped} already done of {report.assigned} assigned")
+    return 0 if report.failed == 0 else 2
+
+
+def merge_command(args) -> int:
+    from resume_parser.services.sharding import merge_partitions
+
+    report = merge_partitions(args.partitions, args.out)
+    print(f"{report.merged} results and {report.failed} failures from {report.shards} shard(s) -> {args.out}")
+    for label, values in (("missing shards", [index + 1 for index in report.missing_shards]),
+                          ("incomplete shards", [index + 1 for index in report.incomplete_shards]),
+                          ("missing items", report.missing_items),
+                          ("duplicate items", report.duplicate_items)):
+        if values:
+            print(f"{label} ({len(values)}): {', '.join(map(str, values[:20]))}")
+    if report.duplicate_content:
+        print(f"{len(report.duplicate_content)} group(s) of distinct files with identical content")
+    return 0 if report.ok else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parse = commands.add_parser("parse", help="parse this node's shard of a corpus")
+    parse.add_argument("root", help="corpus directory (same relative layout on every node)")
+    parse.add_argument("--shard", default="1/1", help="this node's shard as i/N, 1-based (default 1/1)")
+    parse.add_argument("--key", choices=["path", "content"], default="path",
+                       help="assign files by relative path or by content hash")
+    parse.add_argument("--out", required=True, help="directory for this shard's partition and manifest")
+    parse.add_argument("--workers", type=int, default=4)
+    parse.set_defaults(handler=parse_command)
+
+    merge = commands.add_parser("merge", help="combine all shards' partitions")
+    merge.add_argument("partitions", help="directory holding every shard's partition and manifest")
+    merge.add_argument("--out", required=True, help="consolidated JSONL output")
+    merge.set_defaults(handler=merge_command)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Run the resume parser as a pre-forked daemon on a Unix socket.
+
+Submit files with resume_client.py, which starts in milliseconds because it
+imports nothing from resume_parser.
+"""
+
+import sys
+import os
+import logging
+from dotenv import load_dotenv
+
+sys.path.insert(0, '.')
+load_dotenv()
+
+from resume_parser.services.async_logging import configure_async_logging
+
+# Configure logging; forked workers get their own listener thread
+configure_async_logging(
+    [logging.StreamHandler()],
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    debug_sample_every=int(os.getenv("LOG_DEBUG_SAMPLE_EVERY", "1")),
+)
+logger = logging.getLogger(__name__)
+
+def main():
+    """Preload the framework, fork the workers and block until SIGTERM or Ctrl-C."""
+    # The fake backend (GEMINI_BACKEND=fake) runs without an API key
+    if not os.getenv("GEMINI_API_KEY") and os.getenv("GEMINI_BACKEND", "gemini").lower() != "fake":
+        logger.error("GEMINI_API_KEY environment variable not found")
+        print("GEMINI_API_KEY not found")
+        return
+
+    from resume_parser import (
+        ResumeParserFramework,
+        PDFParser,
+        WordParser,
+        NameExtractor,
+        EmailExtractor,
+        SkillsExtractor,
+        SkillCanonicalizer,
+        TextCompactor,
+    )
+    from resume_parser.extractors.model_router import ModelRouter
+    from resume_parser.services.prefork_daemon import PreforkDaemon
+
+    # Everything built here is inherited by the workers; nothing may call the LLM before they fork
+    parsers = {
+        ".pdf": PDFParser(
+            max_pages=int(os.getenv("PDF_MAX_PAGES", "50")),
+            max_bytes=int(os.getenv("PDF_MAX_BYTES", str(20 * 1024 * 1024))),
+        ),
+        ".docx": WordParser(),
+        ".doc": WordParser(),
+    }
+    router = ModelRouter.from_env()
+    extractors = {
+        "name": NameExtractor(router=router),
+        "email": EmailExtractor(),
+        "skills": SkillsExtractor(canonicalizer=SkillCanonicalizer(), router=router),
+    }
+
+    daemon = PreforkDaemon(
+        ResumeParserFramework(parsers, extractors, normalizer=TextCompactor()),
+        socket_path=os.getenv("DAEMON_SOCKET", "/tmp/resume-parser.sock"),
+        workers=int(os.getenv("DAEMON_WORKERS", "4")),
+        max_jobs_per_worker=int(os.getenv("DAEMON_MAX_JOBS_PER_WORKER", "1000")),
+        # Each open connection holds a worker; close it after this long without a request
+        idle_timeout=float(os.getenv("DAEMON_IDLE_TIMEOUT", "5")),
+    )
+    print(f"Listening on {daemon.socket_path}")
+    daemon.serve_forever()
+
+if __name__ == "__main__":
+    main()
@@ -9,14 +9,13 @@ from dotenv import load_dotenv
 sys.path.insert(0, '.')
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('resume_parser.log')
-    ]
+from resume_parser.services.async_logging import configure_async_logging
+
+# Configure logging; handlers run on a background thread so file writes never block parsing
+configure_async_logging(
+    [logging.StreamHandler(), logging.FileHandler('resume_parser.log')],
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    debug_sample_every=int(os.getenv("LOG_DEBUG_SAMPLE_EVERY", "1")),
 )
 logger = logging.getLogger(__name__)
 
@@ -48,7 +47,8 @@ def main():
         print("Supported formats: .pdf, .docx, .doc")
         return
     
-    if not os.getenv("GEMINI_API_KEY"):
+    # The fake backend (GEMINI_BACKEND=fake) runs without an API key
+    if not os.getenv("GEMINI_API_KEY") and os.getenv("GEMINI_BACKEND", "gemini").lower() != "fake":
         logger.error("GEMINI_API_KEY environment variable not found")
         print("GEMINI_API_KEY not found")
         return
@@ -60,7 +60,10 @@ def main():
         NameExtractor,
         EmailExtractor,
         SkillsExtractor,
+        SkillCanonicalizer,
+        TextCompactor,
     )
+    from resume_parser.extractors.model_router import ModelRouter
     
     # Initialize framework
     parsers = {
@@ -69,13 +72,21 @@ def main():
         ".doc": WordParser(),
     }
     
+    # Per-resume model tiers when GEMINI_MODEL_TIERS is set, else GEMINI_MODEL_NAME for everything
+    router = ModelRouter.from_env()
     extractors = {
-        "name": NameExtractor(),
+        "name": NameExtractor(router=router),
         "email": EmailExtractor(),
-        "skills": SkillsExtractor(),
+        "skills": SkillsExtractor(canonicalizer=SkillCanonicalizer(), router=router),
     }
     
-    framework = ResumeParserFramework(parsers, extractors)
+    framework = ResumeParserFramework(parsers, extractors, normalizer=TextCompactor())
+    
+    trace_file = os.getenv("RESUME_TRACE_FILE")
+    if trace_file:
+        from resume_parser.services.tracing import Tracer, set_tracer
+        tracer = Tracer()
+        set_tracer(tracer)
     
     # Parse and save
     logger.info(f"Starting resume parsing process for: {input_file}")
@@ -86,6 +97,13 @@ def main():
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(result.to_json())
         
+        results_db = os.getenv("RESULTS_DB")
+        if results_db:
+            from resume_parser.services.result_store import ResultStore
+            with ResultStore(results_db) as store:
+                store.put(result, input_file)
+            logger.info(f"Result stored in {results_db}")
+        
         logger.info(f"Resume parsing completed successfully. Output saved to: {output_file}")
         print(f"Parsed {result.name} - saved to {output_file}")
         
@@ -93,6 +111,9 @@ def main():
         logger.error(f"Resume parsing failed: {e}")
         print(f"Error: {e}")
         return
+    finally:
+        if trace_file:
+            tracer.export(trace_file, format=os.getenv("RESUME_TRACE_FORMAT", "chrome"))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
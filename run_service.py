@@ -0,0 +1,104 @@
+"""Run the resume parser as a local HTTP service."""
+
+import sys
+import os
+import logging
+from dotenv import load_dotenv
+
+sys.path.insert(0, '.')
+load_dotenv()
+
+from resume_parser.services.async_logging import configure_async_logging
+
+# Configure logging; handlers run on a background thread so request threads never block on I/O
+configure_async_logging(
+    [logging.StreamHandler()],
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    debug_sample_every=int(os.getenv("LOG_DEBUG_SAMPLE_EVERY", "1")),
+)
+logger = logging.getLogger(__name__)
+
+def main():
+    """Start the service and block until interrupted."""
+    # The fake backend (GEMINI_BACKEND=fake) runs without an API key
+    if not os.getenv("GEMINI_API_KEY") and os.getenv("GEMINI_BACKEND", "gemini").lower() != "fake":
+        logger.error("GEMINI_API_KEY environment variable not found")
+        print("GEMINI_API_KEY not found")
+        return
+
+    from resume_parser import (
+        ResumeParserFramework,
+        ResumeParserService,
+        PDFParser,
+        WordParser,
+        NameExtractor,
+        EmailExtractor,
+        SkillsExtractor,
+        SkillCanonicalizer,
+        TextCompactor,
+    )
+    from resume_parser.extractors.hedging import HedgePolicy
+    from resume_parser.extractors.model_router import ModelRouter
+    from resume_parser.services.http_service import create_server
+
+    # One oversized upload must not exhaust a worker's memory
+    pdf_parser = PDFParser(
+        max_pages=int(os.getenv("PDF_MAX_PAGES", "50")),
+        max_bytes=int(os.getenv("PDF_MAX_BYTES", str(20 * 1024 * 1024))),
+    )
+    parsers = {
+        ".pdf": pdf_parser,
+        ".docx": WordParser(),
+        ".doc": WordParser(),
+    }
+
+    if os.getenv("PARSE_ISOLATED", "false").lower() == "true":
+        # Parse in child processes so a spinning or bloated file is killed, not the service
+        from resume_parser.services.isolated_executor import IsolatedExecutor, IsolatedParser
+        memory_limit = os.getenv("PARSE_MEMORY_LIMIT")
+        executor = IsolatedExecutor(
+            workers=int(os.getenv("SERVICE_PARSE_WORKERS", "2")),
+            timeout=float(os.getenv("PARSE_TIMEOUT", "60")),
+            memory_limit=int(memory_limit) if memory_limit else None,
+            max_jobs_per_worker=int(os.getenv("PARSE_MAX_JOBS_PER_WORKER", "100")),
+        )
+        parsers = {ext: IsolatedParser(parser, executor) for ext, parser in parsers.items()}
+
+    # Per-resume model tiers when GEMINI_MODEL_TIERS is set, else GEMINI_MODEL_NAME for everything
+    router = ModelRouter.from_env()
+    # Duplicate LLM calls slower than the recent percentile; deadlines are enforced either way
+    hedge_percentile = os.getenv("GEMINI_HEDGE_PERCENTILE")
+    hedging = HedgePolicy(percentile=float(hedge_percentile) if hedge_percentile else None)
+    extractors = {
+        "name": NameExtractor(hedge_policy=hedging, router=router),
+        "email": EmailExtractor(),
+        "skills": SkillsExtractor(canonicalizer=SkillCanonicalizer(), hedge_policy=hedging, router=router),
+    }
+
+    # Extractors still waiting when a resume's deadline expires return their fallback value
+    deadline_seconds = os.getenv("RESUME_DEADLINE_SECONDS")
+    service = ResumeParserService(
+        ResumeParserFramework(parsers, extractors, normalizer=TextCompactor(),
+                              deadline_seconds=float(deadline_seconds) if deadline_seconds else None),
+        queue_size=int(os.getenv("SERVICE_QUEUE_SIZE", "32")),
+        parse_workers=int(os.getenv("SERVICE_PARSE_WORKERS", "2")),
+        llm_workers=int(os.getenv("SERVICE_LLM_WORKERS", "8")),
+    )
+    host = os.getenv("SERVICE_HOST", "127.0.0.1")
+    port = int(os.getenv("SERVICE_PORT", "8080"))
+    # POST /batch reads files on this machine, so it stays off unless given a directory to serve
+    server = create_server(service, host, port, batch_root=os.getenv("SERVICE_BATCH_ROOT") or None)
+
+    service.start()
+    logger.info(f"Resume parser service listening on http://{host}:{port}")
+    print(f"Listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Tests for non-blocking logging helpers."""
+
+import os
+import logging
+import threading
+
+import pytest
+from resume_parser.services.async_logging import (
+    Lazy,
+    SamplingFilter,
+    configure_async_logging,
+    stop_async_logging,
+)
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.records.append(record)
+        self.messages.append(self.format(record))
+        self.threads.add(threading.current_thread().name)
+
+
+class TestAsyncLogging:
+    """Test cases for queue-based logging."""
+
+    @pytest.fixture
+    def collector(self):
+        """Route the root logger through the queue and restore it afterwards."""
+        root = logging.getLogger()
+        saved_handlers, saved_level = list(root.handlers), root.level
+        collector = _Collect()
+        yield collector
+        stop_async_logging()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        for handler in saved_handlers:
+            root.addHandler(handler)
+        root.setLevel(saved_level)
+
+    def test_records_handled_on_listener_thread(self, collector):
+        """Test handlers run off the logging thread and everything is flushed on stop."""
+        configure_async_logging([collector], fmt="%(levelname)s %(message)s")
+        log = logging.getLogger("resume_parser.test")
+        for i in range(100):
+            log.info("page %d", i)
+        stop_async_logging()
+
+        assert collector.messages[0] == "INFO page 0"
+        assert len(collector.messages) == 100
+        assert threading.current_thread().name not in collector.threads
+
+    def test_lazy_arguments(self, collector):
+        """Test Lazy arguments are only evaluated for records that are emitted."""
+        configure_async_logging([collector], level="INFO")
+        calls = []
+
+        def expensive():
+            calls.append(1)
+            return "layout dump"
+
+        log = logging.getLogger("resume_parser.test")
+        log.debug("Layout: %s", Lazy(expensive))
+        log.info("Layout: %s", Lazy(expensive))
+        stop_async_logging()
+
+        assert len(calls) == 1
+        assert collector.records[0].getMessage() == "Layout: layout dump"
+
+    def test_mutable_arguments_are_captured_at_call_time(self, collector):
+        """Test a list changed after the call is logged as it was when logged."""
+        release = threading.Event()
+        blocker = _Collect()
+        blocker.emit = lambda record: release.wait(5)
+        configure_async_logging([blocker, collector])
+        log = logging.getLogger("resume_parser.test")
+        skills = ["python"]
+        log.info("Skills: %s", skills)
+        log.info("Count: %d of %s", 1, Lazy(lambda: "lazy"))
+        skills.append("java")
+        release.set()
+        stop_async_logging()
+
+        assert [r.getMessage() for r in collector.records] == ["Skills: ['python']", "Count: 1 of lazy"]
+        assert collector.records[1].args  # scalar and Lazy arguments are still formatted on the listener
+
+    def test_exceptions_are_rendered_before_queueing(self, collector):
+        """Test tracebacks survive the hand-off to the listener."""
+        configure_async_logging([collector])
+        try:
+            raise ValueError("bad pdf")
+        except ValueError:
+            logging.getLogger("resume_parser.test").exception("Parse failed")
+        stop_async_logging()
+
+        assert "ValueError: bad pdf" in collector.records[0].exc_text
+        assert "ValueError: bad pdf" in collector.messages[0]
+
+    def test_debug_sampling(self, collector):
+        """Test one in N debug records is kept while warnings always pass."""
+        configure_async_logging([collector], level="DEBUG", debug_sample_every=3)
+        log = logging.getLogger("resume_parser.test")
+        for i in range(7):
+            log.debug("page %d", i)
+        log.warning("kept")
+        stop_async_logging()
+
+        assert [r.getMessage() for r in collector.records] == ["page 0", "page 3", "page 6", "kept"]
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_gets_its_own_listener(self, collector, tmp_path):
+        """Test records logged in a forked child are written, not stranded in the queue."""
+        log_path = tmp_path / "child.log"
+        configure_async_logging([logging.FileHandler(log_path)], fmt="%(message)s")
+        pid = os.fork()
+        if pid == 0:
+            logging.getLogger("resume_parser.test").info("from child")
+            stop_async_logging()
+            os._exit(0)
+        os.waitpid(pid, 0)
+        stop_async_logging()
+
+        assert log_path.read_text() == "from child\n"
+
+    def test_sampling_filter_rejects_invalid_rate(self):
+        """Test the sampling interval must be positive."""
+        with pytest.raises(ValueError):
+            SamplingFilter(every=0)
@@ -0,0 +1,194 @@
+"""Tests for the LLM circuit breaker and degraded-mode fallback."""
+
+import time
+import threading
+
+import pytest
+from unittest.mock import Mock, patch
+from resume_parser import NameExtractor, SkillsExtractor, HeuristicNameExtractor, KeywordSkillsExtractor
+from resume_parser.extractors.circuit_breaker import CircuitBreaker, CircuitOpen
+from resume_parser.extractors.hedging import HedgePolicy
+from resume_parser.services.deadline import DeadlineExceeded, deadline_scope
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def fail(self):
+        raise ConnectionError("backend down")
+
+    def test_opens_after_consecutive_failures(self):
+        """Test the circuit opens once the failure threshold is reached."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                breaker.call(self.fail)
+
+        assert breaker.state == CircuitBreaker.OPEN
+        backend = Mock()
+        with pytest.raises(CircuitOpen):
+            breaker.call(backend)
+        backend.assert_not_called()
+        assert breaker.stats()["short_circuited"] == 1
+
+    def test_success_resets_failure_count(self):
+        """Test only consecutive failures count toward opening."""
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        with pytest.raises(ConnectionError):
+            breaker.call(self.fail)
+        assert breaker.call(lambda: "ok") == "ok"
+        with pytest.raises(ConnectionError):
+            breaker.call(self.fail)
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_probe_closes_circuit(self):
+        """Test a successful probe after the reset timeout closes the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        with pytest.raises(ConnectionError):
+            breaker.call(self.fail)
+        time.sleep(0.02)
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_probe_failure_reopens(self):
+        """Test a failed probe re-opens the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        with pytest.raises(ConnectionError):
+            breaker.call(self.fail)
+        time.sleep(0.02)
+
+        with pytest.raises(ConnectionError):
+            breaker.call(self.fail)
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.stats()["opened"] == 2
+
+    def test_deadline_exceeded_is_not_a_failure(self):
+        """Test caller deadlines neither open the circuit nor use up a probe."""
+        def expire():
+            raise DeadlineExceeded("deadline passed")
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        with pytest.raises(DeadlineExceeded):
+            breaker.call(expire)
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.stats()["failures"] == 0
+
+        with pytest.raises(ConnectionError):
+            breaker.call(self.fail)
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            breaker.call(expire)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_hung_backend_opens_circuit(self):
+        """Test deadlines that expire while a request is in flight count as failures."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        policy = HedgePolicy(percentile=None)
+        release = threading.Event()
+        backend = Mock(side_effect=lambda: release.wait(5))
+
+        try:
+            for _ in range(2):
+                with deadline_scope(0.05) as deadline, pytest.raises(DeadlineExceeded) as excinfo:
+                    breaker.call(lambda: policy.call(backend, deadline))
+                assert excinfo.value.in_flight
+            assert breaker.state == CircuitBreaker.OPEN
+            with deadline_scope(0.05) as deadline, pytest.raises(CircuitOpen):
+                breaker.call(lambda: policy.call(backend, deadline))
+            assert backend.call_count == 2
+        finally:
+            release.set()
+
+    def test_stale_probe_does_not_free_a_new_probe_slot(self):
+        """Test a probe from an earlier half-open round cannot let extra probes through."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05, half_open_max_calls=1)
+        events = {name: threading.Event() for name in ("late", "stale", "probe")}
+        started = {name: threading.Event() for name in events}
+
+        def blocked(name, outcome):
+            def fn():
+                started[name].set()
+                events[name].wait(5)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+            return fn
+
+        def run(name, outcome):
+            def target():
+                try:
+                    breaker.call(blocked(name, outcome))
+                except Exception:
+                    pass
+            thread = threading.Thread(target=target)
+            thread.start()
+            started[name].wait(5)
+            return thread
+
+        threads = [run("late", ConnectionError("late failure"))]  # admitted while closed
+        with pytest.raises(ConnectionError):
+            breaker.call(self.fail)
+        time.sleep(0.06)
+        threads.append(run("stale", DeadlineExceeded("never sent")))  # first half-open round's probe
+        events["late"].set()
+        threads[0].join(5)
+        assert breaker.state == CircuitBreaker.OPEN
+        time.sleep(0.06)
+        threads.append(run("probe", "ok"))  # second round's probe
+        events["stale"].set()
+        threads[1].join(5)
+
+        with pytest.raises(CircuitOpen):
+            breaker.call(lambda: "extra probe")
+        events["probe"].set()
+        threads[2].join(5)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_late_success_does_not_close_open_circuit(self):
+        """Test a call started before the circuit opened cannot close it."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        started, release = threading.Event(), threading.Event()
+        results = []
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return "late"
+
+        thread = threading.Thread(target=lambda: results.append(breaker.call(slow)))
+        thread.start()
+        started.wait(5)
+        with pytest.raises(ConnectionError):
+            breaker.call(self.fail)
+        release.set()
+        thread.join(5)
+
+        assert results == ["late"]
+        assert breaker.state == CircuitBreaker.OPEN
+
+    @patch('google.generativeai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    def test_extractors_degrade_to_local_fallback(self, mock_model_class, mock_configure):
+        """Test an open circuit routes extraction to the fallback without calling Gemini."""
+        mock_model = Mock()
+        mock_model.generate_content.side_effect = ConnectionError("backend down")
+        mock_model_class.return_value = mock_model
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        text = "Jane Smith\nSkills: Python, Docker"
+
+        with patch.dict('os.environ', {'GEMINI_API_KEY': 'test_key'}):
+            name_extractor = NameExtractor(circuit_breaker=breaker, fallback=HeuristicNameExtractor())
+            skills_extractor = SkillsExtractor(circuit_breaker=breaker, fallback=KeywordSkillsExtractor())
+
+            assert name_extractor.extract(text) == "Jane Smith"  # call fails, opens circuit
+            assert skills_extractor.extract(text) == ["docker", "python"]  # short-circuited
+
+        assert mock_model.generate_content.call_count == 1
+        assert breaker.stats()["short_circuited"] == 1
@@ -0,0 +1,84 @@
+"""Tests for columnar Parquet/Arrow export."""
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from resume_parser import ResumeData
+from resume_parser.services.columnar_sink import ColumnarResultWriter, read_results
+from resume_parser.services.pipeline import PipelineItem
+
+
+class TestColumnarResultWriter:
+    """Test cases for ColumnarResultWriter."""
+
+    @pytest.fixture
+    def records(self):
+        """A handful of results, including one without skills."""
+        return [
+            ResumeData("Ann", "ann@test.com", ["python", "aws"]),
+            ResumeData("Bob", "bob@test.com", []),
+            ResumeData("Cy", "", None),
+        ]
+
+    @pytest.mark.parametrize("format", ["parquet", "arrow"])
+    def test_round_trip(self, tmp_path, records, format):
+        """Test records read back exactly as written in both formats."""
+        path = str(tmp_path / f"results.{format}")
+        with ColumnarResultWriter(path, format=format, row_group_size=2) as writer:
+            writer.write_many(records)
+
+        assert writer.rows_written == 3
+        assert list(read_results(path)) == records
+
+    def test_row_groups_bound_buffer(self, tmp_path, records):
+        """Test each full buffer becomes its own row group."""
+        path = str(tmp_path / "results.parquet")
+        with ColumnarResultWriter(path, row_group_size=2) as writer:
+            writer.write_many(records * 2)
+
+        metadata = pq.ParquetFile(path).metadata
+        assert metadata.num_rows == 6
+        assert metadata.num_row_groups == 3
+
+    def test_skills_is_list_column(self, tmp_path, records):
+        """Test skills are stored as a list<string> column."""
+        path = str(tmp_path / "results.parquet")
+        with ColumnarResultWriter(path) as writer:
+            writer.write(records[0], source_path="/data/ann.pdf")
+
+        table = pq.read_table(path)
+        assert table.schema.field("skills").type == pa.list_(pa.string())
+        assert table.column("source_path").to_pylist() == ["/data/ann.pdf"]
+
+    def test_pipeline_sink_skips_failures(self, tmp_path, records):
+        """Test the pipeline sink writes only successful items."""
+        path = str(tmp_path / "results.parquet")
+        with ColumnarResultWriter(path) as writer:
+            writer.pipeline_sink(PipelineItem(path="ok.pdf", result=records[0]))
+            writer.pipeline_sink(PipelineItem(path="bad.pdf", error=ValueError("corrupt")))
+
+        assert writer.rows_written == 1
+
+    def test_arrow_rejects_dictionary_encoding(self, tmp_path):
+        """Test dictionary encoding is refused for Arrow IPC instead of being ignored."""
+        with pytest.raises(ValueError, match="dictionary_encoding"):
+            ColumnarResultWriter(str(tmp_path / "results.arrow"), format="arrow", dictionary_encoding=True)
+
+    def test_parquet_dictionary_encoding_is_configurable(self, tmp_path, records):
+        """Test the flag reaches the Parquet column chunks."""
+        encodings = {}
+        for enabled in (True, False):
+            path = str(tmp_path / f"results-{enabled}.parquet")
+            with ColumnarResultWriter(path, dictionary_encoding=enabled) as writer:
+                writer.write_many(records)
+            column = pq.ParquetFile(path).metadata.row_group(0).column(3)
+            encodings[enabled] = column.has_dictionary_page
+
+        assert encodings == {True: True, False: False}
+
+    def test_invalid_format_raises_error(self, tmp_path):
+        """Test unknown formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported format"):
+            ColumnarResultWriter(str(tmp_path / "x.csv"), format="csv")
@@ -0,0 +1,64 @@
+"""Tests for the shared Document model."""
+
+import pickle
+
+from resume_parser.models.document import Document
+
+RESUME = """Jane Smith
+jane@example.com
+
+PROFESSIONAL SUMMARY
+Data engineer.
+Skills: Python, SQL, Docker
+Work Experience
+Acme Corp 2019-2024
+Education:
+BSc Computer Science"""
+
+
+class TestDocument:
+    """Test cases for Document."""
+
+    def test_behaves_like_str(self):
+        """Test a Document can be used anywhere plain text is expected."""
+        document = Document(RESUME, source_path="jane.pdf")
+
+        assert document == RESUME
+        assert isinstance(document, str)
+        assert type(document[:10]) is str
+        assert document.source_path == "jane.pdf"
+
+    def test_lines(self):
+        """Test line lookup by index and by character offset."""
+        document = Document(RESUME)
+
+        assert document.line_count == 10
+        assert document.line(0) == "Jane Smith"
+        assert document.line(9) == "BSc Computer Science"
+        assert document.line_number(RESUME.index("Acme")) == 7
+
+    def test_sections(self):
+        """Test block and inline headings are mapped to canonical section spans."""
+        document = Document(RESUME)
+
+        assert set(document.sections) == {"summary", "skills", "experience", "education"}
+        assert document.section("skills") == "Python, SQL, Docker"
+        assert document.section("experience") == "Acme Corp 2019-2024"
+        assert document.section("education") == "BSc Computer Science"
+        assert document.section("publications") == ""
+
+    def test_findall_is_cached(self):
+        """Test repeated scans for the same pattern reuse the first result."""
+        document = Document(RESUME)
+        first = document.findall(r"\b\d{4}\b")
+
+        assert first == ("2019", "2024")
+        assert document.findall(r"\b\d{4}\b") is first
+
+    def test_pickle_round_trip(self):
+        """Test Documents survive being sent to worker processes."""
+        document = pickle.loads(pickle.dumps(Document(RESUME, source_path="jane.pdf")))
+
+        assert isinstance(document, Document)
+        assert document.source_path == "jane.pdf"
+        assert document.section("skills") == "Python, SQL, Docker"
@@ -0,0 +1,88 @@
+"""Tests for the offline Gemini backend."""
+
+import pytest
+from unittest.mock import patch
+from google.api_core import exceptions as google_exceptions
+from resume_parser.extractors.fake_gemini import FakeGeminiBackend, RecordingBackend, backend_from_env
+from resume_parser.extractors.name_extractor import NameExtractor
+from resume_parser.extractors.skills_extractor import SkillsExtractor
+
+RESUME = "Jane Smith\nData Engineer\nSkills: Python, SQL, Docker"
+
+
+def _backend(**kwargs):
+    return FakeGeminiBackend(time_scale=0, seed=7, **kwargs)
+
+
+class TestFakeGeminiBackend:
+    """Test cases for FakeGeminiBackend."""
+
+    def test_extractors_run_offline(self):
+        """Test extractors work against the fake backend without an API key."""
+        backend = _backend()
+        with patch.dict('os.environ', {}, clear=True):
+            name = NameExtractor(backend=backend).extract(RESUME)
+            skills = SkillsExtractor(backend=backend).extract(RESUME)
+
+        assert name == "Jane Smith"
+        assert {"python", "sql", "docker"} <= set(skills)
+        assert backend.stats()["requests"] == 2
+
+    def test_fenced_and_malformed_bodies(self):
+        """Test fenced JSON is still parsed and malformed JSON falls back."""
+        fenced = _backend(fenced_rate=1.0)
+        malformed = _backend(malformed_rate=1.0)
+
+        assert fenced.model("m").generate_content("Resume text:\n" + RESUME).text.startswith("```json")
+        assert NameExtractor(backend=fenced).extract(RESUME) == "Jane Smith"
+        assert NameExtractor(backend=malformed).extract(RESUME) == "Unknown"
+        assert malformed.stats()["malformed"] == 1
+
+    def test_error_rates(self):
+        """Test configured error rates raise the real client's exception types."""
+        backend = _backend(error_429_rate=0.3, error_500_rate=0.2)
+        model = backend.model("m")
+        errors = {"ok": 0, 429: 0, 500: 0}
+        for _ in range(1000):
+            try:
+                model.generate_content("Resume text:\n" + RESUME)
+                errors["ok"] += 1
+            except google_exceptions.GoogleAPICallError as e:
+                errors[e.code] += 1
+
+        assert 250 < errors[429] < 350
+        assert 150 < errors[500] < 250
+        assert backend.stats()["errors_429"] == errors[429]
+
+    def test_rate_limit(self):
+        """Test requests beyond the per-second limit get 429s."""
+        model = _backend(rate_limit=5).model("m")
+        for _ in range(5):
+            model.generate_content("prompt")
+        with pytest.raises(google_exceptions.ResourceExhausted, match="Rate limit"):
+            model.generate_content("prompt")
+
+    def test_record_and_replay(self, tmp_path):
+        """Test recorded responses are replayed for the same prompt."""
+        path = str(tmp_path / "recordings.jsonl")
+        recorder = RecordingBackend(path, inner=_backend(responder=lambda prompt: '{"name": "Recorded Name"}'))
+        assert recorder.offline
+        assert NameExtractor(backend=recorder).extract(RESUME) == "Recorded Name"
+
+        replay = _backend(replay_path=path)
+        assert NameExtractor(backend=replay).extract(RESUME) == "Recorded Name"
+        assert NameExtractor(backend=replay).extract("Other Person") == "Other Person"
+        assert replay.stats()["replayed"] == 1
+        assert replay.stats()["replay_misses"] == 1
+
+    def test_backend_from_env(self):
+        """Test GEMINI_BACKEND selects the backend and fake backends are shared."""
+        assert backend_from_env() is None
+        with patch.dict('os.environ', {'GEMINI_BACKEND': 'fake', 'FAKE_GEMINI_TIME_SCALE': '0'}):
+            first = backend_from_env()
+            assert isinstance(first, FakeGeminiBackend)
+            assert backend_from_env() is first
+            assert NameExtractor().backend is first
+        with patch.dict('os.environ', {'GEMINI_BACKEND': 'nope'}):
+            with pytest.raises(ValueError, match="GEMINI_BACKEND"):
+                backend_from_env()
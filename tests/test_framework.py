@@ -1,8 +1,13 @@
 """Tests for main framework."""
 
+import threading
+
 import pytest
 from unittest.mock import Mock, patch
 from resume_parser import ResumeParserFramework, PDFParser, WordParser
+from resume_parser.models.document import Document
+from resume_parser.models.resume_data import ResumeData
+from resume_parser.services.deadline import current_deadline
 
 
 class TestResumeParserFramework:
@@ -183,4 +188,112 @@ class TestResumeParserFramework:
         assert ".pdf" in framework.supported_file_types
         assert ".PDF" in framework.supported_file_types
         assert ".docx" in framework.supported_file_types
-        assert ".doc" in framework.supported_file_types
\ No newline at end of file
+        assert ".doc" in framework.supported_file_types
+
+    def test_normalizer_runs_before_extractors(self, basic_parsers, mock_extractors):
+        """Test the configured normalizer's output is what extractors receive."""
+        normalizer = Mock(return_value="normalized")
+        framework = ResumeParserFramework(basic_parsers, mock_extractors, normalizer=normalizer)
+        
+        with patch.object(PDFParser, 'parse', return_value="raw   text"):
+            framework.parse_resume("test.pdf")
+            
+            normalizer.assert_called_once_with("raw   text")
+            mock_extractors["name"].extract.assert_called_once_with("normalized")
+
+    def test_iter_parse_resume_yields_fields_as_they_finish(self, basic_parsers):
+        """Test fast extractors are streamed before slow ones, then the full result."""
+        release = threading.Event()
+
+        def slow_name(text):
+            release.wait(5)
+            return "Test User"
+
+        extractors = {
+            "name": Mock(extract=Mock(side_effect=slow_name)),
+            "email": Mock(extract=Mock(return_value="test@example.com")),
+            "skills": Mock(extract=Mock(return_value=["python"])),
+        }
+        framework = ResumeParserFramework(basic_parsers, extractors)
+
+        with patch.object(PDFParser, 'parse', return_value="content"):
+            events = framework.iter_parse_resume("test.pdf")
+            first = dict([next(events), next(events)])
+            release.set()
+            rest = list(events)
+
+        assert first == {"email": "test@example.com", "skills": ["python"]}
+        assert rest[0] == ("name", "Test User")
+        assert rest[-1] == ResumeData("Test User", "test@example.com", ["python"])
+
+    def test_iter_parse_resume_fallbacks(self, basic_parsers):
+        """Test failed and overdue extractors stream their fallback values."""
+        release = threading.Event()
+        extractors = {
+            "name": Mock(extract=Mock(side_effect=lambda text: release.wait(5) and "Late")),
+            "email": Mock(extract=Mock(side_effect=RuntimeError("boom"))),
+            "skills": Mock(extract=Mock(return_value=["python"])),
+        }
+        framework = ResumeParserFramework(basic_parsers, extractors)
+
+        with patch.object(PDFParser, 'parse', return_value="content"):
+            events = list(framework.iter_parse_resume("test.pdf", deadline_seconds=0.2))
+        release.set()
+
+        assert dict(events[:-1]) == {"name": "Unknown", "email": "", "skills": ["python"]}
+        assert events[-1] == ResumeData("Unknown", "", ["python"])
+
+    def test_iter_parse_resume_does_not_leak_deadline(self, basic_parsers, mock_extractors):
+        """Test the stream's deadline scope is not visible to the consumer between events."""
+        framework = ResumeParserFramework(basic_parsers, mock_extractors, deadline_seconds=30)
+
+        with patch.object(PDFParser, 'parse', return_value="content"):
+            seen = [current_deadline() for _ in framework.iter_parse_resume("test.pdf")]
+
+        assert seen == [None] * 4
+
+    def test_parse_resume_selected_fields(self, basic_parsers, mock_extractors):
+        """Test only the requested extractors run and the rest stay None."""
+        framework = ResumeParserFramework(basic_parsers, mock_extractors)
+
+        with patch.object(PDFParser, 'parse', return_value="content"):
+            result = framework.parse_resume("test.pdf", fields=["email"])
+
+        assert result == ResumeData(None, "test@example.com", None)
+        mock_extractors["name"].extract.assert_not_called()
+        mock_extractors["skills"].extract.assert_not_called()
+
+    def test_parse_resume_unknown_field(self, basic_parsers, mock_extractors):
+        """Test unknown fields are rejected before the file is parsed."""
+        framework = ResumeParserFramework(basic_parsers, mock_extractors)
+
+        with patch.object(PDFParser, 'parse') as parse:
+            with pytest.raises(ValueError, match="phone"):
+                framework.parse_resume("test.pdf", fields=["phone"])
+            parse.assert_not_called()
+
+    def test_parse_resume_lazy(self, basic_parsers, mock_extractors):
+        """Test lazy results run each extractor once, on first access."""
+        framework = ResumeParserFramework(basic_parsers, mock_extractors)
+
+        with patch.object(PDFParser, 'parse', return_value="content"):
+            result = framework.parse_resume_lazy("test.pdf")
+
+        assert result.email == "test@example.com"
+        assert result.email == "test@example.com"
+        mock_extractors["email"].extract.assert_called_once_with("content")
+        mock_extractors["name"].extract.assert_not_called()
+        assert result.computed == ["email"]
+
+    def test_extractors_receive_shared_document(self, basic_parsers, mock_extractors):
+        """Test every extractor gets the same Document built from the parsed text."""
+        framework = ResumeParserFramework(basic_parsers, mock_extractors)
+
+        with patch.object(PDFParser, 'parse', return_value="Skills: Python"):
+            framework.parse_resume("test.pdf")
+
+        documents = [extractor.extract.call_args[0][0] for extractor in mock_extractors.values()]
+        assert all(document is documents[0] for document in documents)
+        assert isinstance(documents[0], Document)
+        assert documents[0].source_path == "test.pdf"
+        assert documents[0].section("skills") == "Python"
@@ -0,0 +1,15 @@
+"""Tests for file content hashing."""
+
+import hashlib
+
+from resume_parser.services.hashing import hash_file
+
+
+def test_hash_file_matches_sha256_across_chunks(tmp_path):
+    """Test content spanning several chunks hashes like a single sha256 pass."""
+    path = tmp_path / "resume.pdf"
+    content = bytes(range(256)) * 40
+    path.write_bytes(content)
+
+    assert hash_file(str(path), chunk_size=1000) == hashlib.sha256(content).hexdigest()
+    assert hash_file(str(path)) == hash_file(str(path), chunk_size=7)
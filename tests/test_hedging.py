@@ -0,0 +1,151 @@
+"""Tests for hedged LLM requests and resume deadlines."""
+
+import time
+import threading
+
+import pytest
+from unittest.mock import Mock, patch
+from resume_parser import ResumeParserFramework, PDFParser, NameExtractor
+from resume_parser.extractors.hedging import HedgePolicy, HedgePoolSaturated
+from resume_parser.services.deadline import DeadlineExceeded, deadline_scope, current_deadline
+
+
+def warmed_policy(latency=0.01, **kwargs):
+    """Hedge policy whose latency window is already populated."""
+    policy = HedgePolicy(min_samples=5, min_delay=0.01, **kwargs)
+    for _ in range(5):
+        policy._record(latency)
+    return policy
+
+
+class TestHedgePolicy:
+    """Test cases for HedgePolicy."""
+
+    def test_inline_call_without_deadline_or_history(self):
+        """Test calls run directly on the caller's thread until hedging is warmed up."""
+        policy = HedgePolicy(min_samples=5)
+        caller = threading.current_thread()
+
+        assert policy.call(lambda: threading.current_thread()) is caller
+        assert policy.hedge_delay() is None
+        assert policy.stats()["requests"] == 1
+
+    def test_hedge_fires_and_wins(self):
+        """Test a slow first attempt is hedged and the faster duplicate wins."""
+        policy = warmed_policy()
+        calls = []
+
+        def slow_then_fast():
+            calls.append(1)
+            time.sleep(1.0 if len(calls) == 1 else 0.0)
+            return len(calls)
+
+        started = time.monotonic()
+        assert policy.call(slow_then_fast) == 2
+        assert time.monotonic() - started < 0.5
+        assert policy.stats()["hedges_fired"] == 1
+        assert policy.stats()["hedges_won"] == 1
+
+    def test_fast_call_is_not_hedged(self):
+        """Test no hedge is sent when the first attempt returns in time."""
+        policy = warmed_policy(latency=0.5)
+        assert policy.call(lambda: "ok") == "ok"
+        assert policy.stats()["hedges_fired"] == 0
+
+    def test_deadline_expiry_raises(self):
+        """Test a call still running at the deadline raises DeadlineExceeded."""
+        policy = HedgePolicy(percentile=None)
+        with deadline_scope(0.05) as deadline:
+            with pytest.raises(DeadlineExceeded):
+                policy.call(lambda: time.sleep(1), deadline)
+        assert policy.stats()["deadline_exceeded"] == 1
+
+    def test_errors_propagate(self):
+        """Test an attempt that raises surfaces its error."""
+        policy = HedgePolicy(percentile=None)
+        with deadline_scope(1) as deadline:
+            with pytest.raises(RuntimeError, match="boom"):
+                policy.call(Mock(side_effect=RuntimeError("boom")), deadline)
+
+    def test_saturated_pool_fails_fast(self):
+        """Test calls abandoned at their deadline hold workers, and a call finding none free fails at once."""
+        policy = HedgePolicy(percentile=None, max_workers=2)
+        release = threading.Event()
+        for _ in range(2):
+            with deadline_scope(0.02) as deadline:
+                with pytest.raises(DeadlineExceeded):
+                    policy.call(release.wait, deadline)
+
+        started = time.monotonic()
+        with deadline_scope(5) as deadline:
+            with pytest.raises(HedgePoolSaturated):
+                policy.call(lambda: "ok", deadline)
+        assert time.monotonic() - started < 0.5
+        assert policy.stats()["saturated"] == 1
+
+        release.set()
+        for _ in range(100):
+            if policy._running == 0:
+                break
+            time.sleep(0.01)
+        with deadline_scope(5) as deadline:
+            assert policy.call(lambda: "ok", deadline) == "ok"
+
+    def test_no_hedge_without_a_free_worker(self):
+        """Test a slow attempt is simply awaited when the pool has no room for its hedge."""
+        policy = warmed_policy(max_workers=1)
+        assert policy.call(lambda: time.sleep(0.1) or "slow") == "slow"
+        assert policy.stats()["hedges_fired"] == 0
+
+    def test_invalid_percentile_raises_error(self):
+        """Test out-of-range percentiles are rejected."""
+        with pytest.raises(ValueError):
+            HedgePolicy(percentile=100)
+
+
+class TestDeadlines:
+    """Test cases for per-resume deadlines."""
+
+    def test_deadline_scope_is_restored(self):
+        """Test the deadline is only visible inside its scope."""
+        assert current_deadline() is None
+        with deadline_scope(5) as deadline:
+            assert current_deadline() is deadline
+            assert 0 < deadline.remaining() <= 5
+        assert current_deadline() is None
+
+    @patch('google.generativeai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    def test_extractor_returns_fallback_on_deadline(self, mock_model_class, mock_configure):
+        """Test a stuck Gemini call yields 'Unknown' once the deadline passes."""
+        mock_model = Mock()
+        mock_model.generate_content.side_effect = lambda prompt: time.sleep(1)
+        mock_model_class.return_value = mock_model
+
+        with patch.dict('os.environ', {'GEMINI_API_KEY': 'test_key'}):
+            extractor = NameExtractor()
+            started = time.monotonic()
+            with deadline_scope(0.05):
+                assert extractor.extract("John Doe") == "Unknown"
+            assert time.monotonic() - started < 0.5
+
+    @patch('google.generativeai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    def test_extractors_without_policy_do_not_share_workers(self, mock_model_class, mock_configure):
+        """Test each extractor gets its own deadline-only pool, so hung calls stay with that field."""
+        with patch.dict('os.environ', {'GEMINI_API_KEY': 'test_key'}):
+            first, second = NameExtractor(), NameExtractor()
+        assert first._deadline_policy is not second._deadline_policy
+
+    def test_framework_skips_extractors_after_deadline(self, mock_extractors):
+        """Test extractors not yet started when the deadline expires get fallbacks."""
+        mock_extractors["name"].extract.side_effect = lambda text: time.sleep(0.1) or "Slow Name"
+        framework = ResumeParserFramework({".pdf": PDFParser()}, mock_extractors, deadline_seconds=0.05)
+
+        with patch.object(PDFParser, 'parse', return_value="sample content"):
+            result = framework.parse_resume("test.pdf")
+
+        assert result.name == "Slow Name"
+        assert result.email == ""
+        assert result.skills == []
+        mock_extractors["email"].extract.assert_not_called()
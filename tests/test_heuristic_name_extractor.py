@@ -0,0 +1,30 @@
+"""Tests for heuristic name extraction."""
+
+import pytest
+from resume_parser.extractors.heuristic_name_extractor import HeuristicNameExtractor
+
+
+class TestHeuristicNameExtractor:
+    """Test cases for HeuristicNameExtractor."""
+
+    @pytest.fixture
+    def extractor(self):
+        """Create HeuristicNameExtractor instance."""
+        return HeuristicNameExtractor()
+
+    def test_first_line_name(self, extractor, sample_resume_text):
+        """Test the leading name line is returned."""
+        assert extractor.extract(sample_resume_text) == "John Doe"
+
+    def test_skips_headings_and_titles(self, extractor):
+        """Test resume headings and honorifics are ignored."""
+        assert extractor.extract("RESUME\nDr. JANE O'NEIL-SMITH\njane@test.com") == "Jane O'Neil-Smith"
+
+    def test_unicode_name(self, extractor):
+        """Test accented names are accepted."""
+        assert extractor.extract("José María García-López\nEngineer") == "José María García-López"
+
+    @pytest.mark.parametrize("text", ["", None, "john@test.com\n555-1234", "Summary\nBuilt 12 services in 2020"])
+    def test_no_name_found(self, extractor, text):
+        """Test 'Unknown' when no line looks like a name."""
+        assert extractor.extract(text) == "Unknown"
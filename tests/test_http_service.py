@@ -0,0 +1,224 @@
+"""Tests for the local HTTP service."""
+
+import os
+import json
+import threading
+import http.client
+import urllib.request
+import urllib.error
+
+import pytest
+from unittest.mock import Mock, patch
+from resume_parser import ResumeParserFramework, ResumeParserService, ServiceOverloaded, BatchTooLarge
+from resume_parser.services.deadline import DeadlineExceeded, current_deadline
+from resume_parser.services.http_service import create_server, _status_for
+from resume_parser.services.isolated_executor import ParseTimeout
+
+
+class TestResumeParserService:
+    """Test cases for ResumeParserService."""
+
+    @pytest.fixture
+    def framework(self, mock_extractors):
+        """Framework with a mock parser for .pdf files."""
+        parser = Mock(parse=Mock(return_value="John Doe john@test.com"))
+        return ResumeParserFramework({".pdf": parser}, mock_extractors)
+
+    @pytest.fixture
+    def service(self, framework):
+        """Started service, stopped after the test."""
+        service = ResumeParserService(framework, queue_size=4, parse_workers=1, llm_workers=2)
+        service.start()
+        yield service
+        service.stop()
+
+    @pytest.fixture
+    def server_url(self, service, tmp_path):
+        """Serve the service on an ephemeral port, with batches under tmp_path."""
+        server = create_server(service, port=0, batch_root=str(tmp_path))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+
+    def test_submit_returns_result(self, service):
+        """Test a submitted job resolves to ResumeData."""
+        result = service.submit("resume.pdf").result(timeout=5)
+
+        assert result.name == "Test User"
+        assert service.metrics()["completed"] == 1
+        assert service.metrics()["in_flight"] == 0
+
+    def test_scope_setup_failure_resolves_job(self, service, framework):
+        """Test a job whose resume scope cannot be set up fails and frees its slot instead of hanging."""
+        with patch.object(framework, "_resume_scope", side_effect=RuntimeError("no scope")):
+            with pytest.raises(RuntimeError, match="no scope"):
+                service.submit("resume.pdf").result(timeout=5)
+
+        assert service.metrics()["in_flight"] == 0
+        assert service.submit("resume.pdf").result(timeout=5).name == "Test User"
+
+    def test_invalid_configuration_raises_error(self, framework):
+        """Test non-positive worker counts are rejected."""
+        with pytest.raises(ValueError):
+            ResumeParserService(framework, parse_workers=0)
+
+    def test_full_queue_rejects_jobs(self, framework):
+        """Test backpressure once queue_size jobs are in flight."""
+        release = threading.Event()
+        framework.parsers[".pdf"].parse.side_effect = lambda path: release.wait(5) and "text"
+        service = ResumeParserService(framework, queue_size=2, parse_workers=1, llm_workers=1, retry_after=3)
+        service.start()
+        try:
+            futures = service.submit_batch(["a.pdf", "b.pdf"])
+
+            with pytest.raises(ServiceOverloaded) as exc_info:
+                service.submit("c.pdf")
+            assert exc_info.value.retry_after == 3
+            assert service.metrics()["rejected"] == 1
+
+            release.set()
+            assert all(f.result(timeout=5).name == "Test User" for f in futures)
+        finally:
+            release.set()
+            service.stop()
+
+    def test_framework_deadline_covers_parse_and_extract(self, framework):
+        """Test the parse and extraction threads see one deadline, started when parsing began."""
+        framework.deadline_seconds = 30
+        seen = []
+        framework.parsers[".pdf"].parse.side_effect = lambda path: seen.append(current_deadline()) or "text"
+        framework.extractors["name"].extract.side_effect = lambda text: seen.append(current_deadline()) or "Jo"
+        service = ResumeParserService(framework, parse_workers=1, llm_workers=1)
+        service.start()
+        try:
+            assert service.submit("resume.pdf").result(timeout=5).name == "Jo"
+        finally:
+            service.stop()
+
+        assert seen[0] is not None and seen[0] is seen[1]
+        assert seen[0].seconds == 30
+
+    def test_parse_failure_propagates(self, service):
+        """Test parser errors are surfaced on the job future."""
+        with pytest.raises(ValueError, match="Unsupported file type"):
+            service.submit("resume.txt").result(timeout=5)
+        assert service.metrics()["failed"] == 1
+
+    def test_upload_endpoint(self, server_url):
+        """Test POST /parse returns the parsed result as JSON."""
+        request = urllib.request.Request(f"{server_url}/parse", data=b"%PDF-1.4",
+                                         headers={"X-Filename": "resume.pdf"})
+        with urllib.request.urlopen(request, timeout=5) as response:
+            body = json.loads(response.read())
+
+        assert body == {"name": "Test User", "email": "test@example.com", "skills": ["python", "java"]}
+
+    def test_upload_unsupported_type(self, server_url):
+        """Test uploads with an unknown extension are rejected with 400."""
+        request = urllib.request.Request(f"{server_url}/parse?filename=resume.txt", data=b"text")
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(request, timeout=5)
+        assert exc_info.value.code == 400
+
+    def test_batch_endpoint(self, server_url):
+        """Test POST /batch returns one entry per path."""
+        payload = json.dumps({"paths": ["a.pdf", "b.txt"]}).encode()
+        request = urllib.request.Request(f"{server_url}/batch", data=payload)
+        with urllib.request.urlopen(request, timeout=5) as response:
+            results = json.loads(response.read())["results"]
+
+        assert results[0]["result"]["name"] == "Test User"
+        assert "Unsupported file type" in results[1]["error"]
+
+    def test_batch_larger_than_queue_returns_413(self, server_url, service):
+        """Test batches that could never be admitted get 413, not a retryable 429."""
+        payload = json.dumps({"paths": [f"{i}.pdf" for i in range(10)]}).encode()
+        request = urllib.request.Request(f"{server_url}/batch", data=payload)
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(request, timeout=5)
+        assert exc_info.value.code == 413
+        assert "Retry-After" not in exc_info.value.headers
+        with pytest.raises(BatchTooLarge):
+            service.submit_batch([f"{i}.pdf" for i in range(5)])
+
+    def test_batch_paths_outside_root_are_rejected(self, server_url):
+        """Test /batch refuses paths that escape the configured root."""
+        for path in ["../secret.pdf", "/etc/passwd.pdf"]:
+            payload = json.dumps({"paths": [path]}).encode()
+            request = urllib.request.Request(f"{server_url}/batch", data=payload)
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(request, timeout=5)
+            assert exc_info.value.code == 400
+
+    def test_batch_disabled_without_root(self, service):
+        """Test /batch is refused when no batch root is configured."""
+        server = create_server(service, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            request = urllib.request.Request(f"http://127.0.0.1:{server.server_address[1]}/batch",
+                                             data=json.dumps({"paths": ["a.pdf"]}).encode())
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(request, timeout=5)
+            assert exc_info.value.code == 403
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_invalid_content_length(self, server_url):
+        """Test malformed or oversized Content-Length headers are rejected before reading."""
+        host, port = server_url[len("http://"):].split(":")
+        for value, status in [("abc", 400), ("-5", 400), (str(20 * 1024 * 1024), 413)]:
+            connection = http.client.HTTPConnection(host, int(port), timeout=5)
+            connection.putrequest("POST", "/parse?filename=resume.pdf")
+            connection.putheader("Content-Length", value)
+            connection.endheaders()
+            assert connection.getresponse().status == status
+            connection.close()
+
+    def test_upload_kept_until_job_finishes(self, framework):
+        """Test a result timeout does not delete the upload while the job still needs it."""
+        release = threading.Event()
+        seen = []
+
+        def parse(path):
+            release.wait(5)
+            seen.append(os.path.exists(path))
+            return "text"
+
+        framework.parsers[".pdf"].parse.side_effect = parse
+        service = ResumeParserService(framework, queue_size=2, parse_workers=1, llm_workers=1)
+        service.start()
+        server = create_server(service, port=0)
+        server.RequestHandlerClass.result_timeout = 0.1
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            request = urllib.request.Request(f"http://127.0.0.1:{server.server_address[1]}/parse",
+                                             data=b"%PDF-1.4", headers={"X-Filename": "resume.pdf"})
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(request, timeout=5)
+            release.set()
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.stop()
+        assert seen == [True]
+
+    def test_health_and_metrics(self, server_url):
+        """Test health and metrics endpoints."""
+        with urllib.request.urlopen(f"{server_url}/health", timeout=5) as response:
+            assert json.loads(response.read()) == {"status": "ok"}
+        with urllib.request.urlopen(f"{server_url}/metrics", timeout=5) as response:
+            metrics = json.loads(response.read())
+        assert metrics["queue_size"] == 4
+        assert metrics["llm_workers"] == 2
+
+    def test_runaway_files_are_client_errors(self):
+        """Test killed or oversized parses map to 422, deadlines to 504, other failures to 500."""
+        assert _status_for(ParseTimeout("killed")) == 422
+        assert _status_for(MemoryError()) == 422
+        assert _status_for(DeadlineExceeded()) == 504
+        assert _status_for(RuntimeError("bug")) == 500
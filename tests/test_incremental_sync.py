@@ -0,0 +1,132 @@
+"""Tests for incremental directory sync."""
+
+import os
+import sqlite3
+
+import pytest
+from unittest.mock import Mock
+from resume_parser import ResumeParserFramework
+from resume_parser.services.incremental_sync import IncrementalSync
+
+
+class TestIncrementalSync:
+    """Test cases for IncrementalSync."""
+
+    @pytest.fixture
+    def parser(self):
+        """Parser mock that returns the file's own content."""
+        def parse(path):
+            with open(path) as f:
+                return f.read()
+        return Mock(parse=Mock(side_effect=parse))
+
+    @pytest.fixture
+    def sync(self, tmp_path, parser, mock_extractors):
+        """Sync instance with a manifest outside the scanned tree."""
+        framework = ResumeParserFramework({".pdf": parser}, mock_extractors)
+        sync = IncrementalSync(str(tmp_path / "manifest.db"), framework, workers=2)
+        yield sync
+        sync.close()
+
+    @pytest.fixture
+    def resume_dir(self, tmp_path):
+        """Directory tree with two resumes and an unsupported file."""
+        root = tmp_path / "resumes"
+        (root / "nested").mkdir(parents=True)
+        (root / "a.pdf").write_text("resume a")
+        (root / "nested" / "b.pdf").write_text("resume b")
+        (root / "notes.txt").write_text("ignored")
+        return root
+
+    def test_first_run_parses_everything(self, sync, resume_dir, parser):
+        """Test all supported files are parsed on the first run."""
+        report = sync.run(str(resume_dir))
+
+        assert report.added == 2
+        assert report.unchanged == 0
+        assert parser.parse.call_count == 2
+        assert len(list(sync.results())) == 2
+
+    def test_second_run_skips_unchanged_files(self, sync, resume_dir, parser):
+        """Test an unchanged tree triggers no parsing."""
+        sync.run(str(resume_dir))
+        report = sync.run(str(resume_dir))
+
+        assert report.unchanged == 2
+        assert parser.parse.call_count == 2
+
+    def test_relative_and_absolute_roots_share_the_manifest(self, sync, tmp_path, resume_dir, parser, monkeypatch):
+        """Test the same tree synced as ./resumes and by absolute path is neither re-parsed nor deleted."""
+        monkeypatch.chdir(tmp_path)
+        sync.run("./resumes")
+        os.remove(resume_dir / "nested" / "b.pdf")
+
+        report = sync.run(str(resume_dir))
+
+        assert report.unchanged == 1
+        assert report.deleted == 1
+        assert parser.parse.call_count == 2
+        assert [path for path, _ in sync.results()] == [str(resume_dir / "a.pdf")]
+        assert sync.get("resumes/a.pdf") is not None
+
+    def test_modified_and_deleted_files(self, sync, resume_dir, parser):
+        """Test only modified files are re-parsed and deleted ones are dropped."""
+        sync.run(str(resume_dir))
+        (resume_dir / "a.pdf").write_text("resume a, updated with more text")
+        os.remove(resume_dir / "nested" / "b.pdf")
+
+        report = sync.run(str(resume_dir))
+
+        assert report.modified == 1
+        assert report.deleted == 1
+        assert parser.parse.call_count == 3
+        assert [path for path, _ in sync.results()] == [str(resume_dir / "a.pdf")]
+
+    def test_touched_file_with_same_content_is_not_reparsed(self, sync, resume_dir, parser):
+        """Test an mtime change alone is resolved by the content hash."""
+        sync.run(str(resume_dir))
+        path = resume_dir / "a.pdf"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        report = sync.run(str(resume_dir))
+
+        assert report.unchanged == 2
+        assert parser.parse.call_count == 2
+
+    def test_failed_files_are_retried(self, sync, resume_dir, parser):
+        """Test files that failed to parse are retried on the next run."""
+        parser.parse.side_effect = ValueError("corrupt")
+        report = sync.run(str(resume_dir))
+        assert report.failed == 2
+        assert sync.get(str(resume_dir / "a.pdf")) is None
+
+        parser.parse.side_effect = lambda path: "text"
+        report = sync.run(str(resume_dir))
+        assert report.retried == 2
+        assert report.modified == 0
+        assert sync.get(str(resume_dir / "a.pdf")).name == "Test User"
+
+    def test_other_roots_are_not_deleted(self, sync, resume_dir, tmp_path):
+        """Test syncing one root leaves another root's manifest rows in place."""
+        other = tmp_path / "resumes-archive"
+        other.mkdir()
+        (other / "c.pdf").write_text("resume c")
+        sync.run(str(resume_dir))
+
+        report = sync.run(str(other))
+        assert report.deleted == 0
+        assert sync.get(str(resume_dir / "a.pdf")) is not None
+
+    def test_interrupted_run_keeps_committed_batches(self, tmp_path, resume_dir, mock_extractors):
+        """Test files parsed before an interruption are already committed."""
+        manifest = str(tmp_path / "manifest.db")
+        parse = Mock(side_effect=["text", KeyboardInterrupt()])
+        framework = ResumeParserFramework({".pdf": Mock(parse=parse)}, mock_extractors)
+        sync = IncrementalSync(manifest, framework, workers=1, commit_every=1)
+        with pytest.raises(KeyboardInterrupt):
+            sync.run(str(resume_dir))
+        sync.close()
+
+        with sqlite3.connect(manifest) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 1
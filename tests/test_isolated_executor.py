@@ -0,0 +1,155 @@
+"""Tests for the isolated worker-process executor."""
+
+import os
+import time
+import threading
+
+import pytest
+from resume_parser import ResumeParserFramework
+from resume_parser.services.deadline import DeadlineExceeded, deadline_scope
+from resume_parser.services.isolated_executor import (
+    IsolatedExecutor,
+    IsolatedParser,
+    ParseTimeout,
+    WorkerCrashed,
+)
+
+
+def _echo(value):
+    return value
+
+
+def _pid():
+    return os.getpid()
+
+
+def _spin(seconds):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        pass
+    return "done"
+
+
+def _fail(message):
+    raise ValueError(message)
+
+
+def _exit():
+    os._exit(3)
+
+
+def _allocate(size):
+    return len(bytearray(size))
+
+
+class _TextParser:
+    def parse(self, file_path):
+        with open(file_path) as f:
+            return f.read()
+
+
+class TestIsolatedExecutor:
+    """Test cases for IsolatedExecutor."""
+
+    @pytest.fixture
+    def executor(self):
+        """Executor with short timeouts."""
+        executor = IsolatedExecutor(workers=2, timeout=1.0, max_jobs_per_worker=3)
+        yield executor
+        executor.close()
+
+    def test_runs_in_child_process(self, executor):
+        """Test jobs run outside the calling process and return results."""
+        assert executor.run(_echo, {"a": 1}) == {"a": 1}
+        assert executor.run(_pid) != os.getpid()
+
+    def test_exceptions_propagate_and_worker_is_reused(self, executor):
+        """Test a job's exception is re-raised and the worker survives."""
+        pid = executor.run(_pid)
+        with pytest.raises(ValueError, match="bad pdf"):
+            executor.run(_fail, "bad pdf")
+        assert executor.run(_pid) == pid
+        assert executor.stats()["failed"] == 1
+
+    def test_timeout_kills_only_the_runaway_worker(self, executor):
+        """Test a spinning job is killed while another job finishes normally."""
+        results = {}
+
+        def slow():
+            results["slow"] = executor.run(_spin, 0.5)
+
+        thread = threading.Thread(target=slow)
+        thread.start()
+        with pytest.raises(ParseTimeout):
+            executor.run(_spin, 30)
+        thread.join()
+
+        assert results["slow"] == "done"
+        assert executor.stats()["timeouts"] == 1
+        assert executor.run(_echo, 1) == 1
+
+    def test_deadline_shortens_timeout(self, executor):
+        """Test the current resume deadline caps the per-job timeout."""
+        executor.run(_echo, 1)  # start the worker outside the deadline
+        started = time.monotonic()
+        with deadline_scope(0.3), pytest.raises(ParseTimeout):
+            executor.run(_spin, 30)
+        assert time.monotonic() - started < 1.0
+
+    def test_expired_deadline_skips_the_worker(self, executor):
+        """Test a job whose deadline already passed never reaches (or kills) a worker."""
+        pid = executor.run(_pid)
+        with deadline_scope(0.01):
+            time.sleep(0.02)
+            with pytest.raises(DeadlineExceeded):
+                executor.run(_spin, 30)
+
+        stats = executor.stats()
+        assert (stats["expired"], stats["timeouts"], stats["jobs"]) == (1, 0, 1)
+        assert executor.run(_pid) == pid
+
+    def test_default_start_method_does_not_fork(self):
+        """Test workers are not forked from the (possibly threaded) parent by default."""
+        executor = IsolatedExecutor(workers=1)
+        assert executor._context.get_start_method() in ("forkserver", "spawn")
+        executor.close()
+
+    def test_crashed_worker_is_reported_and_replaced(self, executor):
+        """Test a worker that exits abruptly surfaces as WorkerCrashed."""
+        with pytest.raises(WorkerCrashed, match="exit code 3"):
+            executor.run(_exit)
+        assert executor.run(_echo, "ok") == "ok"
+        assert executor.stats()["crashes"] == 1
+
+    def test_workers_recycled_after_max_jobs(self, executor):
+        """Test a worker is replaced once it has served max_jobs_per_worker jobs."""
+        pids = [executor.run(_pid) for _ in range(4)]
+        assert len(set(pids[:3])) == 1
+        assert pids[3] != pids[0]
+        assert executor.stats()["recycled"] == 1
+
+    @pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="needs /proc to size the limit")
+    def test_memory_limit(self):
+        """Test RLIMIT_AS turns a runaway allocation into MemoryError in the child."""
+        with open("/proc/self/statm") as f:
+            current = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+        limit = current + 256 * 1024 * 1024
+        with IsolatedExecutor(workers=1, memory_limit=limit) as executor:
+            with pytest.raises(MemoryError):
+                executor.run(_allocate, limit)  # more than the whole address space allowed
+            assert executor.run(_allocate, 1024) == 1024
+
+    def test_isolated_parser_in_framework(self, executor, tmp_path, mock_extractors):
+        """Test IsolatedParser is a drop-in framework parser."""
+        path = tmp_path / "resume.txt"
+        path.write_text("John Doe")
+        framework = ResumeParserFramework({".txt": IsolatedParser(_TextParser(), executor)}, mock_extractors)
+
+        assert framework.parse_text(str(path)) == "John Doe"
+
+    def test_closed_executor_rejects_jobs(self):
+        """Test run after close raises."""
+        executor = IsolatedExecutor(workers=1)
+        executor.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            executor.run(_echo, 1)
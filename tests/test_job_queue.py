@@ -0,0 +1,128 @@
+"""Tests for the SQLite job queue."""
+
+import socket
+
+import pytest
+from unittest.mock import Mock
+from resume_parser import ResumeData, ResumeParserFramework
+from resume_parser.services.job_queue import JobQueue, JobQueueRunner
+
+
+class TestJobQueue:
+    """Test cases for JobQueue and JobQueueRunner."""
+
+    @pytest.fixture
+    def job_queue(self, tmp_path):
+        """Fresh queue backed by a temporary database."""
+        job_queue = JobQueue(str(tmp_path / "jobs.db"), max_attempts=2)
+        yield job_queue
+        job_queue.close()
+
+    def test_enqueue_ignores_duplicates(self, job_queue):
+        """Test re-enqueueing the same path does not add a second job."""
+        assert job_queue.enqueue(["a.pdf", "b.pdf"]) == 2
+        assert job_queue.enqueue(["a.pdf", "c.pdf"]) == 1
+        assert job_queue.counts()["pending"] == 3
+
+    def test_lease_and_complete(self, job_queue):
+        """Test a leased job can be completed and its result read back."""
+        job_queue.enqueue(["a.pdf"])
+
+        job = job_queue.lease("w1")
+        assert job.path == "a.pdf"
+        assert job.attempts == 1
+        assert job_queue.lease("w2") is None
+
+        job_queue.complete(job.id, "w1", ResumeData("Jane", "jane@test.com", ["go"]))
+        assert job_queue.counts()["done"] == 1
+        assert list(job_queue.results()) == [("a.pdf", ResumeData("Jane", "jane@test.com", ["go"]))]
+
+    def test_failures_retry_until_limit(self, job_queue):
+        """Test failed jobs return to pending until max_attempts is reached."""
+        job_queue.enqueue(["bad.pdf"])
+
+        job_queue.fail(job_queue.lease("w1").id, "w1", "boom")
+        assert job_queue.counts()["pending"] == 1
+
+        job_queue.fail(job_queue.lease("w1").id, "w1", "boom again")
+        assert job_queue.counts()["failed"] == 1
+        assert list(job_queue.failures()) == [("bad.pdf", "boom again")]
+
+        assert job_queue.retry_failed() == 1
+        assert job_queue.lease("w1").attempts == 1
+
+    def test_expired_lease_is_resumed(self, tmp_path):
+        """Test a job held by a crashed worker is leased again after restart."""
+        db_path = str(tmp_path / "jobs.db")
+        crashed = JobQueue(db_path, lease_seconds=-1)
+        crashed.enqueue(["a.pdf"])
+        crashed.lease("dead-worker")
+        crashed.close()
+
+        restarted = JobQueue(db_path)
+        job = restarted.lease("w1")
+        assert job.path == "a.pdf"
+        assert job.attempts == 2
+        restarted.close()
+
+    def test_stale_worker_cannot_overwrite_new_lease(self, tmp_path):
+        """Test a worker whose lease was taken over cannot complete or fail the job."""
+        job_queue = JobQueue(str(tmp_path / "jobs.db"), lease_seconds=-1)
+        job_queue.enqueue(["a.pdf"])
+        stale = job_queue.lease("slow-worker")
+        job_queue.lease_seconds = 600
+        fresh = job_queue.lease("w2")
+
+        assert not job_queue.fail(stale.id, "slow-worker", "gave up")
+        assert not job_queue.complete(stale.id, "slow-worker", ResumeData("Old", "", []))
+        assert job_queue.counts()["in_progress"] == 1
+
+        assert job_queue.complete(fresh.id, "w2", ResumeData("New", "", []))
+        assert [result.name for _, result in job_queue.results()] == ["New"]
+        job_queue.close()
+
+    def test_in_progress_leases_count_as_future_work(self, job_queue):
+        """Test next_retry_in reports a live lease instead of saying nothing is left."""
+        job_queue.enqueue(["a.pdf"])
+        job_queue.lease("w1")
+
+        wait = job_queue.next_retry_in()
+        assert wait is not None and 0 < wait <= 600
+
+    def test_runner_reclaims_jobs_of_dead_processes(self, tmp_path):
+        """Test a rerun picks up jobs leased by a crashed run without waiting for the lease."""
+        job_queue = JobQueue(str(tmp_path / "jobs.db"))
+        job_queue.enqueue(["a.pdf", "b.pdf"])
+        job_queue.lease(f"{socket.gethostname()}:{2 ** 22 + 1}:0")  # above pid_max, so never running
+        job_queue.lease("other-host:1:0")
+
+        runner = JobQueueRunner(job_queue, Mock(), workers=1)
+        assert job_queue.reclaim(runner._holder_alive) == 1
+        assert job_queue.lease("w1").path == "a.pdf"
+        job_queue.close()
+
+    def test_repeatedly_expired_lease_fails(self, tmp_path):
+        """Test a job that kills its worker on every attempt is marked failed."""
+        job_queue = JobQueue(str(tmp_path / "jobs.db"), max_attempts=1, lease_seconds=-1)
+        job_queue.enqueue(["poison.pdf"])
+        job_queue.lease("w1")
+
+        assert job_queue.lease("w2") is None
+        assert list(job_queue.failures()) == [("poison.pdf", "Lease expired")]
+        job_queue.close()
+
+    def test_runner_processes_all_jobs(self, job_queue, mock_extractors):
+        """Test the runner drains the queue via parse_resume."""
+        def parse(path):
+            if path == "bad.pdf":
+                raise ValueError("corrupt")
+            return "text"
+
+        parser = Mock(parse=Mock(side_effect=parse))
+        framework = ResumeParserFramework({".pdf": parser}, mock_extractors)
+        job_queue.enqueue(["a.pdf", "b.pdf", "bad.pdf"])
+
+        counts = JobQueueRunner(job_queue, framework, workers=2).run()
+
+        assert counts == {"pending": 0, "in_progress": 0, "done": 2, "failed": 1}
+        assert parser.parse.call_count == 4  # bad.pdf tried twice
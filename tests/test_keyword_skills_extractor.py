@@ -0,0 +1,27 @@
+"""Tests for keyword-based skills extraction."""
+
+from resume_parser.extractors.keyword_skills_extractor import KeywordSkillsExtractor
+
+
+def test_finds_known_skills(sample_resume_text):
+    """Test vocabulary skills are found case-insensitively."""
+    assert KeywordSkillsExtractor().extract(sample_resume_text) == ["aws", "docker", "java", "python"]
+
+def test_symbol_skills_and_word_boundaries():
+    """Test skills with symbols match and substrings do not."""
+    result = KeywordSkillsExtractor().extract("C++, C#, Node.js and ASP.NET; JavaScript only")
+
+    assert result == ["asp.net", "c#", "c++", "javascript", "node.js"]
+    assert "java" not in result
+
+def test_longest_term_wins():
+    """Test multi-word terms are preferred over their prefixes."""
+    assert KeywordSkillsExtractor().extract("Spring Boot") == ["spring boot"]
+
+def test_custom_vocabulary():
+    """Test a caller-supplied vocabulary replaces the default."""
+    assert KeywordSkillsExtractor(["Cobol", " "]).extract("COBOL and Python") == ["cobol"]
+
+def test_empty_text():
+    """Test empty input."""
+    assert KeywordSkillsExtractor().extract("") == []
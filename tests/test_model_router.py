@@ -0,0 +1,155 @@
+"""Tests for model tier routing."""
+
+import pytest
+from unittest.mock import Mock, patch
+from resume_parser.extractors.model_router import ModelRouter, ModelTier
+from resume_parser.extractors.name_extractor import NameExtractor
+from resume_parser.extractors.skills_extractor import SkillsExtractor
+from resume_parser.services.deadline import DeadlineExceeded
+
+
+def _tiers():
+    return [
+        ModelTier("small", "gemini-flash", max_chars=1000, max_sections=4),
+        ModelTier("large", "gemini-pro"),
+    ]
+
+
+def _models(responses):
+    """GenerativeModel side effect returning one mock model per model name."""
+    models = {}
+
+    def create(model_name):
+        model = Mock()
+        model.generate_content.side_effect = [
+            text if isinstance(text, Exception) else Mock(text=text, usage_metadata=None)
+            for text in responses[model_name]
+        ]
+        models[model_name] = model
+        return model
+    return create, models
+
+
+class TestModelRouter:
+    """Test cases for ModelRouter."""
+
+    def test_routes_by_length_and_sections(self):
+        """Test short, simple resumes go to the small tier and the rest to the large one."""
+        router = ModelRouter(_tiers())
+        cv = "\n".join(["EDUCATION", "EXPERIENCE", "PUBLICATIONS", "TEACHING", "Awards:", "SKILLS"])
+
+        assert router.route("Jane Doe\nSKILLS\nPython").name == "small"
+        assert router.route("x" * 5000).name == "large"
+        assert router.route(cv).name == "large"
+
+    def test_unhealthy_tier_is_skipped(self):
+        """Test a tier with a high recent failure rate stops receiving requests."""
+        router = ModelRouter(_tiers(), min_samples=5, max_failure_rate=0.5)
+        for _ in range(5):
+            router.record(router.tiers[0], 0.1, ok=False)
+
+        assert router.route("short resume").name == "large"
+        assert router.stats()["small"]["failure_rate"] == 1.0
+
+    def test_failures_age_out(self):
+        """Test a skipped tier gets traffic again once its failures are older than outcome_ttl."""
+        router = ModelRouter(_tiers(), min_samples=5, max_failure_rate=0.5, outcome_ttl=60)
+        with patch("resume_parser.extractors.model_router.time.monotonic", return_value=1000.0):
+            for _ in range(5):
+                router.record(router.tiers[0], 0.1, ok=False)
+            assert router.route("short resume").name == "large"
+
+        with patch("resume_parser.extractors.model_router.time.monotonic", return_value=1061.0):
+            assert router.route("short resume").name == "small"
+            assert router.stats()["small"]["failure_rate"] == 0.0
+
+    def test_from_env(self):
+        """Test tiers are read from GEMINI_MODEL_TIERS."""
+        assert ModelRouter.from_env() is None
+        with patch.dict('os.environ', {'GEMINI_MODEL_TIERS': 'gemini-flash:6000:8, gemini-pro'}):
+            router = ModelRouter.from_env()
+
+        assert router.tiers == [ModelTier("gemini-flash", "gemini-flash", 6000, 8),
+                                ModelTier("gemini-pro", "gemini-pro")]
+
+    def test_rejects_invalid_tiers(self):
+        """Test empty and duplicate tier lists are rejected."""
+        with pytest.raises(ValueError):
+            ModelRouter([])
+        with pytest.raises(ValueError):
+            ModelRouter([ModelTier("a", "m1"), ModelTier("a", "m2")])
+
+    @patch('google.generativeai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    def test_escalates_on_malformed_json(self, mock_model_class, mock_configure):
+        """Test a parse failure on the small tier is retried on the large one."""
+        create, models = _models({"gemini-flash": ["not json"], "gemini-pro": ['{"name": "John Doe"}']})
+        mock_model_class.side_effect = create
+        router = ModelRouter(_tiers())
+
+        with patch.dict('os.environ', {'GEMINI_API_KEY': 'test_key'}):
+            result = NameExtractor(router=router).extract("John Doe\nEngineer")
+
+        assert result == "John Doe"
+        stats = router.stats()
+        assert stats["small"]["escalations"] == 1
+        assert stats["small"]["failures"] == 1
+        assert stats["large"]["requests"] == 1
+        assert stats["large"]["output_tokens"] > 0
+
+    @patch('google.generativeai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    def test_escalates_on_empty_output(self, mock_model_class, mock_configure):
+        """Test an empty skills list from the small tier is retried on the large one."""
+        create, models = _models({"gemini-flash": ['{"skills": []}'], "gemini-pro": ['{"skills": ["Python"]}']})
+        mock_model_class.side_effect = create
+
+        with patch.dict('os.environ', {'GEMINI_API_KEY': 'test_key'}):
+            result = SkillsExtractor(router=ModelRouter(_tiers())).extract("Skills: Python")
+
+        assert result == ["python"]
+
+    @patch('google.generativeai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    def test_empty_answers_do_not_mark_tier_unhealthy(self, mock_model_class, mock_configure):
+        """Test legitimately empty answers escalate without counting as tier failures."""
+        create, models = _models({"gemini-flash": ['{"skills": []}'] * 3, "gemini-pro": ['{"skills": []}'] * 3})
+        mock_model_class.side_effect = create
+        router = ModelRouter(_tiers(), min_samples=2)
+
+        with patch.dict('os.environ', {'GEMINI_API_KEY': 'test_key'}):
+            extractor = SkillsExtractor(router=router)
+            results = [extractor.extract("Jane Doe") for _ in range(3)]
+
+        assert results == [[], [], []]
+        stats = router.stats()
+        assert stats["small"]["requests"] == 3
+        assert stats["small"]["escalations"] == 3
+        assert stats["small"]["failure_rate"] == 0.0
+
+    @patch('google.generativeai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    def test_request_errors_are_not_escalated(self, mock_model_class, mock_configure):
+        """Test API errors fall through to the extractor's usual handling."""
+        create, models = _models({"gemini-flash": [RuntimeError("quota")], "gemini-pro": ['{"name": "X"}']})
+        mock_model_class.side_effect = create
+        router = ModelRouter(_tiers())
+
+        with patch.dict('os.environ', {'GEMINI_API_KEY': 'test_key'}):
+            result = NameExtractor(router=router).extract("John Doe")
+
+        assert result == "Unknown"
+        assert router.stats()["large"]["requests"] == 0
+
+    @patch('google.generativeai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    def test_deadline_is_not_a_tier_failure(self, mock_model_class, mock_configure):
+        """Test a resume's expired deadline leaves the tier's health untouched."""
+        create, models = _models({"gemini-flash": [DeadlineExceeded("deadline passed")], "gemini-pro": []})
+        mock_model_class.side_effect = create
+        router = ModelRouter(_tiers())
+
+        with patch.dict('os.environ', {'GEMINI_API_KEY': 'test_key'}):
+            assert NameExtractor(router=router).extract("John Doe") == "Unknown"
+
+        assert router.stats()["small"]["requests"] == 0
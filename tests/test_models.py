@@ -4,6 +4,9 @@ import sys
 sys.path.insert(0, '.')
 
 from resume_parser.models.resume_data import ResumeData
+from resume_parser.models.compact_resume_data import CompactResumeData
+from resume_parser.models.lazy_resume_data import LazyResumeData
+from resume_parser.models.skill_pool import SkillPool
 
 def test_resume_data_creation():
     """Test ResumeData creation."""
@@ -33,8 +36,65 @@ def test_to_json():
     assert "Bob" in json_str
     assert "bob@test.com" in json_str
 
+def test_resume_data_uses_slots():
+    """Test ResumeData has no per-instance __dict__."""
+    data = ResumeData("Ann", "ann@test.com", [])
+    assert not hasattr(data, "__dict__")
+
+def test_skill_pool_interning():
+    """Test equal skills share one id and one string object."""
+    pool = SkillPool()
+    first = pool.intern("python")
+    
+    assert pool.intern("".join(["py", "thon"])) == first
+    assert pool.canonical("".join(["py", "thon"])) is pool.lookup(first)
+    assert pool.decode(pool.encode(["go", "python"])) == ["go", "python"]
+    assert len(pool) == 2
+
+def test_compact_resume_data_matches_resume_data():
+    """Test the compact record serializes exactly like ResumeData."""
+    pool = SkillPool()
+    data = ResumeData("Bob", "bob@test.com", ["go", "python"])
+    compact = CompactResumeData.from_resume_data(data, pool)
+    
+    assert compact.to_dict() == data.to_dict()
+    assert compact.to_json() == data.to_json()
+    assert compact.to_resume_data() == data
+    assert compact == data
+    assert list(compact.skill_ids) == [0, 1]
+
+def test_compact_resume_data_none_skills():
+    """Test None skills survive the round trip."""
+    compact = CompactResumeData("Bob", "bob@test.com", None, SkillPool())
+    assert compact.skills is None
+    assert compact.to_dict()["skills"] is None
+
+def test_lazy_resume_data_memoizes_fields():
+    """Test each field is extracted once and the text is dropped when all are done."""
+    calls = []
+    
+    def extract(field, text):
+        calls.append(field)
+        return {"name": "Bob", "email": "bob@test.com", "skills": ["go"]}[field]
+    
+    data = LazyResumeData("resume text", extract)
+    assert repr(data) == "LazyResumeData(name=<pending>, email=<pending>, skills=<pending>)"
+    assert data.skills == ["go"]
+    assert data.skills == ["go"]
+    assert calls == ["skills"]
+    assert data.text == "resume text"
+    
+    assert data == ResumeData("Bob", "bob@test.com", ["go"])
+    assert sorted(calls) == ["email", "name", "skills"]
+    assert data.text is None
+
 if __name__ == "__main__":
     test_resume_data_creation()
     test_to_dict()
     test_to_json()
+    test_resume_data_uses_slots()
+    test_skill_pool_interning()
+    test_compact_resume_data_matches_resume_data()
+    test_compact_resume_data_none_skills()
+    test_lazy_resume_data_memoizes_fields()
     print("Model tests passed")
\ No newline at end of file
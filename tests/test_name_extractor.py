@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import Mock, patch
 from resume_parser.extractors.name_extractor import NameExtractor
+from resume_parser.preprocessing.text_compactor import estimate_tokens
 
 
 class TestNameExtractor:
@@ -139,4 +140,20 @@ class TestNameExtractor:
         with patch.dict('os.environ', {'GEMINI_API_KEY': 'test_key'}):
             extractor = NameExtractor()
             result = extractor.extract("José María García-López Software Engineer")
-            assert result == "José María García-López"
\ No newline at end of file
+            assert result == "José María García-López"
+    @patch('google.generativeai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    def test_prompt_text_cut_to_token_budget(self, mock_model_class, mock_configure):
+        """Test long resumes are cut to the prompt token budget on a line boundary."""
+        mock_model = Mock()
+        mock_model.generate_content.return_value = Mock(text='{"name": "Jane Smith"}')
+        mock_model_class.return_value = mock_model
+        
+        text = "Jane Smith\n" + "Built distributed systems.\n" * 500
+        with patch.dict('os.environ', {'GEMINI_API_KEY': 'test_key'}):
+            NameExtractor().extract(text)
+        
+        resume_text = mock_model.generate_content.call_args[0][0].split("Resume text:\n", 1)[1]
+        assert resume_text.startswith("Jane Smith\n")
+        assert resume_text.rstrip("\n").endswith("Built distributed systems.")
+        assert estimate_tokens(resume_text) <= NameExtractor.PROMPT_MAX_TOKENS + 1
@@ -3,9 +3,36 @@
 import sys
 sys.path.insert(0, '.')
 
-from resume_parser.parsers.pdf_parser import PDFParser
+import pytest
+from resume_parser.parsers.pdf_parser import PDFParser, DocumentTooLarge
 from resume_parser.parsers.word_parser import WordParser
 
+
+def _write_pdf(path, pages):
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        page_ids.append(len(objects))
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {len(pages)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    path.write_bytes(out)
+    return str(path)
+
 def test_pdf_parser_init():
     """Test PDF parser initialization."""
     parser = PDFParser()
@@ -192,6 +219,65 @@ def test_relative_and_absolute_paths():
     except FileNotFoundError:
         pass
 
+def test_pdf_parser_extracts_all_pages(tmp_path):
+    """Test text from every page is joined and stats are reported."""
+    path = _write_pdf(tmp_path / "resume.pdf", ["John Doe", "Skills Python"])
+    
+    text, stats = PDFParser(track_memory=True).parse_with_stats(path)
+    
+    assert text == "John Doe\n\nSkills Python"
+    assert stats.pages_total == stats.pages_parsed == 2
+    assert stats.characters == len(text)
+    assert not stats.truncated
+    assert stats.peak_memory_bytes > 0
+
+def test_track_memory_keeps_an_active_profile_tracing(tmp_path):
+    """Test a memory-tracked parse does not stop tracemalloc under a profile session."""
+    import tracemalloc
+    from resume_parser.services.profiling import Profiler
+    path = _write_pdf(tmp_path / "resume.pdf", ["John Doe"])
+    
+    with Profiler(output_dir=str(tmp_path / "profiles")).session(path):
+        PDFParser(track_memory=True).parse(path)
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
+
+def test_pdf_parser_truncates_long_documents(tmp_path):
+    """Test only the first max_pages pages are read by default."""
+    path = _write_pdf(tmp_path / "portfolio.pdf", [f"Page {i}" for i in range(5)])
+    
+    text, stats = PDFParser(max_pages=2).parse_with_stats(path)
+    
+    assert text == "Page 0\n\nPage 1"
+    assert stats.truncated
+    assert (stats.pages_parsed, stats.pages_total) == (2, 5)
+
+def test_pdf_parser_rejects_over_limit(tmp_path):
+    """Test the reject policy and the byte limit."""
+    path = _write_pdf(tmp_path / "portfolio.pdf", [f"Page {i}" for i in range(5)])
+    
+    with pytest.raises(DocumentTooLarge):
+        PDFParser(max_pages=2, page_policy="reject").parse(path)
+    with pytest.raises(DocumentTooLarge):
+        PDFParser(max_bytes=100).parse(path)
+    with pytest.raises(ValueError, match="Unsupported page policy"):
+        PDFParser(page_policy="skip")
+
+def test_parsers_accept_bytes(tmp_path):
+    """Test content already in memory parses like the file it came from."""
+    from docx import Document
+    pdf_path = _write_pdf(tmp_path / "resume.pdf", ["John Doe", "Skills Python"])
+    docx_path = tmp_path / "resume.docx"
+    document = Document()
+    document.add_paragraph("Jane Doe")
+    document.save(str(docx_path))
+    
+    with open(pdf_path, "rb") as f:
+        assert PDFParser().parse_bytes(f.read(), pdf_path) == PDFParser().parse(pdf_path)
+    assert WordParser().parse_bytes(docx_path.read_bytes()) == "Jane Doe"
+    with pytest.raises(DocumentTooLarge):
+        PDFParser(max_bytes=100).parse_bytes(b"%PDF-1.4" + b" " * 200)
+
 if __name__ == "__main__":
     test_pdf_parser_init()
     test_word_parser_init()
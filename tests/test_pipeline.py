@@ -0,0 +1,162 @@
+"""Tests for the staged pipeline."""
+
+import threading
+
+import pytest
+from unittest.mock import Mock
+from resume_parser import ResumeParserFramework
+from resume_parser.services.deadline import current_deadline
+from resume_parser.services.pipeline import Pipeline, PipelineItem, Stage, build_resume_pipeline
+
+
+class TestPipeline:
+    """Test cases for Pipeline and build_resume_pipeline."""
+
+    @pytest.fixture
+    def resume_files(self, tmp_path):
+        """Three files on disk for the read stage to find."""
+        paths = []
+        for name in ("a.pdf", "b.pdf", "c.pdf"):
+            path = tmp_path / name
+            path.write_text(name)
+            paths.append(str(path))
+        return paths
+
+    def test_items_flow_through_all_stages(self):
+        """Test every item visits every stage in order."""
+        seen = []
+        lock = threading.Lock()
+
+        def tag(label):
+            def func(item):
+                item.text = (item.text or "") + label
+                return item
+            return func
+
+        def sink(item):
+            with lock:
+                seen.append(item.text)
+            return item
+
+        pipeline = Pipeline([
+            Stage("first", tag("a"), workers=2, queue_size=1),
+            Stage("second", tag("b"), workers=3, queue_size=1),
+            Stage("sink", sink),
+        ])
+        stats = pipeline.run(f"{i}.pdf" for i in range(20))
+
+        assert seen == ["ab"] * 20
+        assert stats["second"].processed == 20
+        assert stats["second"].workers == 3
+        assert 0.0 <= stats["first"].utilization <= 1.0
+
+    def test_failed_items_skip_to_error_handling_stage(self):
+        """Test a failure short-circuits later stages but still reaches the sink."""
+        later = Mock(side_effect=lambda item: item)
+        sunk = []
+
+        def fail(item):
+            raise ValueError("broken")
+
+        pipeline = Pipeline([
+            Stage("fail", fail),
+            Stage("later", later),
+            Stage("sink", lambda item: sunk.append(item) or item, handles_errors=True),
+        ])
+        stats = pipeline.run(["a.pdf"])
+
+        later.assert_not_called()
+        assert stats["fail"].failed == 1
+        assert sunk[0].failed_stage == "fail"
+        assert str(sunk[0].error) == "broken"
+
+    def test_stage_requires_workers(self):
+        """Test stages reject a worker count below one."""
+        with pytest.raises(ValueError):
+            Stage("empty", lambda item: item, workers=0)
+
+    def test_resume_pipeline_matches_parse_resume(self, resume_files, mock_extractors):
+        """Test the staged pipeline produces the same results as parse_resume."""
+        parser = Mock(parse=Mock(return_value="  John Doe  "))
+        framework = ResumeParserFramework({".pdf": parser}, mock_extractors)
+        results = {}
+
+        pipeline = build_resume_pipeline(
+            framework,
+            sink=lambda item: results.__setitem__(item.path, item),
+            parse_workers=2,
+            extract_workers=4,
+            normalizer=str.strip,
+        )
+        stats = pipeline.run(resume_files + ["missing.pdf", "notes.txt"])
+
+        assert set(results) == set(resume_files) | {"missing.pdf", "notes.txt"}
+        assert all(results[path].result.name == "Test User" for path in resume_files)
+        assert isinstance(results["missing.pdf"].error, FileNotFoundError)
+        assert "Unsupported file type" in str(results["notes.txt"].error)
+        assert stats["read"].failed == 2
+        assert stats["extract"].processed == 3
+        mock_extractors["name"].extract.assert_called_with("John Doe")
+
+    def test_resume_pipeline_applies_framework_deadline(self, resume_files, mock_extractors):
+        """Test every stage of a resume runs under the one deadline opened when it was read."""
+        seen = []
+        parser = Mock(parse=Mock(side_effect=lambda path: seen.append(current_deadline()) or path))
+        mock_extractors["name"].extract.side_effect = lambda text: seen.append(current_deadline()) or "Jo"
+        framework = ResumeParserFramework({".pdf": parser}, mock_extractors, deadline_seconds=30)
+        items = []
+
+        build_resume_pipeline(framework, sink=items.append, parse_workers=1, extract_workers=1).run(resume_files[:1])
+
+        assert seen[0] is not None and seen[0] is seen[1]
+        assert items[0].result.name == "Jo"
+        assert items[0].scope is None
+
+    def test_resume_pipeline_parses_the_bytes_it_read(self, resume_files, mock_extractors):
+        """Test parsers with parse_bytes get the content loaded by the read stage."""
+        class BytesParser:
+            def parse(self, path):
+                raise AssertionError("the file was already read")
+
+            def parse_bytes(self, data, name):
+                return data.decode()
+
+        framework = ResumeParserFramework({".pdf": BytesParser()}, mock_extractors)
+        items = []
+
+        build_resume_pipeline(framework, sink=items.append, parse_workers=1).run(resume_files[:1])
+
+        assert items[0].error is None
+        assert items[0].data is None
+        mock_extractors["name"].extract.assert_called_with("a.pdf")
+
+    def test_stage_returning_none_fails_the_item(self):
+        """Test a stage that returns None fails that item instead of hanging the pipeline."""
+        sunk = []
+        pipeline = Pipeline([
+            Stage("broken", lambda item: None),
+            Stage("sink", lambda item: sunk.append(item) or item, handles_errors=True),
+        ])
+        stats = pipeline.run(["a.pdf", "b.pdf"])
+
+        assert stats["broken"].failed == 2
+        assert all(isinstance(item.error, TypeError) for item in sunk)
+
+    def test_failing_paths_iterator_stops_every_stage(self):
+        """Test an error while producing paths drains the pipeline and is re-raised."""
+        sunk = []
+
+        def paths():
+            yield "a.pdf"
+            raise OSError("listing failed")
+
+        pipeline = Pipeline([Stage("first", lambda item: item), Stage("sink", lambda item: sunk.append(item) or item)])
+        with pytest.raises(OSError, match="listing failed"):
+            pipeline.run(paths())
+        assert [item.path for item in sunk] == ["a.pdf"]
+
+    def test_pipeline_item_defaults(self):
+        """Test a fresh item carries only its path."""
+        item = PipelineItem(path="a.pdf")
+        assert item.text is None
+        assert item.error is None
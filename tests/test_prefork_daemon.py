@@ -0,0 +1,134 @@
+"""Tests for the pre-forked Unix socket daemon and its client."""
+
+import os
+import time
+import signal
+import multiprocessing
+
+import pytest
+from resume_parser import EmailExtractor, ResumeParserFramework
+from resume_parser.services.prefork_daemon import DaemonClient, DaemonError, PreforkDaemon
+
+
+class _TextParser:
+    def parse(self, file_path):
+        if file_path.endswith("crash.pdf"):
+            os._exit(3)
+        with open(file_path) as f:
+            return f.read()
+
+
+def _serve(framework, socket_path, workers, max_jobs, idle_timeout):
+    PreforkDaemon(framework, socket_path, workers=workers, max_jobs_per_worker=max_jobs,
+                  shutdown_timeout=5, idle_timeout=idle_timeout).serve_forever()
+
+
+def _start(socket_path, workers=2, max_jobs=100, idle_timeout=5.0):
+    """Run a daemon in a forked process and wait for its socket."""
+    framework = ResumeParserFramework({".pdf": _TextParser()}, {"email": EmailExtractor()})
+    process = multiprocessing.get_context("fork").Process(
+        target=_serve, args=(framework, socket_path, workers, max_jobs, idle_timeout))
+    process.start()
+    for _ in range(200):
+        if os.path.exists(socket_path):
+            break
+        time.sleep(0.02)
+    return process
+
+
+class TestPreforkDaemon:
+    """Test cases for PreforkDaemon and DaemonClient."""
+
+    @pytest.fixture
+    def resume(self, tmp_path):
+        path = tmp_path / "resume.pdf"
+        path.write_text("Jane Doe\njane@example.com\n")
+        return path
+
+    @pytest.fixture
+    def start_daemon(self, tmp_path):
+        """Run a daemon in a forked process; stop it with SIGTERM afterwards."""
+        processes = []
+        socket_path = str(tmp_path / "daemon.sock")
+
+        def start(workers=2, max_jobs=100, idle_timeout=5.0):
+            processes.append(_start(socket_path, workers, max_jobs, idle_timeout))
+            return socket_path
+
+        yield start
+        for process in processes:
+            process.terminate()
+            process.join(10)
+
+    def test_parse_returns_result(self, start_daemon, resume):
+        """Test a submitted file comes back as a result dict over one connection."""
+        with DaemonClient(start_daemon()) as client:
+            assert client.parse(str(resume))["email"] == "jane@example.com"
+            assert client.parse(str(resume), fields=["email"]) == {
+                "name": None, "email": "jane@example.com", "skills": None}
+
+    def test_errors_are_reported(self, start_daemon, tmp_path):
+        """Test failures in the worker surface as DaemonError with the exception type."""
+        with DaemonClient(start_daemon()) as client:
+            with pytest.raises(DaemonError) as excinfo:
+                client.parse(str(tmp_path / "missing.pdf"))
+            assert excinfo.value.error_type == "FileNotFoundError"
+            with pytest.raises(DaemonError, match="No extractor registered"):
+                client.parse(str(tmp_path / "missing.pdf"), fields=["age"])
+            assert client.ping()["ok"]
+
+    def test_workers_are_recycled(self, start_daemon, resume):
+        """Test a worker exits after max_jobs_per_worker and the client reconnects."""
+        with DaemonClient(start_daemon(workers=1, max_jobs=2)) as client:
+            pids = {client.ping()["pid"] for _ in range(6)}
+            assert client.parse(str(resume))["email"] == "jane@example.com"
+        assert len(pids) == 3
+
+    def test_idle_connection_releases_its_worker(self, start_daemon):
+        """Test an idle persistent connection cannot pin the only worker."""
+        socket_path = start_daemon(workers=1, idle_timeout=0.3)
+        with DaemonClient(socket_path) as idle, DaemonClient(socket_path, timeout=5) as other:
+            worker = idle.ping()["pid"]
+            started = time.monotonic()
+            assert other.ping()["pid"] == worker
+            assert time.monotonic() - started < 2
+            assert idle.ping()["ok"]  # reconnects after the daemon closed it
+
+    def test_crashed_worker_is_replaced(self, start_daemon, tmp_path):
+        """Test a worker dying mid-request fails that request only."""
+        crash = tmp_path / "crash.pdf"
+        crash.write_text("")
+        with DaemonClient(start_daemon(workers=1)) as client:
+            with pytest.raises(DaemonError, match="without replying"):
+                client.parse(str(crash))
+            assert client.ping()["ok"]
+
+    def test_refuses_second_daemon(self, start_daemon):
+        """Test a socket with a live daemon behind it is not taken over."""
+        socket_path = start_daemon()
+        DaemonClient(socket_path).ping()
+        framework = ResumeParserFramework({".pdf": _TextParser()}, {"email": EmailExtractor()})
+        with pytest.raises(RuntimeError, match="already listening"):
+            PreforkDaemon(framework, socket_path)._bind()
+
+    def test_sigterm_stops_workers_and_removes_socket(self, tmp_path):
+        """Test shutdown does not wait for idle client connections."""
+        socket_path = str(tmp_path / "daemon.sock")
+        process = _start(socket_path)
+
+        with DaemonClient(socket_path) as client:
+            worker = client.ping()["pid"]
+            started = time.monotonic()
+            os.kill(process.pid, signal.SIGTERM)
+            process.join(10)
+
+        assert process.exitcode == 0
+        assert time.monotonic() - started < 3
+        assert not os.path.exists(socket_path)
+        with pytest.raises(ProcessLookupError):
+            os.kill(worker, 0)
+
+    def test_client_without_daemon(self, tmp_path):
+        """Test a missing socket raises DaemonError."""
+        with pytest.raises(DaemonError, match="failed"):
+            DaemonClient(str(tmp_path / "none.sock")).ping()
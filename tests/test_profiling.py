@@ -0,0 +1,105 @@
+"""Tests for on-demand resume profiling."""
+
+import pstats
+import tracemalloc
+
+import pytest
+from unittest.mock import Mock, patch
+from resume_parser import ResumeParserFramework
+from resume_parser.services.profiling import (
+    Profiler,
+    acquire_tracemalloc,
+    current_session,
+    profile_section,
+    release_tracemalloc,
+)
+
+
+class TestProfiler:
+    """Test cases for Profiler and its framework integration."""
+
+    @pytest.fixture
+    def parser(self):
+        """Parser that allocates a little so there is something to report."""
+        def parse(path):
+            return "\n".join(f"line {i}" for i in range(1000))
+        return Mock(parse=Mock(side_effect=parse))
+
+    def framework(self, parser, extractors, profiler):
+        return ResumeParserFramework({".pdf": parser}, extractors, profiler=profiler)
+
+    def test_profile_per_call(self, tmp_path, parser, mock_extractors):
+        """Test profile=True writes a report covering the parser and every extractor."""
+        profiler = Profiler(output_dir=str(tmp_path))
+        result = self.framework(parser, mock_extractors, profiler).parse_resume("resume.pdf", profile=True)
+
+        assert result.name == "Test User"
+        assert len(profiler.reports) == 1
+        report = open(profiler.reports[0], encoding="utf-8").read()
+        assert report.startswith("Profile for resume.pdf")
+        for section in ("== parse Mock", "== extract name", "== extract email", "== extract skills"):
+            assert section in report
+        assert "top functions by cumulative time" in report
+        assert "top allocation sites" in report
+
+        prof_files = list(tmp_path.glob("*.prof"))
+        assert len(prof_files) == 1
+        assert pstats.Stats(str(prof_files[0])).total_calls > 0
+
+    def test_not_profiled_by_default(self, tmp_path, parser, mock_extractors):
+        """Test nothing is written with a zero sample rate."""
+        profiler = Profiler(output_dir=str(tmp_path))
+        self.framework(parser, mock_extractors, profiler).parse_resume("resume.pdf")
+
+        assert profiler.reports == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_sample_rate_and_per_call_override(self, tmp_path, parser, mock_extractors):
+        """Test sampling profiles every call at rate 1 unless the call opts out."""
+        profiler = Profiler(output_dir=str(tmp_path), sample_rate=1.0)
+        framework = self.framework(parser, mock_extractors, profiler)
+        framework.parse_resume("a.pdf")
+        framework.parse_resume("b.pdf", profile=False)
+
+        assert len(profiler.reports) == 1
+
+    def test_from_env(self, tmp_path):
+        """Test the profiler reads its rate and directory from the environment."""
+        with patch.dict("os.environ", {"RESUME_PROFILE_RATE": "0.25", "RESUME_PROFILE_DIR": str(tmp_path)}):
+            profiler = Profiler.from_env()
+        assert profiler.sample_rate == 0.25
+        assert profiler.output_dir == str(tmp_path)
+
+    @pytest.mark.parametrize("value", ["often", "nan", "5", "-0.1"])
+    def test_from_env_ignores_invalid_rate(self, value, caplog):
+        """Test a malformed rate disables sampling instead of breaking framework construction."""
+        with patch.dict("os.environ", {"RESUME_PROFILE_RATE": value}):
+            profiler = Profiler.from_env()
+        assert profiler.sample_rate == 0.0
+        assert "RESUME_PROFILE_RATE" in caplog.text
+
+    def test_invalid_sample_rate_raises_error(self):
+        """Test sample rates outside [0, 1] are rejected."""
+        with pytest.raises(ValueError, match="sample_rate"):
+            Profiler(sample_rate=2)
+
+    def test_section_is_noop_without_session(self):
+        """Test profile_section costs nothing outside a profiled resume."""
+        with profile_section("anything"):
+            assert current_session() is None
+
+    def test_tracemalloc_stopped_after_session(self, tmp_path):
+        """Test the profiler only leaves tracemalloc running if it was already on."""
+        assert not tracemalloc.is_tracing()
+        profiler = Profiler(output_dir=str(tmp_path))
+        with profiler.session("x.pdf"):
+            assert tracemalloc.is_tracing()
+        assert not tracemalloc.is_tracing()
+
+    def test_tracing_outlives_the_first_user(self, tmp_path):
+        """Test a memory-tracked parse that finishes first does not stop a session's tracing."""
+        acquire_tracemalloc()  # what PDFParser(track_memory=True) does on another thread
+        with Profiler(output_dir=str(tmp_path)).session("x.pdf"):
+            release_tracemalloc()
+            assert tracemalloc.is_tracing()
+        assert not tracemalloc.is_tracing()
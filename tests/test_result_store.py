@@ -0,0 +1,108 @@
+"""Tests for the SQLite result store."""
+
+import threading
+
+import pytest
+from unittest.mock import Mock
+from resume_parser import ResumeData
+from resume_parser.services.result_store import ResultStore
+
+
+class TestResultStore:
+    """Test cases for ResultStore."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Store with small batches so tests exercise several transactions."""
+        store = ResultStore(str(tmp_path / "results.db"), batch_size=8)
+        yield store
+        store.close()
+
+    def test_put_and_get(self, store):
+        """Test a stored result can be read back by content hash."""
+        store.put(ResumeData("Ann", "ann@example.com", ["python"]), "ann.pdf", content_hash="h1")
+        store.flush()
+
+        stored = store.get("h1")
+        assert stored.path == "ann.pdf"
+        assert stored.result.to_dict() == {"name": "Ann", "email": "ann@example.com", "skills": ["python"]}
+        assert store.get("missing") is None
+
+    def test_upsert_on_content_hash(self, store):
+        """Test the same content under a new path updates the existing row."""
+        store.put(ResumeData("Ann", "", ["python"]), "old/ann.pdf", content_hash="h1")
+        store.flush()
+        first = store.get("h1")
+
+        store.put(ResumeData("Ann", "", ["python", "aws"]), "new/ann.pdf", content_hash="h1")
+        store.flush()
+
+        stored = store.get("h1")
+        assert store.count() == 1
+        assert stored.path == "new/ann.pdf"
+        assert stored.result.skills == ["python", "aws"]
+        assert stored.created_at == first.created_at
+        assert stored.updated_at >= first.updated_at
+        assert store.find_by_path("old/ann.pdf") == []
+
+    def test_hashes_file_when_no_hash_given(self, store, tmp_path):
+        """Test identical files collapse to one row."""
+        for name in ("a.pdf", "b.pdf"):
+            (tmp_path / name).write_bytes(b"same bytes")
+            store.put(ResumeData("X", "", []), str(tmp_path / name))
+        store.flush()
+
+        assert store.count() == 1
+        assert [s.path for s in store.find_by_path(str(tmp_path / "b.pdf"))] == [str(tmp_path / "b.pdf")]
+
+    def test_concurrent_writers(self, store):
+        """Test results from many threads are all committed."""
+        def worker(n):
+            for i in range(50):
+                store.put(ResumeData(f"C{n}-{i}", "", []), f"{n}/{i}.pdf", content_hash=f"{n}-{i}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        store.flush()
+
+        assert store.count() == 400
+        assert store.rows_written == 400
+
+    def test_iter_results_streams_in_pages(self, store):
+        """Test streaming reads return every row in insertion order."""
+        for i in range(25):
+            store.put(ResumeData(f"C{i}", "", []), f"{i}.pdf", content_hash=str(i))
+        store.flush()
+
+        names = [s.result.name for s in store.iter_results(page_size=7)]
+        assert names == [f"C{i}" for i in range(25)]
+        assert list(store.iter_results(since=store.get("24").updated_at + 1)) == []
+
+    def test_pipeline_sink_skips_failures(self, store, tmp_path):
+        """Test only successful pipeline items are stored."""
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"resume")
+        store.pipeline_sink(Mock(path=str(path), error=None, result=ResumeData("A", "", [])))
+        store.pipeline_sink(Mock(path=str(path), error="boom", result=None))
+        store.flush()
+
+        assert store.count() == 1
+
+    def test_persists_across_reopen(self, tmp_path):
+        """Test results survive closing and reopening the database."""
+        path = str(tmp_path / "results.db")
+        with ResultStore(path) as store:
+            store.put(ResumeData("Ann", "", []), "ann.pdf", content_hash="h1")
+
+        with ResultStore(path) as store:
+            assert store.get("h1").result.name == "Ann"
+
+    def test_put_after_close_raises_error(self, tmp_path):
+        """Test a closed store rejects new results."""
+        store = ResultStore(str(tmp_path / "results.db"))
+        store.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            store.put(ResumeData("A", "", []), "a.pdf", content_hash="h")
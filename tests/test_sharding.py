@@ -0,0 +1,120 @@
+"""Tests for sharded corpus runs and partition merging."""
+
+import json
+
+import pytest
+from unittest.mock import Mock
+from resume_parser import EmailExtractor, ResumeParserFramework
+from resume_parser.services.sharding import Shard, ShardRunner, merge_partitions
+
+
+class _TextParser:
+    def parse(self, file_path):
+        with open(file_path, encoding="utf-8") as f:
+            return f.read()
+
+
+class TestSharding:
+    """Test cases for ShardRunner and merge_partitions."""
+
+    @pytest.fixture
+    def framework(self):
+        """Framework that reads .pdf files as plain text."""
+        return ResumeParserFramework({".pdf": _TextParser()}, {"email": EmailExtractor()})
+
+    @pytest.fixture
+    def corpus(self, tmp_path):
+        """Thirty small resumes in nested directories."""
+        root = tmp_path / "corpus"
+        for i in range(30):
+            path = root / f"batch{i % 3}" / f"resume{i}.pdf"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"Candidate {i}\ncandidate{i}@example.com\n", encoding="utf-8")
+        (root / "notes.txt").write_text("not a resume", encoding="utf-8")
+        return root
+
+    def _run_all(self, framework, corpus, out, count, key="path"):
+        return [ShardRunner(framework, str(corpus), Shard(index, count, key), str(out)).run()
+                for index in range(count)]
+
+    def test_shard_spec(self):
+        """Test i/N specs are 1-based and validated."""
+        assert Shard.parse("2/4") == Shard(1, 4)
+        assert Shard.parse("2/4").name == "part-00002-of-00004"
+        for spec in ("0/4", "5/4", "two/4", "1"):
+            with pytest.raises(ValueError):
+                Shard.parse(spec)
+
+    def test_shards_partition_the_corpus(self, framework, corpus, tmp_path):
+        """Test every file is assigned to exactly one shard, the same way on every run."""
+        assignments = [ShardRunner(framework, str(corpus), Shard(i, 4), "unused").assigned() for i in range(4)]
+        items = [item for shard in assignments for item in shard]
+
+        assert sorted(items) == sorted(set(items))
+        assert len(items) == 30
+        assert ShardRunner(framework, str(corpus), Shard(2, 4), "unused").assigned() == assignments[2]
+
+    def test_merge_combines_all_shards(self, framework, corpus, tmp_path):
+        """Test partitions from every shard merge into one sorted output."""
+        out = tmp_path / "partitions"
+        reports = self._run_all(framework, corpus, out, 3)
+        report = merge_partitions(str(out), str(tmp_path / "merged.jsonl"))
+
+        assert sum(r.parsed for r in reports) == 30
+        assert report.ok
+        assert report.merged == report.expected == 30
+        lines = [json.loads(line) for line in (tmp_path / "merged.jsonl").read_text().splitlines()]
+        assert [line["id"] for line in lines] == sorted(line["id"] for line in lines)
+        assert lines[0]["result"]["email"] == "candidate0@example.com"
+
+    def test_merge_detects_missing_and_duplicate_items(self, framework, corpus, tmp_path):
+        """Test absent shards, lost records and double-processed items are reported."""
+        out = tmp_path / "partitions"
+        ShardRunner(framework, str(corpus), Shard(0, 3), str(out)).run()
+        ShardRunner(framework, str(corpus), Shard(1, 3), str(out)).run()
+
+        first = (out / "part-00001-of-00003.jsonl").read_text().splitlines()
+        second = out / "part-00002-of-00003.jsonl"
+        second.write_text("\n".join(second.read_text().splitlines()[1:] + [first[0]]) + "\n")
+        report = merge_partitions(str(out), str(tmp_path / "merged.jsonl"))
+
+        assert not report.ok
+        assert report.missing_shards == [2]
+        assert report.duplicate_items == [json.loads(first[0])["id"]]
+        assert len(report.missing_items) == 1
+
+    def test_restart_skips_completed_items(self, framework, corpus, tmp_path):
+        """Test a rerun only parses items without a result, even after a torn write."""
+        out = tmp_path / "partitions"
+        runner = ShardRunner(framework, str(corpus), Shard(0, 2), str(out))
+        first = runner.run()
+        lines = runner.partition_path.read_text().splitlines()
+        runner.partition_path.write_text("\n".join(lines[:-1]) + "\n" + lines[-1][:10])
+
+        second = runner.run()
+        report = merge_partitions(str(out), str(tmp_path / "merged.jsonl"))
+
+        assert second.parsed == 1
+        assert second.skipped == first.assigned - 1
+        assert report.missing_shards == [1]
+        assert report.missing_items == []
+        assert report.merged == first.assigned
+
+    def test_content_key_groups_identical_files(self, framework, corpus, tmp_path):
+        """Test content-keyed shards keep copies together and flag them at merge."""
+        (corpus / "copy.pdf").write_bytes((corpus / "batch0" / "resume0.pdf").read_bytes())
+        out = tmp_path / "partitions"
+        self._run_all(framework, corpus, out, 3, key="content")
+        report = merge_partitions(str(out), str(tmp_path / "merged.jsonl"))
+
+        assert report.ok
+        assert list(report.duplicate_content.values()) == [["batch0/resume0.pdf", "copy.pdf"]]
+
+    def test_merge_rejects_mixed_runs(self, framework, corpus, tmp_path):
+        """Test partitions from runs with different shard counts are not merged."""
+        out = tmp_path / "partitions"
+        ShardRunner(framework, str(corpus), Shard(0, 2), str(out)).run()
+        ShardRunner(framework, str(corpus), Shard(0, 3), str(out)).run()
+
+        with pytest.raises(ValueError, match="shard run"):
+            merge_partitions(str(out), str(tmp_path / "merged.jsonl"))
@@ -0,0 +1,74 @@
+"""Tests for skill canonicalization."""
+
+import pytest
+from resume_parser import ResumeData, SkillCanonicalizer
+from resume_parser.models.skill_pool import SkillPool
+
+
+class TestSkillCanonicalizer:
+    """Test cases for SkillCanonicalizer."""
+
+    @pytest.fixture
+    def canonicalizer(self):
+        """Canonicalizer with the default vocabulary and a private pool."""
+        return SkillCanonicalizer(pool=SkillPool())
+
+    def test_aliases_and_spacing_variants(self, canonicalizer):
+        """Test aliases and spacing/punctuation variants share one canonical name."""
+        for raw in ["JS", "javascript", "Java Script", "ECMAScript"]:
+            assert canonicalizer.canonicalize(raw) == "javascript"
+        assert canonicalizer.canonicalize("Node JS") == "node.js"
+        assert canonicalizer.canonicalize("Google Cloud") == "gcp"
+
+    def test_symbols_are_significant(self, canonicalizer):
+        """Test C, C++ and C# stay distinct."""
+        assert canonicalizer.canonicalize("C++") == "c++"
+        assert canonicalizer.canonicalize("C#") == "c#"
+        assert canonicalizer.canonicalize("c sharp") == "c#"
+
+    def test_version_suffixes(self, canonicalizer):
+        """Test a known skill followed by a version resolves to the skill."""
+        assert canonicalizer.canonicalize("Python 3.11") == "python"
+        assert canonicalizer.canonicalize("angular2") == "angular"
+
+    def test_fuzzy_fallback(self, canonicalizer):
+        """Test misspellings resolve through the trigram index."""
+        assert canonicalizer.canonicalize("Kubernets") == "kubernetes"
+        assert canonicalizer.canonicalize("tensorflw") == "tensorflow"
+        assert canonicalizer.stats["fuzzy"] == 2
+
+    def test_unknown_skills_pass_through(self, canonicalizer):
+        """Test unresolved skills are only lowercased and space-collapsed."""
+        assert canonicalizer.canonicalize("Underwater  Basket Weaving") == "underwater basket weaving"
+        assert canonicalizer.canonicalize("   ") == ""
+
+    def test_canonicalize_all_dedupes_in_order(self, canonicalizer):
+        """Test duplicates after canonicalization are dropped, keeping first-seen order."""
+        skills = ["Docker", "JS", "k8s", "javascript", "", None, "kubernetes"]
+        assert canonicalizer.canonicalize_all(skills) == ["docker", "javascript", "kubernetes"]
+
+    def test_canonical_ids_use_pool(self, canonicalizer):
+        """Test variants share one pooled id."""
+        assert canonicalizer.canonical_id("JS") == canonicalizer.canonical_id("javascript")
+        assert canonicalizer.pool.decode(canonicalizer.encode(["js", "Docker", "java script"])) == \
+            ["javascript", "docker"]
+        assert canonicalizer.canonical_id(" ") is None
+
+    def test_custom_aliases(self):
+        """Test user-supplied vocabulary and aliases."""
+        canonicalizer = SkillCanonicalizer(vocabulary=["bookkeeping"], aliases={"sap": ["sap erp"]},
+                                           pool=SkillPool())
+        canonicalizer.add_alias("book keeping", "bookkeeping")
+
+        assert canonicalizer.canonicalize("SAP ERP") == "sap"
+        assert canonicalizer.canonicalize("Book-Keeping") == "bookkeeping"
+        assert canonicalizer.canonicalize("JS") == "js"
+
+    def test_bulk_results_pass(self, canonicalizer):
+        """Test stored results can be canonicalized after the fact."""
+        results = [ResumeData("Ann", "a@example.com", ["JS", "javascript", "K8s"])]
+        canonical = list(canonicalizer.canonicalize_results(results))
+
+        assert canonical[0].skills == ["javascript", "kubernetes"]
+        assert canonical[0].email == "a@example.com"
+        assert results[0].skills == ["JS", "javascript", "K8s"]
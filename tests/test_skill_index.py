@@ -0,0 +1,134 @@
+"""Tests for the inverted skill index."""
+
+import random
+
+import pytest
+from resume_parser import ResumeData
+from resume_parser.services import skill_index
+from resume_parser.services.skill_index import SkillIndex
+
+
+class TestSkillIndex:
+    """Test cases for SkillIndex."""
+
+    @pytest.fixture
+    def index(self):
+        """Index over four small resumes."""
+        index = SkillIndex()
+        index.add(["Python", "AWS", "Docker"], key="ann.pdf")      # 0
+        index.add(["python", "aws", "php"], key="bob.pdf")         # 1
+        index.add(["Java", "GCP", "Machine  Learning"], key="cy.pdf")  # 2
+        index.add_result(ResumeData("Di", "", ["pytorch", "aws"]), key="di.pdf")  # 3
+        return index
+
+    def test_boolean_and_not(self, index):
+        """Test the canonical recruiter query."""
+        assert index.search("python AND aws AND NOT php") == [0]
+
+    def test_or_and_parentheses(self, index):
+        """Test OR and grouping."""
+        assert index.search("(java OR php) AND NOT docker") == [1, 2]
+        assert index.search("gcp OR docker") == [0, 2]
+
+    def test_implicit_and_and_case_insensitive_operators(self, index):
+        """Test adjacent terms are ANDed and operators are case-insensitive."""
+        assert index.search("python aws not php") == [0]
+
+    def test_leading_not_uses_all_documents(self, index):
+        """Test a pure negation returns every other document."""
+        assert index.search("NOT aws") == [2]
+
+    def test_prefix_queries(self, index):
+        """Test prefix terms and the prefix helper."""
+        assert index.search("py*") == [0, 1, 3]
+        assert index.prefix("PY") == [0, 1, 3]
+        assert index.search("py* AND NOT python") == [3]
+
+    def test_quoted_multiword_terms(self, index):
+        """Test quoted terms are normalized like indexed skills."""
+        assert index.search('"machine learning"') == [2]
+        assert index.all_of(["Machine Learning", "java"]) == [2]
+        assert index.any_of(["php", "gcp"]) == [1, 2]
+
+    def test_incremental_add_and_remove(self, index):
+        """Test new documents are queryable immediately and removed ones disappear."""
+        doc_id = index.add(["php", "python"], key="ed.pdf")
+        assert index.search("php") == [1, doc_id]
+
+        index.remove(1)
+        assert index.search("php") == [doc_id]
+        assert len(index) == 4
+        assert index.key(doc_id) == "ed.pdf"
+
+    def test_save_and_load_memory_mapped(self, index, tmp_path):
+        """Test a loaded index answers the same queries and accepts new documents."""
+        index.remove(3)
+        path = str(tmp_path / "skills.idx")
+        index.save(path)
+
+        loaded = SkillIndex.load(path)
+        assert loaded.search("python AND aws AND NOT php") == [0]
+        assert loaded.search("aws") == [0, 1]
+        assert loaded.key(2) == "cy.pdf"
+
+        doc_id = loaded.add(["aws"], key="new.pdf")
+        assert loaded.search("aws") == [0, 1, doc_id]
+
+    def test_save_over_loaded_file(self, index, tmp_path):
+        """Test saving back to the file an index was loaded from."""
+        path = str(tmp_path / "skills.idx")
+        index.save(path)
+        loaded = SkillIndex.load(path)
+        loaded.add(["rust"], key="new.pdf")
+        loaded.save(path)
+
+        assert loaded.search("aws") == [0, 1, 3]
+        reloaded = SkillIndex.load(path)
+        assert reloaded.search("rust") == [4]
+        assert reloaded.search("aws") == [0, 1, 3]
+
+    def test_invalid_queries_raise_error(self, index):
+        """Test malformed queries are rejected."""
+        for query in ["(python AND aws", "python AND", "python )"]:
+            with pytest.raises(ValueError):
+                index.search(query)
+
+    def test_load_rejects_other_files(self, tmp_path):
+        """Test loading a file that is not an index fails."""
+        path = tmp_path / "other.idx"
+        path.write_bytes(b"not an index at all")
+        with pytest.raises(ValueError, match="Not a skill index"):
+            SkillIndex.load(str(path))
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_queries_match_set_semantics_on_large_index(self, tmp_path, monkeypatch, use_numpy):
+        """Test merged posting lists agree with set algebra, including on memory-mapped lists."""
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(skill_index, "np", None)
+        rng = random.Random(7)
+        skills = ["python", "aws", "php", "go", "gcp"]
+        index = SkillIndex()
+        docs = []
+        for doc_id in range(2000):
+            # Skewed frequencies so both the walk-short and slice-long branches run
+            chosen = {s for i, s in enumerate(skills) if rng.random() < 0.6 / (i + 1)}
+            docs.append(chosen)
+            index.add(chosen)
+        for doc_id in range(0, 2000, 97):
+            index.remove(doc_id)
+        path = str(tmp_path / "skills.idx")
+        index.save(path)
+
+        def expected(predicate):
+            return [i for i, d in enumerate(docs) if i % 97 and predicate(d)]
+
+        for searched in (index, SkillIndex.load(path)):
+            assert searched.search("python AND aws") == expected(lambda d: {"python", "aws"} <= d)
+            assert searched.search("php OR gcp") == expected(lambda d: bool({"php", "gcp"} & d))
+            assert searched.search("python AND NOT go") == expected(lambda d: "python" in d and "go" not in d)
+            assert searched.search("gcp AND NOT python") == expected(lambda d: "gcp" in d and "python" not in d)
+            assert searched.search("NOT php") == expected(lambda d: "php" not in d)
+            assert searched.search("NOT python OR go") == expected(lambda d: "python" not in d or "go" in d)
+            assert searched.search("g*") == expected(lambda d: bool({"go", "gcp"} & d))
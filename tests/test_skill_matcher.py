@@ -0,0 +1,82 @@
+"""Tests for vectorized skill matching."""
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from resume_parser import ResumeData
+from resume_parser.services.skill_matcher import SkillMatcher
+
+
+class TestSkillMatcher:
+    """Test cases for SkillMatcher."""
+
+    @pytest.fixture
+    def matcher(self):
+        """Matcher over four resumes."""
+        results = [
+            ResumeData("Ann", "", ["Python", "AWS", "Docker"]),
+            ResumeData("Bob", "", ["python", "php"]),
+            ResumeData("Cy", "", ["java", "gcp", "docker", "kubernetes", "terraform", "go"]),
+            ResumeData("Di", "", None),
+        ]
+        return SkillMatcher.from_results(results, keys=["ann", "bob", "cy", "di"])
+
+    def test_overlap_ranking(self, matcher):
+        """Test resumes are ranked by number of matched skills."""
+        matches = matcher.top_k(["python", "aws", "docker"], k=3)
+
+        assert [m.key for m in matches] == ["ann", "bob", "cy"]
+        assert [m.score for m in matches] == [3.0, 1.0, 1.0]
+
+    def test_weighted_overlap(self, matcher):
+        """Test job skill weights are summed for matched skills."""
+        matches = matcher.top_k({"docker": 2.0, "php": 5.0}, k=2)
+        assert [(m.key, m.score) for m in matches] == [("bob", 5.0), ("ann", 2.0)]
+
+    def test_jaccard(self, matcher):
+        """Test Jaccard similarity on skill sets."""
+        matches = matcher.top_k(["python", "php"], method="jaccard")
+
+        assert matches[0].key == "bob"
+        assert matches[0].score == pytest.approx(1.0)
+        assert matches[1].score == pytest.approx(1 / 4)
+
+    def test_jaccard_counts_unknown_job_skills(self, matcher):
+        """Test job skills absent from every resume still enlarge the union."""
+        matches = matcher.top_k(["python", "cobol", "fortran"], method="jaccard")
+
+        assert matches[0].key == "bob"
+        assert matches[0].score == pytest.approx(1 / 4)
+        assert matches[1].score == pytest.approx(1 / 5)
+
+    def test_bm25_prefers_rare_skills_and_short_profiles(self, matcher):
+        """Test BM25 ranks the short profile with the matching skill first."""
+        matches = matcher.top_k(["docker"], method="bm25")
+        assert [m.key for m in matches] == ["ann", "cy"]
+        assert matches[0].score > matches[1].score > 0
+
+    def test_batch_matches_single_queries(self, matcher):
+        """Test batch scoring equals scoring each job separately."""
+        jobs = [["python"], ["docker", "gcp"], ["unknown skill"]]
+        batch = matcher.top_k_batch(jobs, k=2, method="bm25")
+
+        assert batch == [matcher.top_k(job, k=2, method="bm25") for job in jobs]
+        assert batch[2] == []
+
+    def test_top_k_is_partial(self, matcher):
+        """Test only k results are returned, best first."""
+        matches = matcher.top_k(["docker", "python"], k=1)
+        assert [m.key for m in matches] == ["ann"]
+
+    def test_incremental_add_rebuilds(self, matcher):
+        """Test resumes added after a query are included in the next one."""
+        matcher.top_k(["rust"])
+        matcher.add(["Rust"], key="ed")
+        assert [m.key for m in matcher.top_k(["rust"])] == ["ed"]
+
+    def test_invalid_method_raises_error(self, matcher):
+        """Test unknown scoring methods are rejected."""
+        with pytest.raises(ValueError, match="Unsupported method"):
+            matcher.top_k(["python"], method="cosine")
@@ -217,6 +217,41 @@ def test_very_long_skills_list(mock_model_class, mock_configure):
         assert "skill_0" in result
         assert "skill_99" in result
 
+@patch('google.generativeai.configure')
+@patch('google.generativeai.GenerativeModel')
+def test_canonicalizer_merges_aliases(mock_model_class, mock_configure):
+    """Test aliases collapse to one canonical skill when a canonicalizer is set."""
+    from resume_parser.extractors.skill_canonicalizer import SkillCanonicalizer
+    mock_response = Mock()
+    mock_response.text = '{"skills": ["JS", "javascript", "Java Script", "Python3", "python"]}'
+    
+    mock_model = Mock()
+    mock_model.generate_content.return_value = mock_response
+    mock_model_class.return_value = mock_model
+    
+    with patch.dict('os.environ', {'GEMINI_API_KEY': 'test_key'}):
+        extractor = SkillsExtractor(canonicalizer=SkillCanonicalizer())
+        result = extractor.extract("JS, JavaScript, Python 3")
+        
+        assert result == ["javascript", "python"]
+
+@patch('google.generativeai.configure')
+@patch('google.generativeai.GenerativeModel')
+def test_prompt_keeps_late_skills_section(mock_model_class, mock_configure):
+    """Test a skills section beyond the prompt cut-off is still sent."""
+    from resume_parser.models.document import Document
+    mock_model = Mock()
+    mock_model.generate_content.return_value = Mock(text='{"skills": ["rust"]}')
+    mock_model_class.return_value = mock_model
+    
+    text = Document("Jane Smith\nExperience\n" + "Built systems.\n" * 800 + "SKILLS\nRust, Erlang\n")
+    with patch.dict('os.environ', {'GEMINI_API_KEY': 'test_key'}):
+        SkillsExtractor().extract(text)
+    
+    prompt = mock_model.generate_content.call_args[0][0]
+    assert "Rust, Erlang" in prompt
+    assert prompt.count("Built systems.") < 800
+
 if __name__ == "__main__":
     test_successful_extraction()
     test_data_cleaning()
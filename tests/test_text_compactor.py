@@ -0,0 +1,109 @@
+"""Tests for prompt text compaction."""
+
+import pytest
+from resume_parser.preprocessing.text_compactor import TextCompactor, estimate_tokens, truncate_to_tokens
+
+
+class TestTextCompactor:
+    """Test cases for TextCompactor."""
+
+    @pytest.fixture
+    def compactor(self):
+        """Compactor without a token budget."""
+        return TextCompactor(max_tokens=None)
+
+    def test_collapses_whitespace(self, compactor):
+        """Test runs of spaces, tabs and blank lines are collapsed."""
+        result = compactor.compact("John   Doe\t\tEngineer\n\n\n\nSkills:   Python")
+        assert result.text == "John Doe Engineer\n\nSkills: Python"
+
+    def test_table_separators_replaced(self, compactor):
+        """Test Word table separators become plain commas."""
+        result = compactor.compact("Python | Java | Docker")
+        assert result.text == "Python, Java, Docker"
+
+    def test_repeated_page_boilerplate_removed(self, compactor):
+        """Test headers repeated on every page are kept only once and page numbers dropped."""
+        page = "John Doe - john@example.com\n{body}\nPage {n} of 3"
+        text = "\n\n".join(page.format(body=f"Body {n}", n=n) for n in range(1, 4))
+
+        result = compactor.compact(text)
+
+        assert result.text.count("John Doe - john@example.com") == 1
+        assert "Page" not in result.text
+        assert "Body 3" in result.text
+
+    def test_bare_numbers_are_kept(self, compactor):
+        """Test years and grades on their own line are content, not page numbers."""
+        text = "Acme Corp\n2019\nto\n2021\nGPA\n3.8\n4\nPage 2\n3 of 4\n2/4"
+        assert compactor.compact(text).text == "Acme Corp\n2019\nto\n2021\nGPA\n3.8\n4"
+
+    def test_no_budget_by_default(self):
+        """Test the default compactor never truncates, so trailing contact details survive."""
+        text = "\n".join(f"Project {i}: built a thing with many words" for i in range(500)) + "\njane@example.com"
+        result = TextCompactor().compact(text)
+
+        assert not result.truncated
+        assert result.text.endswith("jane@example.com")
+
+    def test_repeated_body_lines_are_kept(self, compactor):
+        """Test job titles, skills and dates repeated under different roles survive."""
+        text = ("Software Engineer\nAcme\n2019 - 2021\nPython\n\n"
+                "Software Engineer\nGlobex\n2019 - 2021\nPython")
+        assert compactor.compact(text).text == text
+
+    def test_form_feed_headers_removed_case_insensitively(self, compactor):
+        """Test a header at the top of each form-feed page is kept once, body repeats are not touched."""
+        text = ("Jane Roe\nSummary\nPython\nGo\nRust\nLast line\f"
+                "JANE ROE\nExperience\nPython\nGo\nRust\nDocker\nEnd")
+
+        result = compactor.compact(text)
+
+        assert result.text.casefold().count("jane roe") == 1
+        assert result.text.count("Python") == 2
+        assert result.text.count("Go") == 2
+        assert result.text.count("Rust") == 2
+
+    def test_truncates_to_token_budget_on_line_boundary(self):
+        """Test truncation keeps whole lines within the token budget."""
+        compactor = TextCompactor(max_tokens=5)
+        result = compactor.compact("first line\nsecond line\nthird line")
+
+        assert result.truncated
+        assert result.text == "first line"
+        assert result.compacted_tokens <= 5
+
+    def test_oversized_single_line_is_sliced(self):
+        """Test a single line longer than the budget is cut rather than dropped."""
+        result = TextCompactor(max_tokens=2).compact("A" * 100)
+        assert result.text == "A" * 8
+
+    def test_truncate_to_tokens(self):
+        """Test the prompt helper cuts on line boundaries and leaves short text as is."""
+        assert truncate_to_tokens("first line\nsecond line\nthird line", 5) == "first line"
+        assert truncate_to_tokens("A" * 100, 2) == "A" * 8
+        assert truncate_to_tokens("short", 5) == "short"
+
+    def test_reports_token_savings(self):
+        """Test calling the compactor records per-run and cumulative savings."""
+        compactor = TextCompactor()
+        text = "Header line\nSkills:    Python\nPage 1\n" * 50
+
+        result = compactor.compact(text)
+        compactor(text)
+
+        assert result.tokens_saved > 0
+        assert 0 < result.savings_ratio < 1
+        assert compactor.resumes == 1
+        assert compactor.total_original_tokens == estimate_tokens(text)
+        assert compactor.total_compacted_tokens == result.compacted_tokens
+
+    def test_empty_text(self, compactor):
+        """Test empty input is passed through."""
+        assert compactor("") == ""
+        assert compactor.compact(None).original_tokens == 0
+
+    def test_invalid_budget_raises_error(self):
+        """Test non-positive budgets are rejected."""
+        with pytest.raises(ValueError):
+            TextCompactor(max_tokens=0)
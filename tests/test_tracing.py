@@ -0,0 +1,141 @@
+"""Tests for span tracing and trace export."""
+
+import json
+import threading
+
+import pytest
+from unittest.mock import Mock, patch
+from resume_parser import ResumeParserFramework
+from resume_parser.services.tracing import Tracer, current_span, set_tracer, span
+
+
+class TestTracing:
+    """Test cases for Tracer and the span helper."""
+
+    @pytest.fixture
+    def tracer(self):
+        """Install a tracer for the duration of a test."""
+        tracer = Tracer()
+        set_tracer(tracer)
+        yield tracer
+        set_tracer(None)
+
+    def test_span_is_noop_without_tracer(self):
+        """Test spans cost nothing when tracing is off."""
+        with span("anything", size=1) as opened:
+            assert opened is None
+            assert current_span() is None
+
+    def test_nesting_and_attributes(self, tracer):
+        """Test child spans share the trace and point at their parent."""
+        with span("outer", file="a.pdf") as outer:
+            with span("inner") as inner:
+                inner.set_attribute("chars", 42)
+
+        spans = {s.name: s for s in tracer.spans()}
+        assert spans["inner"].parent_id == outer.span_id
+        assert spans["inner"].trace_id == outer.trace_id
+        assert spans["inner"].attributes == {"chars": 42}
+        assert spans["outer"].parent_id is None
+        assert spans["outer"].end_ns >= spans["inner"].end_ns
+
+    def test_explicit_parent_across_threads(self, tracer):
+        """Test work on another thread can be attached to a span explicitly."""
+        with span("request") as request:
+            def attempt():
+                with span("attempt", parent=request):
+                    pass
+            thread = threading.Thread(target=attempt)
+            thread.start()
+            thread.join()
+
+        attempt_span = next(s for s in tracer.spans() if s.name == "attempt")
+        assert attempt_span.parent_id == request.span_id
+        assert attempt_span.thread_id != request.thread_id
+
+    def test_errors_recorded(self, tracer):
+        """Test an exception marks the span and still propagates."""
+        with pytest.raises(ValueError):
+            with span("failing"):
+                raise ValueError("bad pdf")
+        assert tracer.spans()[0].error == "ValueError: bad pdf"
+
+    def test_chrome_export(self, tracer, tmp_path):
+        """Test the Chrome trace-event file has complete events and thread names."""
+        with span("parse_resume", file="a.pdf"):
+            pass
+        path = tmp_path / "trace.json"
+        tracer.export(str(path))
+
+        events = json.loads(path.read_text())["traceEvents"]
+        complete = [e for e in events if e["ph"] == "X"]
+        assert complete[0]["name"] == "parse_resume"
+        assert complete[0]["args"] == {"file": "a.pdf"}
+        assert complete[0]["dur"] >= 0
+        assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in events)
+
+    def test_otlp_export(self, tracer, tmp_path):
+        """Test the OTLP JSON layout and typed attributes."""
+        with span("outer"):
+            with span("inner", attempts=2, hedged=True, ratio=0.5, model="gemini-pro"):
+                pass
+        path = tmp_path / "trace.otlp.json"
+        tracer.export(str(path), format="otlp")
+
+        payload = json.loads(path.read_text())["resourceSpans"][0]
+        assert payload["resource"]["attributes"][0] == {"key": "service.name",
+                                                        "value": {"stringValue": "resume-parser"}}
+        spans = {s["name"]: s for s in payload["scopeSpans"][0]["spans"]}
+        assert spans["inner"]["parentSpanId"] == spans["outer"]["spanId"]
+        assert "parentSpanId" not in spans["outer"]
+        values = {a["key"]: a["value"] for a in spans["inner"]["attributes"]}
+        assert values["attempts"] == {"intValue": "2"}
+        assert values["hedged"] == {"boolValue": True}
+        assert values["ratio"] == {"doubleValue": 0.5}
+        assert spans["inner"]["status"] == {"code": 1}
+
+    def test_invalid_format_raises_error(self, tracer, tmp_path):
+        """Test unknown export formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported format"):
+            tracer.export(str(tmp_path / "trace"), format="zipkin")
+
+    def test_max_spans(self):
+        """Test spans beyond the cap are counted and dropped."""
+        tracer = Tracer(max_spans=2)
+        set_tracer(tracer)
+        try:
+            for _ in range(3):
+                with span("s"):
+                    pass
+        finally:
+            set_tracer(None)
+        assert len(tracer.spans()) == 2
+        assert tracer.dropped == 1
+
+    def test_framework_spans(self, tracer, mock_extractors):
+        """Test parse_resume produces parse and per-extractor child spans."""
+        parser = Mock(parse=Mock(return_value="resume text"))
+        ResumeParserFramework({".pdf": parser}, mock_extractors).parse_resume("resume.pdf")
+
+        spans = {s.name: s for s in tracer.spans()}
+        root = spans["parse_resume"]
+        assert root.attributes == {"file": "resume.pdf"}
+        for name in ("parse", "extract name", "extract email", "extract skills"):
+            assert spans[name].parent_id == root.span_id
+
+    @patch('google.generativeai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    def test_gemini_request_spans(self, mock_model_class, mock_configure, tracer):
+        """Test each Gemini request records prompt size and attempts."""
+        from resume_parser.extractors.name_extractor import NameExtractor
+        mock_model_class.return_value.generate_content.return_value = Mock(text='{"name": "John Doe"}')
+
+        with patch.dict('os.environ', {'GEMINI_API_KEY': 'test_key'}):
+            NameExtractor().extract("John Doe\nEngineer")
+
+        spans = {s.name: s for s in tracer.spans()}
+        request = spans["gemini.generate_content"]
+        assert request.attributes["field"] == "name"
+        assert request.attributes["prompt_chars"] > 0
+        assert request.attributes["attempts"] == 1
+        assert spans["gemini.attempt"].parent_id == request.span_id